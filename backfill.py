@@ -0,0 +1,53 @@
+import time
+import logging
+import argparse
+from src.core.config import config
+from src.core.teams import load_teams
+from src.services.sprint_history import SprintHistory, SprintBackfill
+
+
+def print_summary(history, teams):
+    print(f"\n{'team':<16} {'sprint':<28} {'end':<12} {'scope':>10} {'completed':>10} {'done %':>7} "
+          f"{'carried':>8} {'thr/day':>8}")
+    print("-" * 105)
+    for team in teams:
+        cols = history.for_team(team.name)
+        for i in range(len(cols["sprint_id"])):
+            scope = cols["scope_points"][i]
+            completed = cols["completed_points"][i]
+            pct = completed / scope * 100 if scope else 0
+            print(f"{team.name:<16} {str(cols['sprint_name'][i])[:28]:<28} {str(cols['end'][i]):<12} "
+                  f"{scope:>10.0f} {completed:>10.0f} {pct:>6.0f}% {cols['carried_over_issues'][i]:>8} "
+                  f"{cols['throughput_per_day'][i]:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill per-sprint velocity/throughput for every closed sprint.")
+    parser.add_argument("--team", action="append", help="Only these teams (repeatable; default: all in TEAMS_FILE)")
+    parser.add_argument("--out", default=config.SPRINT_HISTORY_PATH, help="History file (.npz), appended to if it exists")
+    parser.add_argument("--workers", type=int, default=None, help="Processes for the per-sprint analytics")
+    parser.add_argument("--full", action="store_true",
+                        help="Recompute every sprint of the selected teams; other teams' rows are kept")
+    parser.add_argument("--summary", action="store_true", help="Print the stored history after the backfill")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    teams = load_teams()
+    if args.team:
+        teams = [t for t in teams if t.name in args.team]
+        if not teams:
+            print(f"❌ No teams named {', '.join(args.team)}")
+            return
+
+    history = SprintHistory(args.out).load()
+
+    started = time.perf_counter()
+    rows = SprintBackfill(teams, history, workers=args.workers, full=args.full).run()
+    print(f"✅ {len(rows)} sprints written in {time.perf_counter() - started:.1f}s ({len(history)} stored in {args.out})")
+    if args.summary:
+        print_summary(history, teams)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import json
+import argparse
+from src.bench.runner import run_benchmarks, save_results, print_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end benchmarks against local fake Jira/Slack/Notion/Groq servers.")
+    parser.add_argument("-n", "--iterations", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Simulated upstream latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--page-size", type=int, default=50, help="Page size for Jira search and Notion queries")
+    parser.add_argument("--issues", type=int, default=120, help="Issues in the fake active sprint")
+    parser.add_argument("--only", nargs="*", help="Scenario name prefixes to run")
+    parser.add_argument("--replay", help="Replay a recorded cassette instead of the synthetic fakes")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="Scale recorded latencies when replaying")
+    parser.add_argument("--compare", help="Previous results JSON to diff against")
+    parser.add_argument("--out", default="bench_results", help="Directory for the results JSON")
+    args = parser.parse_args()
+
+    print("🚀 Starting fake upstreams and running benchmarks...")
+    results = run_benchmarks(
+        iterations=args.iterations,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_ratio=args.rate_limit_ratio,
+        page_size=args.page_size,
+        issue_count=args.issues,
+        only=args.only,
+        cassette_path=args.replay,
+        time_scale=args.time_scale,
+    )
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    print_results(results, baseline)
+    path = save_results(results, args.out)
+    print(f"\n✅ Results saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import os
+import sys
+import argparse
+import subprocess
+from src.bench.cassette import Cassette, start_proxies, replay_env
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Record real Jira/Slack/Notion/Groq/ntfy traffic to a cassette, or replay one offline.",
+        epilog="Example: python cassette.py record -o cassettes/velocity.jsonl.gz -- python test_velocity.py",
+    )
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    record = sub.add_parser("record", help="Run a command against the real upstreams and record the traffic")
+    record.add_argument("-o", "--out", required=True, help="Cassette file to write (.jsonl.gz)")
+    record.add_argument("command", nargs=argparse.REMAINDER)
+
+    replay = sub.add_parser("replay", help="Run a command against a recorded cassette")
+    replay.add_argument("cassette", help="Cassette file to replay")
+    replay.add_argument("--time-scale", type=float, default=1.0, help="Multiply recorded latencies (0 = instant)")
+    replay.add_argument("command", nargs=argparse.REMAINDER)
+
+    args = parser.parse_args()
+    command = [c for c in args.command if c != "--"] if args.command else []
+    if not command:
+        parser.error("missing command to run, e.g. -- python test_velocity.py")
+
+    if args.mode == "record":
+        os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+        cassette = Cassette(args.out).open_for_record()
+        proxies, env = start_proxies(cassette, mode="record")
+        print(f"🎙️ Recording {', '.join(proxies)} traffic to {args.out}")
+    else:
+        cassette = Cassette.load(args.cassette)
+        proxies, proxy_env = start_proxies(cassette, mode="replay", time_scale=args.time_scale)
+        env = replay_env(proxy_env)
+        print(f"▶️ Replaying {len(cassette.entries)} recorded calls (time scale {args.time_scale})")
+
+    try:
+        code = subprocess.call(command, env={**os.environ, **env})
+    finally:
+        for proxy in proxies.values():
+            proxy.stop()
+        cassette.close()
+
+    calls = sum(sum(p.calls.values()) for p in proxies.values())
+    misses = sum(p.misses for p in proxies.values())
+    print(f"✅ {calls} calls {'recorded' if args.mode == 'record' else 'replayed'}"
+          + (f", ⚠️ {misses} unmatched" if misses else ""))
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
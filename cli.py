@@ -19,6 +19,7 @@ def main():
         print("\nProcessing...\n" + "-"*30)
         try:
             current_version = agent.generate_ticket(user_input)
+            notes_history = []
             
             while True:
                 print(current_version)
@@ -27,13 +28,22 @@ def main():
                 choice = input("\nPost (y), Revise (r), or Cancel (n) > ").lower()
                 
                 if choice == 'y':
-                    print(agent.post_content(current_version))
+                    handle, result = agent.submit_content(current_version)
+                    if result.startswith("⚠️ Possible duplicate"):
+                        print(result)
+                        if input("\nCreate it anyway? (y/n) > ").lower() != 'y':
+                            break
+                        handle, result = agent.submit_content(current_version, force=True)
+                    print(result)
+                    if handle:
+                        print(agent.combined_result(agent.post_status(handle, wait=True)))
                     break
 
                 elif choice == 'r':
                     notes = input("What would you like to change? > ")
                     print("\nRevising...\n" + "-"*30)
-                    current_version = agent.generate_ticket(user_input, current_version, notes)
+                    current_version = agent.generate_ticket(user_input, current_version, notes, earlier_notes=notes_history)
+                    notes_history.append(notes)
                 else:
                     print("Skipped.")
                     break
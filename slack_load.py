@@ -0,0 +1,56 @@
+import os
+import json
+import argparse
+from src.bench.slack_load import run_slack_load, print_slack_results, parse_mix
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Throughput benchmark for the Slack responder: synthetic message events through Bolt's dispatch path.",
+        epilog="Example: python slack_load.py --events 2000 --rate 100 --latency-ms 50",
+    )
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--rate", type=float, default=0.0, help="Arrival rate in events/sec (0 = as fast as possible)")
+    parser.add_argument("--mix", help="Event kinds and weights, e.g. mention=0.6,dm=0.2,bot=0.1,plain=0.1")
+    parser.add_argument("--senders", type=int, default=8, help="Threads calling dispatch (like Socket Mode's workers)")
+    parser.add_argument("--listener-threads", type=int, default=10, help="Bolt listener pool size")
+    parser.add_argument("--inline", action="store_true", help="Run the handler inside dispatch (process_before_response)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Simulated Slack Web API / ntfy latency")
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--presence", choices=["away", "active"], default="away", help="'away' makes every mention reply")
+    parser.add_argument("--service", default="src.services.slack_service:SlackResponderService",
+                        help="Responder class to load as module:Class, to compare variants")
+    parser.add_argument("--compare", help="Previous results JSON to diff against")
+    parser.add_argument("--out", default="bench_results", help="Directory for the results JSON")
+    args = parser.parse_args()
+
+    print(f"🚀 Sending {args.events} synthetic Slack events to {args.service}...")
+    results = run_slack_load(
+        events=args.events,
+        rate=args.rate,
+        mix=parse_mix(args.mix) if args.mix else None,
+        senders=args.senders,
+        listener_threads=args.listener_threads,
+        inline=args.inline,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        presence=args.presence,
+        service=args.service,
+    )
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_slack_results(results, baseline)
+
+    os.makedirs(args.out, exist_ok=True)
+    stamp = results["timestamp"].replace(":", "").replace("-", "")
+    path = os.path.join(args.out, f"slack-load-{stamp}-{results.get('git_rev') or 'local'}.json")
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\n✅ Results saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
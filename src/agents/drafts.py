@@ -0,0 +1,260 @@
+import re
+import json
+from datetime import datetime
+
+ISSUE_TYPES = ("Task", "Bug", "Story", "Epic")
+
+# Stands in for the key of the Jira ticket created by the same plan; filled in once it exists
+JIRA_KEY_PLACEHOLDER = "{jira_key}"
+
+# platform -> {field: (required, allowed values or None)}
+SCHEMAS = {
+    "jira": {"summary": (True, None), "description": (True, None), "issue_type": (False, ISSUE_TYPES)},
+    "slack": {"channel": (True, None), "message": (True, None)},
+    "notion": {"task_category": (True, None), "description": (True, None), "date": (False, None), "blockers": (False, None)},
+}
+
+JSON_INSTRUCTIONS = (
+    "OUTPUT FORMAT: Reply with ONLY one JSON object (no prose, no backticks) in exactly one of these shapes:\n"
+    '{"platform": "jira", "issue_type": "Task|Bug|Story|Epic", "summary": "<one line>", '
+    '"description": "<markdown body following the ticket template, without the summary>"}\n'
+    '{"platform": "slack", "channel": "<#channel or @user>", "message": "<message body>"}\n'
+    '{"platform": "notion", "task_category": "<e.g. Development>", "date": "YYYY-MM-DD", '
+    '"description": "<work log>", "blockers": "<blockers or notes>"}\n'
+    "If the request targets several platforms (e.g. create a ticket, log the work and tell a channel), reply with "
+    '{"drafts": [<one object per platform, in the shapes above>]} instead. The Jira ticket does not exist yet, '
+    f"so refer to it as {JIRA_KEY_PLACEHOLDER} in the other drafts.\n"
+    "Use \\n for line breaks inside strings."
+)
+
+_PLATFORM_LINE = re.compile(r"^\*\*Platform\*\*:\s*(\w+)\s*$", re.IGNORECASE)
+
+
+class DraftError(ValueError):
+    """The model output (or edited text) does not match any platform schema."""
+
+
+class Draft:
+    platform = None
+
+    def to_json(self):
+        return json.dumps({"platform": self.platform, **self.fields()})
+
+    def fields(self):
+        raise NotImplementedError
+
+    def render(self):
+        raise NotImplementedError
+
+
+class JiraDraft(Draft):
+    platform = "jira"
+
+    def __init__(self, summary, description, issue_type="Task"):
+        self.summary = summary
+        self.description = description
+        self.issue_type = issue_type or "Task"
+
+    def fields(self):
+        return {"issue_type": self.issue_type, "summary": self.summary, "description": self.description}
+
+    def render(self):
+        return f"**Platform**: Jira\n**Issue Type**: {self.issue_type}\n**Summary**: {self.summary}\n\n{self.description}"
+
+
+class SlackDraft(Draft):
+    platform = "slack"
+
+    def __init__(self, channel, message):
+        self.channel = channel
+        self.message = message
+
+    def fields(self):
+        return {"channel": self.channel, "message": self.message}
+
+    def render(self):
+        return f"**Platform**: Slack\n**Channel**: {self.channel}\n**Message**:\n{self.message}"
+
+
+class NotionDraft(Draft):
+    platform = "notion"
+
+    def __init__(self, task_category, description, date=None, blockers=None):
+        self.task_category = task_category
+        self.description = description
+        self.date = date or datetime.now().strftime("%Y-%m-%d")
+        self.blockers = blockers or ""
+
+    def fields(self):
+        return {"task_category": self.task_category, "date": self.date,
+                "description": self.description, "blockers": self.blockers}
+
+    def render(self):
+        text = (f"**Platform**: Notion\n**Date**: {self.date}\n**Task Category**: {self.task_category}\n"
+                f"**Description**:\n{self.description}")
+        if self.blockers:
+            text += f"\n\n**Blockers/Notes**:\n{self.blockers}"
+        return text
+
+    def log_text(self):
+        """The body written to Notion (everything except the routing line)."""
+        return self.render().split("\n", 1)[1]
+
+
+DRAFT_TYPES = {"jira": JiraDraft, "slack": SlackDraft, "notion": NotionDraft}
+
+
+def validate(data):
+    """Checks a decoded object against its platform schema and builds the Draft."""
+    if not isinstance(data, dict):
+        raise DraftError("expected a JSON object")
+    platform = str(data.get("platform", "")).lower()
+    schema = SCHEMAS.get(platform)
+    if schema is None:
+        raise DraftError(f"'platform' must be one of {', '.join(SCHEMAS)}, got {data.get('platform')!r}")
+
+    values = {}
+    for field, (required, allowed) in schema.items():
+        value = data.get(field)
+        if value is None or (isinstance(value, str) and not value.strip()):
+            if required:
+                raise DraftError(f"missing required field '{field}' for {platform}")
+            continue
+        if not isinstance(value, str):
+            raise DraftError(f"field '{field}' must be a string")
+        value = value.strip()
+        if allowed:
+            match = next((a for a in allowed if a.lower() == value.lower()), None)
+            if match is None:
+                raise DraftError(f"field '{field}' must be one of {', '.join(allowed)}")
+            value = match
+        values[field] = value
+    return DRAFT_TYPES[platform](**values)
+
+
+def _decode(text):
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end <= start:
+        raise DraftError("no JSON object found in the reply")
+    try:
+        return json.loads(text[start:end + 1], strict=False)
+    except json.JSONDecodeError as e:
+        raise DraftError(f"invalid JSON: {e.msg} at position {e.pos}")
+
+
+def parse_draft(text):
+    """Single pass over the model output: slice the outermost {...}, decode it and validate it."""
+    return validate(_decode(text))
+
+
+def parse_drafts(text):
+    """Like parse_draft, but also accepts a multi-destination {"drafts": [...]} reply. Returns a list."""
+    data = _decode(text)
+    if isinstance(data, dict) and "drafts" in data:
+        if not isinstance(data["drafts"], list) or not data["drafts"]:
+            raise DraftError("'drafts' must be a non-empty list")
+        return [validate(item) for item in data["drafts"]]
+    return [validate(data)]
+
+
+def drafts_to_json(drafts):
+    if len(drafts) == 1:
+        return drafts[0].to_json()
+    return json.dumps({"drafts": [{"platform": d.platform, **d.fields()} for d in drafts]})
+
+
+def render_drafts(drafts):
+    return "\n\n".join(d.render() for d in drafts)
+
+
+def _header_value(line, name):
+    prefix = f"**{name}**"
+    if not line.startswith(prefix):
+        return None
+    return line[len(prefix):].lstrip(":").strip()
+
+
+def draft_from_text(text):
+    """Parses a rendered (possibly hand-edited) draft back into its typed form.
+
+    Returns None when the text has no '**Platform**:' line, i.e. it wasn't produced by render().
+    """
+    lines = text.strip().split("\n")
+    match = _PLATFORM_LINE.match(lines[0].strip()) if lines else None
+    if not match:
+        return None
+    platform = match.group(1).lower()
+    body = lines[1:]
+
+    if platform == "jira":
+        issue_type, summary, rest = "Task", "", []
+        for i, line in enumerate(body):
+            if _header_value(line, "Issue Type") is not None:
+                issue_type = _header_value(line, "Issue Type")
+            elif _header_value(line, "Summary") is not None:
+                summary = _header_value(line, "Summary")
+                rest = body[i + 1:]
+                break
+        return validate({"platform": "jira", "issue_type": issue_type, "summary": summary,
+                         "description": "\n".join(rest).strip()})
+
+    if platform == "slack":
+        channel, message = "", ""
+        for i, line in enumerate(body):
+            if _header_value(line, "Channel") is not None:
+                channel = _header_value(line, "Channel")
+            elif _header_value(line, "Message") is not None:
+                message = "\n".join(body[i + 1:]).strip()
+                break
+        return validate({"platform": "slack", "channel": channel, "message": message})
+
+    if platform == "notion":
+        values, section, sections = {}, None, {"description": [], "blockers": []}
+        for line in body:
+            if _header_value(line, "Date") is not None:
+                values["date"] = _header_value(line, "Date")
+            elif _header_value(line, "Task Category") is not None:
+                values["task_category"] = _header_value(line, "Task Category")
+            elif _header_value(line, "Description") is not None:
+                section = "description"
+            elif _header_value(line, "Blockers/Notes") is not None:
+                section = "blockers"
+            elif section:
+                sections[section].append(line)
+        return validate({"platform": "notion", **values,
+                         "description": "\n".join(sections["description"]).strip(),
+                         "blockers": "\n".join(sections["blockers"]).strip()})
+
+    raise DraftError(f"unknown platform '{platform}'")
+
+
+def drafts_from_text(text):
+    """Splits rendered text on its '**Platform**:' lines and parses each part.
+
+    Returns [] when the text doesn't start with a platform line (free-text content).
+    """
+    lines = text.strip().split("\n")
+    starts = [i for i, line in enumerate(lines) if _PLATFORM_LINE.match(line.strip())]
+    if not starts or starts[0] != 0:
+        return []
+    bounds = starts + [len(lines)]
+    return [draft_from_text("\n".join(lines[a:b])) for a, b in zip(bounds, bounds[1:])]
+
+
+def check_structure(drafts, expected=None):
+    """Template-level checks beyond the schema. Returns a problem description, or None if the drafts look right.
+
+    `expected` is the set of platforms the request targeted (None or empty to skip that check).
+    """
+    platforms = {d.platform for d in drafts}
+    if expected and platforms != set(expected):
+        return f"expected drafts for {', '.join(sorted(expected))}, got {', '.join(sorted(platforms))}"
+    for draft in drafts:
+        if isinstance(draft, SlackDraft) and not re.match(r"^[#@]?[\w.-]+$", draft.channel):
+            return f"'{draft.channel}' is not a channel or user"
+        if isinstance(draft, JiraDraft) and "**" not in draft.description and "###" not in draft.description:
+            return "the ticket description has no template sections"
+        if isinstance(draft, NotionDraft) and len(draft.description.split()) < 3:
+            return "the work log description is too short"
+    return None
@@ -1,89 +1,226 @@
 import os
 import re
+import threading
 from pathlib import Path
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from src.core.config import config
 from src.utils.logger import get_global_logger
+from src.utils.tracing import span, traced
 
 # Client imports
 from src.clients.jira import JiraClient
 from src.clients.slack import SlackClient
 from src.clients.notion import NotionClientWrapper
+from src.services.outbox import create_outbox
+from src.services.similarity_index import load_similarity_index
+from src.services.jira_keys import JiraKeyResolver
+from src.agents.drafts import (
+    Draft, DraftError, SlackDraft, NotionDraft, JSON_INSTRUCTIONS, JIRA_KEY_PLACEHOLDER,
+    parse_drafts, drafts_from_text, drafts_to_json, render_drafts, check_structure
+)
+from src.agents.models import ModelRouter, create_models
+from src.agents.skills import SkillsRegistry
+from src.agents.prompting import estimate_tokens, revision_request, usage_of
 
 # LangChain imports
-from langchain_groq import ChatGroq
 from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
 from langchain_core.messages import HumanMessage, AIMessage
 
 logger = get_global_logger()
 
 class JiraAgent:
-    def __init__(self):
-        # LLM Initialization
-        self.llm = ChatGroq(
-            model="llama-3.3-70b-versatile",
-            temperature=0,
-            groq_api_key=config.GROQ_API_KEY
-        )
+    def __init__(self, models=None):
+        # LLM Initialization: {"small": ..., "large": ...}; pass local stand-ins to run without Groq
+        self.router = ModelRouter(models or create_models())
+        self.llm = self.router.model("large")
         
-        # Skill loading - look for skills in the root directory relative to this file
+        # Skill loading - look for skills in the root directory relative to this file; edits are picked up live
         self.skills_path = Path(__file__).parent.parent.parent / "skills"
-        self.skills = self._load_skills()
+        self.skills_registry = SkillsRegistry(str(self.skills_path))
+        self._system_messages = {}
+        self.usage = Counter()
+        self.last_usage = Counter()
         
         # Compose Clients
         self.jira = JiraClient()
         self.slack = SlackClient()
         self.notion = NotionClientWrapper()
+        # Tells real issue keys apart from look-alikes such as UTF-8 before any transition is attempted
+        self.keys = JiraKeyResolver(self.jira)
 
-    def _load_skills(self):
-        """Loads all SKILL.md files from the skills directory."""
-        skills_content = ""
-        if not self.skills_path.exists():
-            return skills_content
-
-        for skill_dir in self.skills_path.iterdir():
-            if skill_dir.is_dir():
-                skill_file = skill_dir / "SKILL.md"
-                if skill_file.exists():
-                    with open(skill_file, "r") as f:
-                        skills_content += f"\n\n--- Skill: {skill_dir.name} ---\n"
-                        skills_content += f.read()
-        return skills_content
-
-    def generate_ticket(self, user_prompt: str, previous_version: str = None, revision_notes: str = None):
-        """Generates or revises a content block using the LLM."""
+        # Durable write outbox: post_content queues writes and returns immediately
+        self.outbox = create_outbox(self.execute_op).start() if config.OUTBOX_ENABLED else None
+
+        # Local near-duplicate index over open tickets; the worker keeps it synced
+        self.similar = load_similarity_index()
+        if not self.similar.keys and self.jira.client and self.jira.project_key:
+            threading.Thread(target=self.similar.sync, args=(self.jira, self.jira.project_key), daemon=True).start()
+
+    @property
+    def skills(self):
+        """Skills text for the system prompt (template-only renderings unless SKILLS_PROMPT_MODE=full)."""
+        return self.skills_registry.prompt_text()
+
+    @traced("agent.generate_ticket")
+    def generate_ticket(self, user_prompt: str, previous_version: str = None, revision_notes: str = None,
+                        earlier_notes: list = None):
+        """Generates or revises a content block using the LLM.
+
+        earlier_notes are the notes of previous revision rounds; only a bounded summary of them is sent.
+        """
         logger.add(f"Generating content for: {user_prompt[:50]}...")
-        
-        system_template = (
-            "You are an expert Project Manager and Multi-Tool Agent.\n\n"
-            "{skills_context}\n\n"
-            "CRITICAL: Identify the target platform (Jira, Slack, or Notion) and format accordingly.\n"
-            "FORMATTING RULES:\n"
-            "1. Headers: Use bold text (e.g., **Description**). No colons.\n"
-            "2. Lists: Use '1.' or '-'.\n"
-            "3. Spacing: Exactly one blank line between sections.\n"
-            "4. Column 0: All lines must start at the beginning.\n"
-            "5. NO preamble or backticks."
-        )
-        
-        system_msg = SystemMessagePromptTemplate.from_template(system_template).format(
-            skills_context=self.skills
-        )
-        
-        if previous_version and revision_notes:
-            messages = [
-                system_msg,
-                HumanMessage(content=user_prompt),
-                AIMessage(content=previous_version),
-                HumanMessage(content=f"Please revise based on these notes: {revision_notes}")
+        tier, intents = self.router.route(user_prompt, revision_notes)
+
+        if config.STRUCTURED_OUTPUT:
+            drafts, raw = self.generate_drafts(user_prompt, previous_version, revision_notes, earlier_notes, tier, intents)
+            if drafts is not None:
+                return render_drafts(drafts)
+            # The invalid reply is JSON-ish and can't be posted; ask the large model for a plain free-text draft
+            logger.add("⚠️ Structured output could not be repaired; generating a free-text draft instead.")
+            tier = "large"
+
+        messages = self._build_messages(self._system_message(), user_prompt, previous_version, revision_notes, earlier_notes)
+        if tier == "small":
+            content = self._post_process(self._invoke(messages, tier="small", revision=bool(previous_version)).content)
+            problem = self._check_free_text(content, intents)
+            if problem is None:
+                return content
+            logger.add(f"⬆️ Escalating to the large model: {problem}")
+        response = self._invoke(messages, revision=bool(previous_version))
+        with span("agent.post_process"):
+            return self._post_process(response.content)
+
+    def generate_drafts(self, user_prompt, previous_version=None, revision_notes=None, earlier_notes=None,
+                        tier="large", intents=None):
+        """Asks for JSON drafts (one per destination), validating them against the platform schemas.
+
+        With tier="small" the small model answers first; a reply that fails the schema or the template
+        checks is escalated to the large model. One repair round trip is attempted if the large model's
+        reply doesn't validate. Returns (drafts, raw_reply); drafts is None when the repaired reply is
+        still invalid.
+        """
+        if previous_version:
+            # Show the model its previous answer in the same JSON shape it is asked to produce
+            try:
+                previous = drafts_from_text(previous_version)
+                previous_version = drafts_to_json(previous) if previous else previous_version
+            except DraftError:
+                pass
+
+        messages = self._build_messages(self._system_message(structured=True), user_prompt, previous_version,
+                                        revision_notes, earlier_notes)
+        if tier == "small":
+            raw = self._invoke(messages, tier="small", revision=bool(previous_version), structured=True).content
+            try:
+                drafts = [self._clean_draft(d) for d in parse_drafts(raw)]
+                problem = check_structure(drafts, intents)
+            except DraftError as e:
+                problem = str(e)
+            if problem is None:
+                return drafts, raw
+            logger.add(f"⬆️ Escalating to the large model: {problem}")
+
+        raw = self._invoke(messages, revision=bool(previous_version), structured=True).content
+
+        try:
+            return [self._clean_draft(d) for d in parse_drafts(raw)], raw
+        except DraftError as e:
+            logger.add(f"🔧 Repairing invalid structured reply: {e}")
+            messages += [
+                AIMessage(content=raw),
+                HumanMessage(content=f"That reply was invalid ({e}). Reply with only the corrected JSON object."),
             ]
-        else:
-            messages = [
+
+        raw = self._invoke(messages, repair=True).content
+        try:
+            return [self._clean_draft(d) for d in parse_drafts(raw)], raw
+        except DraftError:
+            return None, raw
+
+    @staticmethod
+    def _check_free_text(content, intents):
+        """Template check for free-text replies from the small model. Returns a problem or None."""
+        if "slack" in intents and not (any(k in content for k in ["Channel", "Recipient"]) and "Message" in content):
+            return "no channel/message sections in the Slack reply"
+        if "notion" in intents and "Task Category" not in content:
+            return "no task category in the work log reply"
+        return None
+
+    def _invoke(self, messages, tier="large", **attrs):
+        """Calls the tier's LLM and records the call's token usage (self.last_usage, cumulative self.usage)."""
+        llm = self.router.model(tier)
+        model_name = getattr(llm, "model_name", type(llm).__name__)
+        estimate = sum(estimate_tokens(m.content) for m in messages)
+        with span("llm.invoke", model=model_name, tier=tier, estimated_input_tokens=estimate, **attrs) as s:
+            response = llm.invoke(messages)
+            usage = usage_of(response)
+            for key, value in usage.items():
+                s.set(key, value)
+        self.last_usage = usage
+        self.usage.update(usage)
+        self.usage["calls"] += 1
+        self.usage[f"{tier}_calls"] += 1
+        logger.add(f"🧮 LLM call ({model_name}): {usage['input_tokens']} in ({usage['cached_tokens']} cached), {usage['output_tokens']} out")
+        return response
+
+    def _system_message(self, structured=False):
+        """The system message, compiled once per skills digest so the prompt prefix stays byte-stable."""
+        key = (self.skills_registry.digest, structured)
+        if key not in self._system_messages:
+            if len(self._system_messages) >= 4:
+                # Skills changed since these were compiled
+                self._system_messages.clear()
+            system_template = (
+                "You are an expert Project Manager and Multi-Tool Agent.\n\n"
+                "{skills_context}\n\n"
+                "CRITICAL: Identify the target platform (Jira, Slack, or Notion) and format accordingly.\n"
+                "FORMATTING RULES:\n"
+                "1. Headers: Use bold text (e.g., **Description**). No colons.\n"
+                "2. Lists: Use '1.' or '-'.\n"
+                "3. Spacing: Exactly one blank line between sections.\n"
+                "4. Column 0: All lines must start at the beginning.\n"
+                "5. NO preamble or backticks."
+                "{output_format}"
+            )
+            self._system_messages[key] = SystemMessagePromptTemplate.from_template(system_template).format(
+                skills_context=self.skills,
+                output_format=f"\n\n{JSON_INSTRUCTIONS}" if structured else ""
+            )
+        return self._system_messages[key]
+
+    @staticmethod
+    def _build_messages(system_msg, user_prompt, previous_version=None, revision_notes=None, earlier_notes=None):
+        """System message and original prompt first (a stable prefix), then only the latest version and notes."""
+        if not (previous_version and revision_notes):
+            return [
                 system_msg,
                 HumanMessage(content=user_prompt)
             ]
-        
-        response = self.llm.invoke(messages)
-        return self._post_process(response.content)
+
+        fixed = estimate_tokens(system_msg.content) + estimate_tokens(user_prompt) + estimate_tokens(previous_version)
+        summary_budget = min(config.REVISION_SUMMARY_TOKENS,
+                             config.PROMPT_TOKEN_BUDGET - fixed - estimate_tokens(revision_notes))
+        if earlier_notes and summary_budget <= 0:
+            logger.add("⚠️ Prompt token budget reached; earlier revision notes were left out.")
+        return [
+            system_msg,
+            HumanMessage(content=user_prompt),
+            AIMessage(content=previous_version),
+            HumanMessage(content=revision_request(revision_notes, earlier_notes, summary_budget))
+        ]
+
+    @staticmethod
+    def _clean_text(text):
+        """Whitespace clean-up for structured fields: collapse blank runs and force column 0."""
+        text = re.sub(r'\n\s*\n+', '\n\n', text.strip())
+        return '\n'.join(line.lstrip() for line in text.split('\n')).strip()
+
+    def _clean_draft(self, draft):
+        for attr in ("description", "message", "blockers"):
+            if getattr(draft, attr, None):
+                setattr(draft, attr, self._clean_text(getattr(draft, attr)))
+        return draft
 
     def _post_process(self, content):
         """Cleans up the LLM output for consistent formatting."""
@@ -96,10 +233,143 @@ class JiraAgent:
         lines = [line.lstrip() for line in content.split('\n')]
         return '\n'.join(lines).strip()
 
-    def post_content(self, content, thread_ts=None):
+    @traced("agent.post_content")
+    def post_content(self, content, thread_ts=None, force=False):
         """Routes the content to the correct platform and triggers dependencies."""
+        return self.submit_content(content, thread_ts, force)[1]
+
+    def submit_content(self, content, thread_ts=None, force=False):
+        """Like post_content, but returns (handle, message).
+
+        With the outbox enabled the writes are queued and the handle of the batch is returned
+        immediately (poll `post_status(handle)`); otherwise they run inline and handle is None.
+        New Jira tickets that look like duplicates of an open one are held back unless force=True.
+        """
         logger.add("Routing content to target platform...")
-        
+
+        ops = self._plan_writes(content, thread_ts)
+        if isinstance(ops, str):
+            return None, ops
+
+        duplicate_note = ""
+        for op in ops:
+            if op["type"] != "create_issue":
+                continue
+            similar = self.find_similar(f"{op['args']['summary']}\n{op['args']['description']}")
+            if not similar:
+                continue
+            listing = ", ".join(f"{key} ({score:.2f})" for key, score in similar)
+            logger.add(f"🔎 Similar open tickets: {listing}")
+            if similar[0][1] >= config.DUPLICATE_BLOCK_THRESHOLD and not force:
+                return None, f"⚠️ Possible duplicate of {listing}. Nothing was created; post again with force to create it anyway."
+            duplicate_note = f"\n\n🔎 Similar open tickets: {listing}"
+
+        if self.outbox:
+            handle = self.outbox.enqueue(ops)
+            return handle, f"📨 Queued {len(ops)} write(s) (handle: {handle}). Results will appear in the activity log." + duplicate_note
+
+        return None, self._combine_results(self._execute_inline(ops)) + duplicate_note
+
+    def _execute_inline(self, ops):
+        """Runs ops without the outbox: independent ops concurrently, dependents once their op is done."""
+        results = [None] * len(ops)
+
+        def run(i):
+            op = ops[i]
+            dep = op.get("depends_on")
+            if dep is not None and results[dep].startswith("❌"):
+                res = f"❌ {op['type']} skipped: the write it depends on failed."
+            else:
+                res = self.execute_op({**op, "dependency_result": results[dep] if dep is not None else None})
+            logger.add(res)
+            results[i] = res
+
+        if len(ops) == 1:
+            run(0)
+            return results
+        first = [i for i, op in enumerate(ops) if op.get("depends_on") is None]
+        rest = [i for i, op in enumerate(ops) if op.get("depends_on") is not None]
+        with ThreadPoolExecutor(max_workers=len(ops)) as pool:
+            list(pool.map(run, first))
+            list(pool.map(run, rest))
+        return results
+
+    def find_similar(self, text, k=None):
+        """Open tickets similar to the text as (key, score) pairs, from the local index only."""
+        with span("agent.find_similar"):
+            self.similar.reload_if_changed()
+            matches = self.similar.query(text, k=k or config.SIMILARITY_TOP_K)
+        return [(key, score) for key, score in matches if score >= config.SIMILARITY_THRESHOLD]
+
+    def post_status(self, handle, wait=False, timeout=60):
+        """Status of a queued post: {"state", "results", "ops"}. With wait=True blocks until it settles."""
+        if not self.outbox:
+            return {"state": "unknown", "results": [], "ops": []}
+        if wait:
+            return self.outbox.wait(handle, timeout)
+        return self.outbox.status(handle)
+
+    def combined_result(self, status):
+        """The same single message post_content returns inline, built from a settled batch status."""
+        if not status["results"]:
+            return f"⏳ Still {status['state']}..."
+        return self._combine_results(status["results"])
+
+    @staticmethod
+    def _combine_results(results):
+        final_result = results[0]
+        if len(results) > 1:
+            final_result += "\n\n" + "\n".join(results[1:])
+        return final_result
+
+    def _ops_for_drafts(self, drafts, thread_ts=None):
+        """Ops for every destination; Jira creates come first so others can depend on the new key."""
+        drafts = sorted(drafts, key=lambda d: d.platform != "jira")
+        ops = []
+        create_index = None
+        for draft in drafts:
+            for op in self._ops_for_draft(draft, thread_ts):
+                if op["type"] == "create_issue" and create_index is None:
+                    create_index = len(ops)
+                elif create_index is not None and any(
+                    JIRA_KEY_PLACEHOLDER in v for v in op["args"].values() if isinstance(v, str)
+                ):
+                    op["depends_on"] = create_index
+                ops.append(op)
+        return ops
+
+    def _ops_for_draft(self, draft, thread_ts=None):
+        if isinstance(draft, SlackDraft):
+            return [{"type": "send_slack", "upstream": "slack",
+                     "args": {"channel": draft.channel.lstrip('#').strip(), "message": draft.message, "thread_ts": thread_ts}}]
+        if isinstance(draft, NotionDraft):
+            log_text = draft.log_text()
+            ops = [{"type": "log_work", "upstream": "notion", "args": {"category": draft.task_category, "description": log_text}}]
+            return ops + self._transition_ops(log_text)
+        return [{"type": "create_issue", "upstream": "jira",
+                 "args": {"summary": draft.summary, "description": draft.description, "issue_type": draft.issue_type}}]
+
+    def _transition_ops(self, log_text):
+        """'In Progress' transitions for the existing issues a work log mentions."""
+        with span("agent.resolve_keys"):
+            keys = self.keys.resolve(log_text)
+        return [{"type": "transition", "upstream": "jira", "args": {"key": key, "status": "In Progress"}} for key in keys]
+
+    def _plan_writes(self, content, thread_ts=None):
+        """Turns generated content into typed write ops, or returns an error message."""
+        # Structured drafts (or their rendered text) route on the typed objects
+        if isinstance(content, Draft):
+            return self._ops_for_drafts([content], thread_ts)
+        if isinstance(content, list):
+            return self._ops_for_drafts(content, thread_ts)
+        try:
+            drafts = drafts_from_text(content)
+        except DraftError as e:
+            return f"❌ Could not read the draft: {e}"
+        if drafts:
+            return self._ops_for_drafts(drafts, thread_ts)
+
+        # Free-text content: legacy keyword routing
         if any(x in content for x in ["Channel", "Recipient"]):
             # Slack Routing
             channel = None
@@ -115,30 +385,17 @@ class JiraAgent:
                     break
             
             if channel and message_body:
-                res = self.slack.send_message(channel, message_body, thread_ts=thread_ts)
-                logger.add(res)
-                return res
+                return [{"type": "send_slack", "upstream": "slack",
+                         "args": {"channel": channel, "message": message_body, "thread_ts": thread_ts}}]
             return "❌ Could not identify Slack channel or message body."
 
         elif "Task Category" in content:
             # Notion Routing
             cat = next((line.split('**')[-1].strip() for line in content.split('\n') if "Task Category" in line), "Development")
-            notion_result = self.notion.log_work(cat, content)
-            logger.add(notion_result)
+            ops = [{"type": "log_work", "upstream": "notion", "args": {"category": cat, "description": content}}]
             
             # Dependency Checker (Notion -> Jira)
-            jira_keys = re.findall(r'[A-Z][A-Z0-9]+-[0-9]+', content)
-            dependency_results = []
-            if jira_keys:
-                for key in set(jira_keys):
-                    res = self.jira.update_status_and_comment(key, "In Progress")
-                    dependency_results.append(res)
-                    logger.add(res)
-            
-            final_result = notion_result
-            if dependency_results:
-                final_result += "\n\n" + "\n".join(dependency_results)
-            return final_result
+            return ops + self._transition_ops(content)
 
         else:
             # Jira Routing
@@ -149,7 +406,43 @@ class JiraAgent:
                     summary = line.split(':', 1)[-1].strip() if ':' in line else (lines[i+1] if i+1 < len(lines) else "")
                     break
             summary = summary.replace('**', '').replace('#', '').strip() or "New Ticket"
-            res = self.jira.create_issue(summary, content)
-            logger.add(res)
-            return res
+            return [{"type": "create_issue", "upstream": "jira", "args": {"summary": summary, "description": content}}]
+
+    def execute_op(self, op):
+        """Performs one write op against its upstream and returns the client's result message."""
+        args = op["args"]
+        if op.get("depends_on") is not None:
+            args = self._fill_jira_key(args, op.get("dependency_result"))
+        retry = op.get("attempt", 1) > 1 and op.get("created_at")
+        if op["type"] == "send_slack":
+            # A timed-out post may still have landed; look for its metadata before posting again
+            if retry and self.slack.find_posted(args["channel"], op["idempotency_key"], op["created_at"],
+                                                thread_ts=args.get("thread_ts")):
+                return f"✅ Slack message already posted to {args['channel']}"
+            return self.slack.send_message(args["channel"], args["message"], thread_ts=args.get("thread_ts"),
+                                           dedupe_key=op.get("idempotency_key"))
+        if op["type"] == "log_work":
+            if retry and self.notion.find_logged(op["idempotency_key"]):
+                return f"✅ Work already logged in Notion under {args['category']}"
+            return self.notion.log_work(args["category"], args["description"], dedupe_key=op.get("idempotency_key"))
+        if op["type"] == "transition":
+            return self.jira.update_status_and_comment(args["key"], args.get("status", "In Progress"))
+        if op["type"] == "create_issue":
+            label = None
+            if op.get("idempotency_key"):
+                # Label the ticket so a retry after an ambiguous failure finds it instead of duplicating it
+                label = "outbox-" + op["idempotency_key"].replace(":", "-")
+                if op.get("attempt", 1) > 1:
+                    existing = self.jira.search_issues(f'labels = "{label}"', fields=["summary"])
+                    if existing:
+                        return f"✅ Success! Ticket created: {self.jira.url}/browse/{existing[0]['key']}"
+            return self.jira.create_issue(args["summary"], args["description"], issue_type=args.get("issue_type", "Task"),
+                                          labels=[label] if label else None)
+        return f"❌ Unknown write operation: {op['type']}"
 
+    @staticmethod
+    def _fill_jira_key(args, create_result):
+        """Replaces the key placeholder with the key from the create_issue result ('.../browse/KEY')."""
+        match = re.search(r'/browse/([A-Z][A-Z0-9]+-[0-9]+)', create_result or "")
+        key = match.group(1) if match else "the new ticket"
+        return {k: v.replace(JIRA_KEY_PLACEHOLDER, key) if isinstance(v, str) else v for k, v in args.items()}
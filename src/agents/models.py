@@ -0,0 +1,57 @@
+import re
+from src.core.config import config
+
+# Keyword hints for which destination(s) a request targets
+INTENT_KEYWORDS = {
+    "jira": re.compile(r"\b(ticket|bug|issue|story|epic|jira|feature request)\b", re.IGNORECASE),
+    "slack": re.compile(r"(\bslack\b|\btell\b|\bping\b|\bnotify\b|\bmessage\b|\bdm\b|(^|\s)[#@]\w)", re.IGNORECASE),
+    "notion": re.compile(r"\b(log|logged|work log|notion|worked on|today i)\b", re.IGNORECASE),
+}
+
+# Destinations simple enough for the small model; tickets always get the large one
+SIMPLE_INTENTS = {"slack", "notion"}
+
+
+def classify_intents(prompt):
+    """The set of destinations the prompt seems to target (may be empty)."""
+    return {name for name, pattern in INTENT_KEYWORDS.items() if pattern.search(prompt)}
+
+
+class ModelRouter:
+    """Picks a model tier per request: short single-destination Slack/Notion requests go to the small model.
+
+    `models` maps tier name ("small", "large") to any chat model with `invoke(messages)`, so tests can
+    plug in local stand-ins. Without a "small" model everything goes to "large".
+    """
+
+    def __init__(self, models, max_prompt_chars=None, enabled=None):
+        if "large" not in models:
+            raise ValueError("ModelRouter needs at least a 'large' model")
+        self.models = models
+        self.max_prompt_chars = max_prompt_chars if max_prompt_chars is not None else config.SMALL_MODEL_MAX_PROMPT_CHARS
+        self.enabled = config.MODEL_TIERING if enabled is None else enabled
+
+    def route(self, prompt, revision_notes=None):
+        """Returns (tier, expected_intents)."""
+        intents = classify_intents(prompt)
+        text_length = len(prompt) + len(revision_notes or "")
+        if (self.enabled and "small" in self.models and len(intents) == 1
+                and intents <= SIMPLE_INTENTS and text_length <= self.max_prompt_chars):
+            return "small", intents
+        return "large", intents
+
+    def model(self, tier):
+        return self.models[tier]
+
+
+def create_models():
+    """The default Groq model set (LLM_MODEL_LARGE / LLM_MODEL_SMALL)."""
+    from langchain_groq import ChatGroq
+
+    def groq(model):
+        return ChatGroq(model=model, temperature=0, groq_api_key=config.GROQ_API_KEY, base_url=config.GROQ_API_BASE)
+
+    models = {"large": groq(config.LLM_MODEL_LARGE)}
+    if config.LLM_MODEL_SMALL:
+        models["small"] = groq(config.LLM_MODEL_SMALL)
+    return models
@@ -0,0 +1,47 @@
+from collections import Counter
+
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token); good enough for budgeting."""
+    return (len(text) + 3) // 4
+
+
+def summarize_notes(notes, budget):
+    """Bounded summary of earlier revision notes: newest first kept, one line each, within `budget` tokens."""
+    lines = []
+    used = 0
+    for note in reversed(notes):
+        line = "- " + " ".join(note.split())
+        if len(line) > 200:
+            line = line[:197] + "..."
+        cost = estimate_tokens(line) + 1
+        if used + cost > budget:
+            break
+        lines.append(line)
+        used += cost
+    omitted = len(notes) - len(lines)
+    lines.reverse()
+    if omitted:
+        lines.insert(0, f"- ({omitted} older note(s) omitted)")
+    return "\n".join(lines)
+
+
+def revision_request(notes, earlier_notes=None, summary_budget=300):
+    """The final human turn of a revision: the new notes plus a compact reminder of the earlier ones."""
+    text = f"Please revise based on these notes: {notes}"
+    if earlier_notes and summary_budget > 0:
+        summary = summarize_notes(earlier_notes, summary_budget)
+        text = f"Earlier notes (already applied, keep them applied):\n{summary}\n\n{text}"
+    return text
+
+
+def usage_of(response):
+    """Token usage of a chat response as a Counter (input/output/cached tokens), if the provider reported it."""
+    usage = Counter()
+    meta = getattr(response, "usage_metadata", None) or {}
+    token_usage = (getattr(response, "response_metadata", None) or {}).get("token_usage") or {}
+    usage["input_tokens"] = meta.get("input_tokens") or token_usage.get("prompt_tokens") or 0
+    usage["output_tokens"] = meta.get("output_tokens") or token_usage.get("completion_tokens") or 0
+    details = meta.get("input_token_details") or token_usage.get("prompt_tokens_details") or {}
+    usage["cached_tokens"] = details.get("cache_read") or details.get("cached_tokens") or 0
+    return usage
@@ -0,0 +1,159 @@
+import os
+import re
+import time
+import hashlib
+import threading
+from src.core.config import config
+from src.utils.logger import get_global_logger
+
+logger = get_global_logger()
+
+_HEADING = re.compile(r"^(#{1,3})\s+(.*?)\s*$")
+_CODE_BLOCK = re.compile(r"```[\w-]*\n(.*?)```", re.DOTALL)
+
+# Sections that never help the model write content
+_SKIPPED = ("installation", "prerequisites", "references")
+
+
+class Skill:
+    """One parsed SKILL.md: title, overview, templates and examples."""
+
+    def __init__(self, name, text, mtime):
+        self.name = name
+        self.text = text
+        self.mtime = mtime
+        self.digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+        self.title = name
+        self.overview = ""
+        self.templates = []
+        self.examples = []
+        self._parse()
+
+    def _sections(self):
+        """(level, heading, body) for every heading; text before the first one has heading None."""
+        sections, heading, level, body = [], None, 0, []
+        in_code = False
+        for line in self.text.split("\n"):
+            if line.startswith("```"):
+                in_code = not in_code
+            match = None if in_code else _HEADING.match(line)
+            if match and not line.startswith("#" * 4):
+                sections.append((level, heading, "\n".join(body).strip()))
+                level, heading, body = len(match.group(1)), match.group(2), []
+            else:
+                body.append(line)
+        sections.append((level, heading, "\n".join(body).strip()))
+        return sections
+
+    def _parse(self):
+        overview = []
+        for level, heading, body in self._sections():
+            name = (heading or "").lower()
+            if level == 1:
+                self.title = heading
+                if body:
+                    overview.append(body)
+            elif heading is None:
+                continue
+            elif "template" in name:
+                self.templates.append(("", body))
+            elif "example" in name:
+                self.examples.append((heading, body))
+            elif "overview" in name:
+                overview.append(body)
+            elif any(skip in name for skip in _SKIPPED):
+                continue
+        self.overview = "\n\n".join(part for part in overview if part)
+
+        if not self.templates:
+            # Skills that only show worked examples: their output blocks are the templates
+            for heading, body in self.examples:
+                for block in _CODE_BLOCK.findall(body):
+                    label = re.sub(r"^example:\s*", "", heading, flags=re.IGNORECASE)
+                    self.templates.append((label, block.strip()))
+
+    def render(self, mode="templates"):
+        """Prompt text for this skill: "full" is the original file, "templates" only the title,
+        the first overview sentence and the templates."""
+        if mode == "full" or not self.templates:
+            return f"--- Skill: {self.name} ---\n{self.text}"
+        summary = self.overview.split("\n")[0]
+        summary = re.split(r"(?<=\.)\s", summary, maxsplit=1)[0]
+        parts = [f"--- Skill: {self.name} ---", f"# {self.title}", summary]
+        for label, template in self.templates:
+            parts.append(f"Template ({label}):\n{template}" if label else f"Template:\n{template}")
+        return "\n\n".join(part for part in parts if part)
+
+
+class SkillsRegistry:
+    """Parsed skills from `<path>/<skill>/SKILL.md`, reloaded when files change.
+
+    Changes are detected by polling mtimes, at most once per `poll_interval` seconds and only when
+    the skills are read, so idle processes do no work. Only changed files are re-parsed.
+    """
+
+    def __init__(self, path, mode=None, poll_interval=None):
+        self.path = path
+        self.mode = mode or config.SKILLS_PROMPT_MODE
+        self.poll_interval = poll_interval if poll_interval is not None else config.SKILLS_POLL_SECONDS
+        self.skills = {}
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._prompt = None
+        self.reload_if_changed(force=True)
+
+    def _skill_files(self):
+        if not os.path.isdir(self.path):
+            return {}
+        files = {}
+        for name in sorted(os.listdir(self.path)):
+            skill_file = os.path.join(self.path, name, "SKILL.md")
+            if os.path.isfile(skill_file):
+                files[name] = skill_file
+        return files
+
+    def reload_if_changed(self, force=False):
+        """Re-parses added or modified skills and drops deleted ones. Returns True if anything changed."""
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.poll_interval:
+            return False
+        with self._lock:
+            self._checked_at = now
+            files = self._skill_files()
+            changed = False
+            for name in list(self.skills):
+                if name not in files:
+                    del self.skills[name]
+                    logger.add(f"🧩 Skill removed: {name}")
+                    changed = True
+            for name, skill_file in files.items():
+                try:
+                    mtime = os.path.getmtime(skill_file)
+                    current = self.skills.get(name)
+                    if current and current.mtime == mtime:
+                        continue
+                    with open(skill_file, "r") as f:
+                        skill = Skill(name, f.read(), mtime)
+                except OSError as e:
+                    logger.add(f"⚠️ Could not read skill {name}: {e}")
+                    continue
+                if current is None or current.digest != skill.digest:
+                    changed = True
+                    if current is not None:
+                        logger.add(f"🧩 Skill reloaded: {name}")
+                self.skills[name] = skill
+            if changed:
+                self._prompt = None
+            return changed
+
+    @property
+    def digest(self):
+        self.reload_if_changed()
+        return hashlib.sha256("".join(self.skills[name].digest for name in sorted(self.skills)).encode()).hexdigest()[:16]
+
+    def prompt_text(self):
+        """All skills rendered for the system prompt, in name order."""
+        self.reload_if_changed()
+        if self._prompt is None:
+            self._prompt = "".join(f"\n\n{self.skills[name].render(self.mode)}" for name in sorted(self.skills))
+        return self._prompt
@@ -0,0 +1,285 @@
+import re
+import gzip
+import json
+import time
+import base64
+import hashlib
+import threading
+import urllib.error
+import urllib.request
+from collections import Counter, defaultdict, deque
+from urllib.parse import urlsplit, parse_qsl, urlencode
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.core.config import config
+
+REDACTED = "[REDACTED]"
+
+# Headers that must never reach a cassette file
+SECRET_HEADERS = {"authorization", "cookie", "set-cookie", "x-api-key", "proxy-authorization"}
+# JSON / form / query keys whose values are secrets
+SECRET_KEYS = re.compile(r"(token|secret|password|api[_-]?key|authorization)", re.IGNORECASE)
+# Bare secrets that can show up inside free text (Slack/Groq/Notion token formats)
+SECRET_VALUES = re.compile(r"(xox[abpr]-[A-Za-z0-9-]+|xapp-[A-Za-z0-9-]+|gsk_[A-Za-z0-9]+|secret_[A-Za-z0-9]+|ntn_[A-Za-z0-9]+)")
+
+# Hop-by-hop headers we don't forward or replay
+SKIP_HEADERS = {"host", "content-length", "connection", "transfer-encoding", "accept-encoding", "content-encoding", "keep-alive"}
+
+
+def _redact_value(value):
+    if isinstance(value, dict):
+        return {k: REDACTED if SECRET_KEYS.search(k) else _redact_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_redact_value(v) for v in value]
+    if isinstance(value, str):
+        return SECRET_VALUES.sub(REDACTED, value)
+    return value
+
+
+def redact_body(raw, content_type):
+    """Returns the body as text with secrets replaced, whatever its encoding."""
+    if not raw:
+        return ""
+    text = raw.decode("utf-8", errors="replace")
+    if "json" in content_type:
+        try:
+            return json.dumps(_redact_value(json.loads(text)), sort_keys=True)
+        except ValueError:
+            pass
+    if "x-www-form-urlencoded" in content_type:
+        pairs = [(k, REDACTED if SECRET_KEYS.search(k) else SECRET_VALUES.sub(REDACTED, v)) for k, v in parse_qsl(text)]
+        return urlencode(sorted(pairs))
+    return SECRET_VALUES.sub(REDACTED, text)
+
+
+def redact_query(query):
+    pairs = [(k, REDACTED if SECRET_KEYS.search(k) else v) for k, v in parse_qsl(query, keep_blank_values=True)]
+    return urlencode(sorted(pairs))
+
+
+def redact_headers(headers):
+    return {k: v for k, v in headers.items() if k.lower() not in SECRET_HEADERS and k.lower() not in SKIP_HEADERS}
+
+
+class Cassette:
+    """Gzip-compressed JSONL of request/response pairs, one file per recorded run."""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = []
+        self._file = None
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def open_for_record(self):
+        self._file = gzip.open(self.path, "wt", encoding="utf-8")
+        return self
+
+    def record(self, entry):
+        entry["offset_ms"] = round((time.perf_counter() - self._started) * 1000, 3)
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self.entries.append(entry)
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    @classmethod
+    def load(cls, path):
+        cassette = cls(path)
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            cassette.entries = [json.loads(line) for line in f if line.strip()]
+        return cassette
+
+
+def request_fingerprint(method, path, query, body):
+    digest = hashlib.sha1(body.encode("utf-8")).hexdigest()[:16] if body else ""
+    return f"{method} {path}?{query}#{digest}"
+
+
+class CassetteProxy:
+    """Local HTTP endpoint for one upstream that either records through to it or replays from a cassette.
+
+    Clients are pointed at the proxy through the same base-URL settings used for the fakes, so every
+    transport (atlassian/requests, slack_sdk/urllib, notion-client/httpx, groq/httpx) is covered.
+    """
+
+    def __init__(self, name, cassette, mode="replay", upstream_url=None, time_scale=1.0):
+        self.name = name
+        self.cassette = cassette
+        self.mode = mode
+        self.upstream_url = (upstream_url or "").rstrip("/")
+        self.time_scale = time_scale
+        self.misses = 0
+        self.calls = Counter()
+        self.throttled = Counter()
+        self._server = None
+        self._lock = threading.Lock()
+        self._exact = defaultdict(deque)
+        self._loose = defaultdict(deque)
+        if mode == "replay":
+            for entry in cassette.entries:
+                if entry["upstream"] != name:
+                    continue
+                self._exact[entry["fingerprint"]].append(entry)
+                self._loose[f"{entry['method']} {entry['path']}"].append(entry)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _dispatch(self):
+                proxy._handle(self)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+            def log_message(self, format, *args):
+                return
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def reset_counts(self):
+        with self._lock:
+            self.calls.clear()
+            self.throttled.clear()
+
+    def _handle(self, http):
+        parts = urlsplit(http.path)
+        length = int(http.headers.get("Content-Length") or 0)
+        raw = http.rfile.read(length) if length else b""
+        content_type = http.headers.get("Content-Type", "")
+        body = redact_body(raw, content_type)
+        query = redact_query(parts.query)
+        fingerprint = request_fingerprint(http.command, parts.path, query, body)
+
+        if self.mode == "record":
+            entry = self._forward(http, parts, raw)
+            entry.update({
+                "upstream": self.name, "method": http.command, "path": parts.path, "query": query,
+                "fingerprint": fingerprint, "request_body": body,
+            })
+            self.cassette.record(entry)
+            with self._lock:
+                self.calls[f"{http.command} {parts.path}"] += 1
+                if entry["status"] == 429:
+                    self.throttled[f"{http.command} {parts.path}"] += 1
+        else:
+            entry = self._lookup(fingerprint, http.command, parts.path)
+            if entry is None:
+                self._respond(http, 599, {}, json.dumps({"error": f"No cassette entry for {http.command} {parts.path}"}).encode())
+                return
+            time.sleep(entry["elapsed_ms"] * self.time_scale / 1000)
+
+        self._respond(http, entry["status"], entry["headers"], base64.b64decode(entry["response_body"]))
+
+    def _forward(self, http, parts, raw):
+        url = f"{self.upstream_url}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+        headers = {k: v for k, v in http.headers.items() if k.lower() not in SKIP_HEADERS}
+        request = urllib.request.Request(url, data=raw or None, headers=headers, method=http.command)
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=120) as res:
+                status, res_headers, payload = res.status, dict(res.headers), res.read()
+        except urllib.error.HTTPError as e:
+            status, res_headers, payload = e.code, dict(e.headers), e.read()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        content_type = res_headers.get("Content-Type", "")
+        if "json" in content_type or "text" in content_type:
+            payload = redact_body(payload, content_type).encode("utf-8")
+        return {
+            "status": status,
+            "headers": redact_headers(res_headers),
+            "response_body": base64.b64encode(payload).decode("ascii"),
+            "elapsed_ms": round(elapsed_ms, 3),
+        }
+
+    def _lookup(self, fingerprint, method, path):
+        """Exact match first; otherwise the next recorded call to the same endpoint (bodies with timestamps drift)."""
+        with self._lock:
+            for queue in (self._exact.get(fingerprint), self._loose.get(f"{method} {path}")):
+                if not queue:
+                    continue
+                while len(queue) > 1 and queue[0].get("_used"):
+                    queue.popleft()
+                entry = queue[0]
+                # The last recording of an endpoint keeps answering repeat calls
+                if len(queue) > 1:
+                    queue.popleft()
+                entry["_used"] = True
+                if entry["status"] == 429:
+                    self.throttled[f"{method} {path}"] += 1
+                self.calls[f"{method} {path}"] += 1
+                return entry
+            self.misses += 1
+            return None
+
+
+    @staticmethod
+    def _respond(http, status, headers, payload):
+        http.send_response(status)
+        for key, value in headers.items():
+            if key.lower() not in SKIP_HEADERS:
+                http.send_header(key, value)
+        http.send_header("Content-Length", str(len(payload)))
+        http.end_headers()
+        if payload:
+            http.wfile.write(payload)
+
+
+# Upstream name -> (env var holding its base URL, suffix the client expects after the base)
+UPSTREAMS = {
+    "jira": ("JIRA_URL", ""),
+    "slack": ("SLACK_API_URL", "/api/"),
+    "notion": ("NOTION_API_URL", ""),
+    "groq": ("GROQ_API_BASE", ""),
+    "ntfy": ("NTFY_URL", ""),
+}
+
+
+def _upstream_base(env_var):
+    base = (getattr(config, env_var, None) or "").rstrip("/")
+    # The Slack client's base URL includes the /api/ segment; the proxy forwards the full path
+    return base[:-len("/api")] if env_var == "SLACK_API_URL" and base.endswith("/api") else base
+
+
+def start_proxies(cassette, mode="replay", time_scale=1.0):
+    """Starts one proxy per upstream and returns (proxies, env pointing the clients at them)."""
+    proxies, env = {}, {}
+    for name, (env_var, suffix) in UPSTREAMS.items():
+        upstream = _upstream_base(env_var) if mode == "record" else None
+        if mode == "record" and not upstream:
+            continue
+        proxy = CassetteProxy(name, cassette, mode=mode, upstream_url=upstream, time_scale=time_scale).start()
+        proxies[name] = proxy
+        env[env_var] = proxy.url + suffix
+    return proxies, env
+
+
+def replay_env(proxies_env):
+    """Placeholder credentials so clients initialise in replay mode without real secrets."""
+    placeholders = {
+        "JIRA_EMAIL": "replay@example.com", "JIRA_API_TOKEN": "replay", "JIRA_PROJECT_KEY": "REPLAY",
+        "JIRA_BOARD_ID": "1", "SLACK_BOT_TOKEN": "xoxb-replay", "MY_SLACK_ID": "UREPLAY",
+        "NOTION_TOKEN": "secret_replay", "NOTION_DATABASE_ID": "replay-db", "GROQ_API_KEY": "gsk_replay",
+        "NTFY_TOPIC": "replay",
+    }
+    env = {k: (getattr(config, k, None) or v) for k, v in placeholders.items()}
+    env.update(proxies_env)
+    return env
@@ -0,0 +1,535 @@
+import re
+import json
+import time
+import random
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeUpstream:
+    """A local stand-in HTTP server for one upstream API.
+
+    Subclasses register routes as (method, regex, handler). Every request is counted per route,
+    delayed by `latency_ms` (+/- `jitter_ms`) and, with probability `rate_limit_ratio`,
+    rejected with a 429 and a Retry-After header.
+    """
+
+    name = "upstream"
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, rate_limit_ratio=0.0, retry_after=1, seed=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self.calls = Counter()
+        self.throttled = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._routes = []
+        self._server = None
+        self.register_routes()
+
+    # --- Route table ---
+    def route(self, method, pattern, handler):
+        self._routes.append((method, re.compile(pattern + "$"), handler))
+
+    def register_routes(self):
+        raise NotImplementedError
+
+    # --- Lifecycle ---
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _dispatch(self, method):
+                upstream._handle(self, method)
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def do_PUT(self):
+                self._dispatch("PUT")
+
+            def do_PATCH(self):
+                self._dispatch("PATCH")
+
+            def log_message(self, format, *args):
+                return
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def reset_counts(self):
+        with self._lock:
+            self.calls.clear()
+            self.throttled.clear()
+
+    # --- Request handling ---
+    def _delay(self):
+        if self.latency_ms or self.jitter_ms:
+            delay = self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms)
+            time.sleep(max(delay, 0) / 1000)
+
+    def _handle(self, http, method):
+        parsed = urlparse(http.path)
+        length = int(http.headers.get("Content-Length") or 0)
+        raw = http.rfile.read(length) if length else b""
+
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(parsed.path)
+            if route_method != method or not match:
+                continue
+            route_name = f"{method} {pattern.pattern[:-1]}"
+            with self._lock:
+                self.calls[route_name] += 1
+                throttle = self._random.random() < self.rate_limit_ratio
+                if throttle:
+                    self.throttled[route_name] += 1
+            self._delay()
+            if throttle:
+                self._send(http, 429, {"ok": False, "error": "ratelimited"}, {"Retry-After": str(self.retry_after)})
+                return
+            request = {
+                "path": parsed.path,
+                "query": {k: v[-1] for k, v in parse_qs(parsed.query).items()},
+                "headers": dict(http.headers),
+                "raw": raw,
+                "json": self._parse_body(raw, http.headers.get("Content-Type", "")),
+                "params": match.groupdict(),
+            }
+            status, body = handler(request)
+            self._send(http, status, body)
+            return
+
+        with self._lock:
+            self.calls[f"{method} <unmatched> {parsed.path}"] += 1
+        self._send(http, 404, {"error": f"No fake route for {method} {parsed.path}"})
+
+    @staticmethod
+    def _parse_body(raw, content_type):
+        if not raw:
+            return {}
+        if "json" in content_type:
+            try:
+                return json.loads(raw)
+            except ValueError:
+                return {}
+        if "x-www-form-urlencoded" in content_type:
+            return {k: v[-1] for k, v in parse_qs(raw.decode("utf-8")).items()}
+        return {}
+
+    @staticmethod
+    def _send(http, status, body, headers=None):
+        payload = b"" if body is None else json.dumps(body).encode("utf-8")
+        http.send_response(status)
+        if payload:
+            http.send_header("Content-Type", "application/json")
+        http.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            http.send_header(key, value)
+        http.end_headers()
+        if payload:
+            http.wfile.write(payload)
+
+
+def _jira_date(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+class FakeJira(FakeUpstream):
+    name = "jira"
+
+    STATUSES = ["BACKEND TODO", "BACKEND INPROGRESS", "BE PR REVIEW", "BACKEND DONE", "VERIFICATION", "PRODUCT", "DONE"]
+    ASSIGNEES = ["Alice Smith", "Bob Jones", "Carol White", "Dan Brown", "Taimoor"]
+
+    def __init__(self, project_key="BENCH", board_id=1, issue_count=120, page_size=50, sprint_day=5, **kwargs):
+        self.project_key = project_key
+        self.board_id = str(board_id)
+        self.page_size = page_size
+        self.created = []
+        super().__init__(**kwargs)
+
+        today = datetime.utcnow()
+        self.sprints = [
+            {"id": 10, "name": "BE Sprint 9", "state": "closed",
+             "startDate": _jira_date(today - timedelta(days=sprint_day + 14)),
+             "endDate": _jira_date(today - timedelta(days=sprint_day))},
+            {"id": 11, "name": "FE: Sprint 10", "state": "active",
+             "startDate": _jira_date(today - timedelta(days=sprint_day)),
+             "endDate": _jira_date(today + timedelta(days=3))},
+            {"id": 12, "name": "BE Sprint 10", "state": "active",
+             "startDate": _jira_date(today - timedelta(days=sprint_day)),
+             "endDate": _jira_date(today + timedelta(days=3))},
+        ]
+        self.issues = [self._make_issue(i) for i in range(1, issue_count + 1)]
+
+    def _make_issue(self, n):
+        rnd = self._random
+        summary = f"{'FE ' if n % 9 == 0 else ''}Implement backend change #{n}"
+        return {
+            "id": str(10000 + n),
+            "key": f"{self.project_key}-{n}",
+            "fields": {
+                "summary": summary,
+                "status": {"name": rnd.choice(self.STATUSES)},
+                "assignee": {"displayName": rnd.choice(self.ASSIGNEES)},
+                "customfield_10004": rnd.choice([None, 1, 2, 3, 5, 8]),
+                "customfield_11441": None,
+                # Every fifth issue was carried over from the closed sprint
+                "customfield_10020": [s for s in self.sprints if s["id"] == 12 or (s["id"] == 10 and n % 5 == 0)],
+                "description": f"Description for issue {n}",
+                "updated": (datetime.utcnow() - timedelta(hours=n)).strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+            },
+        }
+
+    def register_routes(self):
+        self.route("GET", r"/rest/api/[23]/myself", lambda r: (200, {"accountId": "bench", "displayName": "Bench"}))
+        self.route("GET", r"/rest/api/[23]/project/search", lambda r: (200, {
+            "startAt": 0, "maxResults": 50, "total": 1, "isLast": True, "values": [{"key": self.project_key}]}))
+        self.route("POST", r"/rest/api/[23]/issue", self._create_issue)
+        self.route("POST", r"/rest/api/[23]/issue/bulk", self._bulk_create)
+        self.route("GET", r"/rest/api/[23]/issue/(?P<key>[A-Z][A-Z0-9]*-\d+)", self._get_issue)
+        self.route("GET", r"/rest/api/[23]/issue/(?P<key>[^/]+)/changelog", self._changelog)
+        # Like Jira Cloud, only the token-paginated search exists; the old startAt search is gone
+        self.route("GET", r"/rest/api/[23]/search/jql", self._search)
+        self.route("POST", r"/rest/api/[23]/search/jql", self._search)
+        self.route("GET", r"/rest/api/[23]/search", self._removed_search)
+        self.route("POST", r"/rest/api/[23]/search", self._removed_search)
+        self.route("GET", r"/rest/api/[23]/issue/(?P<key>[^/]+)/transitions", self._transitions)
+        self.route("POST", r"/rest/api/[23]/issue/(?P<key>[^/]+)/transitions", lambda r: (204, None))
+        self.route("GET", r"/rest/agile/1.0/board/(?P<board>\d+)/sprint", self._sprints)
+
+    def _create_issue(self, request):
+        n = len(self.issues) + len(self.created) + 1
+        key = f"{self.project_key}-{n}"
+        self.created.append(key)
+        return 201, {"id": str(10000 + n), "key": key, "self": f"{self.url}/rest/api/2/issue/{key}"}
+
+    def _bulk_create(self, request):
+        updates = (request["json"] or {}).get("issueUpdates", [])
+        return 201, {"issues": [self._create_issue(request)[1] for _ in updates], "errors": []}
+
+    def _find(self, key):
+        return next((i for i in self.issues if i["key"] == key), None)
+
+    def _get_issue(self, request):
+        issue = self._find(request["params"]["key"])
+        if issue is None:
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+        return 200, issue
+
+    def _changelog(self, request):
+        issue = self._find(request["params"]["key"])
+        if issue is None:
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+        created = datetime.utcnow() - timedelta(days=4)
+        histories = [{
+            "id": f"{issue['id']}-1",
+            "created": _jira_date(created),
+            "items": [{"field": "status", "fromString": "BACKEND TODO", "toString": issue["fields"]["status"]["name"]}],
+        }]
+        return 200, {"startAt": 0, "maxResults": 100, "total": len(histories), "isLast": True, "values": histories}
+
+    def _filter(self, jql):
+        issues = self.issues
+        statuses = re.search(r"status\s+IN\s*\(([^)]*)\)", jql, re.IGNORECASE)
+        if statuses:
+            wanted = {s.strip().strip("'\"").upper() for s in statuses.group(1).split(",")}
+            issues = [i for i in issues if i["fields"]["status"]["name"] in wanted]
+        sprint = re.search(r"\bsprint\s*=\s*(\d+)", jql, re.IGNORECASE)
+        if sprint:
+            sprint_id = int(sprint.group(1))
+            issues = [i for i in issues if any(s["id"] == sprint_id for s in i["fields"]["customfield_10020"])]
+        excluded = re.search(r"status\s+NOT\s+IN\s*\(([^)]*)\)", jql, re.IGNORECASE)
+        if excluded:
+            unwanted = {s.strip().strip("'\"").upper() for s in excluded.group(1).split(",")}
+            issues = [i for i in issues if i["fields"]["status"]["name"] not in unwanted]
+        if re.search(r"assignee\s+IS\s+NOT\s+EMPTY", jql, re.IGNORECASE):
+            issues = [i for i in issues if i["fields"].get("assignee")]
+        for word in re.findall(r"summary\s*!~\s*['\"]([^'\"]+)['\"]", jql, re.IGNORECASE):
+            pattern = re.compile(rf"\b{re.escape(word)}\b", re.IGNORECASE)
+            issues = [i for i in issues if not pattern.search(i["fields"]["summary"])]
+        keys = re.search(r"\bkey\s+IN\s*\(([^)]*)\)", jql, re.IGNORECASE)
+        if keys:
+            wanted = {k.strip().strip("'\"") for k in keys.group(1).split(",")}
+            issues = [i for i in issues if i["key"] in wanted]
+        return issues
+
+    def _removed_search(self, request):
+        return 410, {"errorMessages": ["The requested API has been removed. Please migrate to the /rest/api/3/search/jql API."]}
+
+    def _search(self, request):
+        params = {**request["query"], **(request["json"] or {})}
+        # Like Jira, `key IN (...)` with a key that doesn't exist fails the whole query
+        keys = re.search(r"\bkey\s+IN\s*\(([^)]*)\)", params.get("jql", ""), re.IGNORECASE)
+        missing = [k.strip() for k in keys.group(1).split(",") if not self._find(k.strip())] if keys else []
+        if missing:
+            return 400, {"errorMessages": [f"An issue with key '{k}' does not exist for field 'key'." for k in missing]}
+        issues = self._filter(params.get("jql", ""))
+        page_size = min(int(params.get("maxResults", self.page_size)), self.page_size)
+        # Token pagination, no totals
+        start = int(params.get("nextPageToken") or 0)
+        page = issues[start:start + page_size]
+        is_last = start + page_size >= len(issues)
+        body = {"issues": page, "isLast": is_last}
+        if not is_last:
+            body["nextPageToken"] = str(start + page_size)
+        return 200, body
+
+    def _transitions(self, request):
+        return 200, {"transitions": [
+            {"id": "11", "name": "Backend Todo"},
+            {"id": "21", "name": "Backend InProgress"},
+            {"id": "31", "name": "Backend Done"},
+        ]}
+
+    def _sprints(self, request):
+        start = int(request["query"].get("startAt", 0))
+        states = set(filter(None, request["query"].get("state", "").split(",")))
+        sprints = [s for s in self.sprints if not states or s["state"] in states]
+        page = sprints[start:start + self.page_size]
+        return 200, {"startAt": start, "maxResults": self.page_size, "values": page,
+                     "isLast": start + self.page_size >= len(sprints)}
+
+
+class FakeSlack(FakeUpstream):
+    name = "slack"
+
+    def __init__(self, presence="away", **kwargs):
+        self.messages = []
+        self.channels = {}
+        self.presence = presence
+        super().__init__(**kwargs)
+
+    def register_routes(self):
+        self.route("POST", r"/api/auth\.test", lambda r: (200, {"ok": True, "user_id": "UBOT", "bot_id": "BBOT", "team_id": "T1"}))
+        self.route("POST", r"/api/chat\.postMessage", self._post_message)
+        self.route("POST", r"/api/users\.info", lambda r: (200, {"ok": True, "user": {"name": "bench", "real_name": "Bench User"}}))
+        self.route("POST", r"/api/conversations\.info", lambda r: (200, {"ok": True, "channel": {"name": "bench-channel"}}))
+        self.route("POST", r"/api/users\.getPresence", lambda r: (200, {"ok": True, "presence": self.presence}))
+        self.route("POST", r"/api/dnd\.info", lambda r: (200, {"ok": True, "snooze_enabled": False}))
+        self.route("POST", r"/api/conversations\.list", lambda r: (200, {
+            "ok": True, "channels": [{"id": cid, "name": name} for name, cid in self.channels.items()],
+            "response_metadata": {"next_cursor": ""}}))
+        self.route("POST", r"/api/conversations\.history", self._history)
+        self.route("POST", r"/api/conversations\.replies", self._history)
+
+    def _channel_id(self, channel):
+        """Posting to a name creates the channel; messages are stored under its ID like Slack does."""
+        if channel in self.channels.values():
+            return channel
+        return self.channels.setdefault(channel.lstrip("#"), f"C{len(self.channels) + 1:08d}")
+
+    def _post_message(self, request):
+        body = dict(request["json"], ts=f"{time.time():.6f}")
+        body["channel"] = self._channel_id(body.get("channel") or "general")
+        self.messages.append(body)
+        return 200, {"ok": True, "channel": body["channel"], "ts": body["ts"]}
+
+    def _history(self, request):
+        query = request["json"] or request["query"]
+        oldest = float(query.get("oldest") or 0)
+        found = [m for m in self.messages if m.get("channel") == query.get("channel") and float(m["ts"]) >= oldest
+                 and (m.get("thread_ts") == query["ts"] if "ts" in query else True)]
+        return 200, {"ok": True, "messages": found[::-1], "has_more": False}
+
+
+class FakeNotion(FakeUpstream):
+    name = "notion"
+
+    def __init__(self, log_count=30, page_size=100, **kwargs):
+        self.page_size = page_size
+        self.pages = []
+        super().__init__(**kwargs)
+        today = datetime.now()
+        for n in range(log_count):
+            self.pages.append(self._page(f"Work Log: Development #{n}", "Development",
+                                         (today - timedelta(days=n % 7)).strftime("%Y-%m-%d")))
+
+    @staticmethod
+    def _page(title, category, date, created=None, key=None):
+        return {
+            "object": "page",
+            "id": f"page-{title}",
+            "created_time": created or f"{date}T00:00:00.000Z",
+            "properties": {
+                "Name": {"title": [{"plain_text": title}]},
+                "Category": {"select": {"name": category}},
+                "Date": {"date": {"start": date}},
+                "Outbox Key": {"rich_text": [{"plain_text": key}] if key else []},
+            },
+        }
+
+    def register_routes(self):
+        self.route("GET", r"/v1/databases/(?P<db>[^/]+)", lambda r: (200, {
+            "object": "database", "id": r["params"]["db"],
+            "data_sources": [{"id": f"{r['params']['db']}-source", "name": "Work Log"}]}))
+        self.route("GET", r"/v1/data_sources/(?P<source>[^/]+)", lambda r: (200, {
+            "object": "data_source", "id": r["params"]["source"],
+            "properties": {name: {"name": name, "type": kind} for name, kind in (
+                ("Name", "title"), ("Category", "select"), ("Date", "date"), ("Outbox Key", "rich_text"))}}))
+        self.route("POST", r"/v1/data_sources/(?P<source>[^/]+)/query", self._query)
+        self.route("POST", r"/v1/pages", self._create_page)
+        self.route("GET", r"/v1/users/me", lambda r: (200, {"object": "user", "id": "bench-bot", "type": "bot", "name": "Bench"}))
+
+    @staticmethod
+    def _matches(page, condition):
+        if "and" in condition:
+            return all(FakeNotion._matches(page, c) for c in condition["and"])
+        if condition.get("timestamp") == "created_time":
+            return page["created_time"] >= condition["created_time"]["on_or_after"]
+        prop = page["properties"].get(condition.get("property"), {})
+        if "select" in condition:
+            return prop.get("select", {}).get("name") == condition["select"]["equals"]
+        if "date" in condition:
+            return prop.get("date", {}).get("start", "") >= condition["date"]["on_or_after"][:10]
+        if "rich_text" in condition:
+            return "".join(t["plain_text"] for t in prop.get("rich_text", [])) == condition["rich_text"]["equals"]
+        return True
+
+    def _query(self, request):
+        start = int(request["json"].get("start_cursor") or 0)
+        condition = request["json"].get("filter") or {}
+        pages = [p for p in self.pages if self._matches(p, condition)]
+        page = pages[start:start + self.page_size]
+        has_more = start + self.page_size < len(pages)
+        return 200, {"object": "list", "results": page, "has_more": has_more,
+                     "next_cursor": str(start + self.page_size) if has_more else None}
+
+    def _create_page(self, request):
+        props = request["json"].get("properties", {})
+        title = props.get("Name", {}).get("title", [{}])[0].get("text", {}).get("content", "")
+        category = props.get("Category", {}).get("select", {}).get("name", "Other")
+        key = "".join(t["text"]["content"] for t in props.get("Outbox Key", {}).get("rich_text", []))
+        now = datetime.now(timezone.utc)
+        self.pages.append(self._page(title, category, now.strftime("%Y-%m-%d"),
+                                     created=now.replace(second=0).isoformat(timespec="milliseconds"), key=key))
+        return 200, {"object": "page", "id": f"page-{len(self.pages)}"}
+
+
+class FakeGroq(FakeUpstream):
+    name = "groq"
+
+    JIRA_REPLY = (
+        "**Summary**: Fix login failure on iOS\n\n"
+        "**Description**\nUsers cannot sign in on iOS 17 after the latest release.\n\n"
+        "**Acceptance Criteria**\n- Login succeeds on iOS 17\n- Regression test added"
+    )
+    SLACK_REPLY = "**Channel**: #bench\n**Message**:\nDeployment finished successfully."
+    NOTION_REPLY = (
+        "**Date**: 2026-01-01\n**Task Category**: Development\n"
+        "**Description**:\nWorked on BENCH-1 and BENCH-2 (UTF-8 export fix, see BENCH-9999).\n\n**Blockers/Notes**:\nNone"
+    )
+    # Replies in the structured (JSON) output mode
+    JIRA_JSON = json.dumps({"platform": "jira", "issue_type": "Bug", "summary": "Fix login failure on iOS",
+                            "description": "**Description**\nUsers cannot sign in on iOS 17 after the latest release.\n\n"
+                                           "**Acceptance Criteria**\n- Login succeeds on iOS 17\n- Regression test added"})
+    SLACK_JSON = json.dumps({"platform": "slack", "channel": "#bench", "message": "Deployment finished successfully."})
+    NOTION_JSON = json.dumps({"platform": "notion", "task_category": "Development", "date": "2026-01-01",
+                              "description": "Worked on BENCH-1 and BENCH-2.", "blockers": "None"})
+    PLAN_JSON = json.dumps({"drafts": [
+        json.loads(JIRA_JSON),
+        {"platform": "notion", "task_category": "Development", "date": "2026-01-01",
+         "description": "Filed {jira_key} for the iOS login failure.", "blockers": "None"},
+        {"platform": "slack", "channel": "#bench", "message": "Filed {jira_key}: login fails on iOS 17."},
+    ]})
+
+    def __init__(self, reply=None, **kwargs):
+        self.reply = reply
+        super().__init__(**kwargs)
+
+    def register_routes(self):
+        self.route("POST", r"/openai/v1/chat/completions", self._complete)
+
+    def _choose_reply(self, messages):
+        if self.reply is not None:
+            return self.reply(messages) if callable(self.reply) else self.reply
+        prompt = str(messages[-1].get("content", "")).lower() if messages else ""
+        structured = bool(messages) and "OUTPUT FORMAT" in str(messages[0].get("content", ""))
+        if structured and ("tell" in prompt or "slack" in prompt) and ("bug" in prompt or "ticket" in prompt):
+            return self.PLAN_JSON
+        if "slack" in prompt or "tell" in prompt:
+            return self.SLACK_JSON if structured else self.SLACK_REPLY
+        if "log" in prompt:
+            return self.NOTION_JSON if structured else self.NOTION_REPLY
+        return self.JIRA_JSON if structured else self.JIRA_REPLY
+
+    def _complete(self, request):
+        body = request["json"]
+        messages = body.get("messages", [])
+        content = self._choose_reply(messages)
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in messages) // 4
+        completion_tokens = len(content) // 4
+        return 200, {
+            "id": f"chatcmpl-{time.time_ns()}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                      "total_tokens": prompt_tokens + completion_tokens},
+        }
+
+
+class FakeNtfy(FakeUpstream):
+    name = "ntfy"
+
+    def register_routes(self):
+        self.route("POST", r"/(?P<topic>[^/]+)", lambda r: (200, {"id": "ntfy", "event": "message"}))
+
+
+def start_fakes(latency_ms=0.0, jitter_ms=0.0, rate_limit_ratio=0.0, page_size=50, issue_count=120, seed=0):
+    """Starts one fake server per upstream and returns them keyed by name."""
+    common = {"latency_ms": latency_ms, "jitter_ms": jitter_ms, "rate_limit_ratio": rate_limit_ratio, "seed": seed}
+    fakes = {
+        "jira": FakeJira(issue_count=issue_count, page_size=page_size, **common),
+        "slack": FakeSlack(**common),
+        "notion": FakeNotion(page_size=page_size, **common),
+        "groq": FakeGroq(**common),
+        "ntfy": FakeNtfy(**common),
+    }
+    for fake in fakes.values():
+        fake.start()
+    return fakes
+
+
+def fake_env(fakes):
+    """Environment variables that point every client at the fakes."""
+    return {
+        "JIRA_URL": fakes["jira"].url,
+        "JIRA_EMAIL": "bench@example.com",
+        "JIRA_API_TOKEN": "bench-token",
+        "JIRA_PROJECT_KEY": fakes["jira"].project_key,
+        "JIRA_BOARD_ID": fakes["jira"].board_id,
+        "SLACK_BOT_TOKEN": "xoxb-bench",
+        "SLACK_API_URL": f"{fakes['slack'].url}/api/",
+        "MY_SLACK_ID": "UME",
+        "NOTION_TOKEN": "secret_bench",
+        "NOTION_DATABASE_ID": "bench-db",
+        "NOTION_API_URL": fakes["notion"].url,
+        "GROQ_API_KEY": "gsk_bench",
+        "GROQ_API_BASE": fakes["groq"].url,
+        "NTFY_TOPIC": "bench",
+        "NTFY_URL": fakes["ntfy"].url,
+    }
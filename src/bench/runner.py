@@ -0,0 +1,201 @@
+import os
+import json
+import math
+import time
+import tempfile
+import subprocess
+from datetime import datetime
+from src.bench.fakes import start_fakes, fake_env, FakeGroq
+from src.agents.drafts import parse_drafts, render_drafts
+from src.bench.cassette import Cassette, start_proxies, replay_env
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def apply_env(env):
+    """Points os.environ and the already-imported config at the fakes."""
+    os.environ.update(env)
+    from src.core.config import config
+    for key, value in env.items():
+        if hasattr(config, key):
+            setattr(config, key, value)
+
+
+class BenchContext:
+    """Lazily builds the services under test once the environment points at the fakes."""
+
+    def __init__(self):
+        from src.agents.jira_agent import JiraAgent
+        from src.services.velocity_service import VelocityService
+        from src.services.status_reminder_service import StatusReminderService
+        from src.services.report_service import ReportService
+
+        self.agent = JiraAgent()
+        self.velocity = VelocityService()
+        self.reminders = StatusReminderService()
+        self.report = ReportService()
+
+
+def post_and_drain(ctx, content):
+    """Posts and, when the outbox is on, waits for the queued writes so API calls stay attributed."""
+    handle, result = ctx.agent.submit_content(content)
+    if handle:
+        return ctx.agent.combined_result(ctx.agent.post_status(handle, wait=True))
+    return result
+
+
+SCENARIOS = {
+    "forecast_sprint": lambda ctx: ctx.velocity.forecast_sprint(),
+    "check_and_send_reminders": lambda ctx: ctx.reminders.check_and_send_reminders(),
+    "generate_weekly_report": lambda ctx: ctx.report.generate_weekly_report(),
+    "generate_ticket": lambda ctx: ctx.agent.generate_ticket("Create a bug for login failure on iOS"),
+    "post_content[jira]": lambda ctx: post_and_drain(ctx, FakeGroq.JIRA_REPLY),
+    "post_content[slack]": lambda ctx: post_and_drain(ctx, FakeGroq.SLACK_REPLY),
+    "post_content[notion]": lambda ctx: post_and_drain(ctx, FakeGroq.NOTION_REPLY),
+    "post_content[plan]": lambda ctx: post_and_drain(ctx, render_drafts(parse_drafts(FakeGroq.PLAN_JSON))),
+}
+
+# Upstreams each scenario must reach; a run that never calls one of them did not do its work
+EXPECTED_UPSTREAMS = {
+    "forecast_sprint": {"jira", "slack"},
+    "check_and_send_reminders": {"jira"},
+    "generate_weekly_report": {"notion", "groq"},
+    "generate_ticket": {"groq"},
+    "post_content[jira]": {"jira"},
+    "post_content[slack]": {"slack"},
+    "post_content[notion]": {"notion"},
+    "post_content[plan]": {"jira", "slack", "notion"},
+}
+
+
+def _call_counts(fakes):
+    return {name: sum(f.calls.values()) for name, f in fakes.items()}
+
+
+def check_run(name, result, before, after):
+    """Why a scenario run failed without raising ("❌" result, expected upstream never called), or None."""
+    if isinstance(result, str):
+        failed = [line for line in result.splitlines() if line.startswith("❌")]
+        if failed:
+            return failed[0]
+    missed = sorted(u for u in EXPECTED_UPSTREAMS.get(name, ()) if after.get(u, 0) == before.get(u, 0))
+    if missed:
+        return f"no calls reached {', '.join(missed)}"
+    return None
+
+
+def run_scenario(name, func, ctx, fakes, iterations, warmup=1):
+    for _ in range(warmup):
+        func(ctx)
+    for fake in fakes.values():
+        fake.reset_counts()
+
+    latencies = []
+    errors = 0
+    for _ in range(iterations):
+        before = _call_counts(fakes)
+        start = time.perf_counter()
+        try:
+            problem = check_run(name, func(ctx), before, _call_counts(fakes))
+        except Exception as e:
+            problem = str(e)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if problem:
+            errors += 1
+            print(f"❌ {name}: {problem}")
+
+    api_calls = {f.name: dict(f.calls) for f in fakes.values() if f.calls}
+    total_calls = sum(sum(calls.values()) for calls in api_calls.values())
+    throttled = sum(sum(f.throttled.values()) for f in fakes.values())
+    return {
+        "iterations": iterations,
+        "errors": errors,
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p90_ms": round(percentile(latencies, 90), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "max_ms": round(max(latencies), 3),
+        "api_calls_per_run": round(total_calls / iterations, 2),
+        "throttled": throttled,
+        "api_calls": api_calls,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return None
+
+
+def run_benchmarks(iterations=20, latency_ms=20.0, jitter_ms=5.0, rate_limit_ratio=0.0, page_size=50,
+                   issue_count=120, only=None, seed=0, cassette_path=None, time_scale=1.0):
+    if cassette_path:
+        # Replay a recorded production run instead of the synthetic fakes
+        fakes, proxy_env = start_proxies(Cassette.load(cassette_path), mode="replay", time_scale=time_scale)
+        env = replay_env(proxy_env)
+    else:
+        fakes = start_fakes(latency_ms=latency_ms, jitter_ms=jitter_ms, rate_limit_ratio=rate_limit_ratio,
+                            page_size=page_size, issue_count=issue_count, seed=seed)
+        env = fake_env(fakes)
+    try:
+        scratch = tempfile.mkdtemp(prefix="bench-")
+        env["ACTIVITY_LOG_PATH"] = os.path.join(scratch, "activity.db")
+        env["OUTBOX_PATH"] = os.path.join(scratch, "outbox.db")
+        env["SIMILARITY_INDEX_PATH"] = os.path.join(scratch, "similarity_index.npz")
+        env["BURNUP_DB_PATH"] = os.path.join(scratch, "burnup.db")
+        apply_env(env)
+        ctx = BenchContext()
+
+        results = {}
+        for name, func in SCENARIOS.items():
+            if only and not any(name.startswith(o) for o in only):
+                continue
+            print(f"⏱️ {name} ({iterations} runs)...")
+            results[name] = run_scenario(name, func, ctx, fakes, iterations)
+
+        return {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_rev": git_revision(),
+            "settings": {
+                "iterations": iterations, "latency_ms": latency_ms, "jitter_ms": jitter_ms,
+                "rate_limit_ratio": rate_limit_ratio, "page_size": page_size,
+                "issue_count": issue_count, "seed": seed,
+                "cassette": cassette_path, "time_scale": time_scale,
+            },
+            "scenarios": results,
+        }
+    finally:
+        for fake in fakes.values():
+            fake.stop()
+
+
+def save_results(results, directory="bench_results"):
+    os.makedirs(directory, exist_ok=True)
+    stamp = results["timestamp"].replace(":", "").replace("-", "")
+    path = os.path.join(directory, f"bench-{stamp}-{results.get('git_rev') or 'local'}.json")
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+    return path
+
+
+def print_results(results, baseline=None):
+    base = (baseline or {}).get("scenarios", {})
+    print(f"\n{'scenario':<28} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'calls/run':>10} {'errors':>7}")
+    print("-" * 78)
+    for name, r in results["scenarios"].items():
+        line = (f"{name:<28} {r['p50_ms']:>9.1f} {r['p90_ms']:>9.1f} {r['p99_ms']:>9.1f} "
+                f"{r['api_calls_per_run']:>10.1f} {r['errors']:>7}")
+        if name in base:
+            b = base[name]
+            delta = (r["p50_ms"] - b["p50_ms"]) / b["p50_ms"] * 100 if b["p50_ms"] else 0.0
+            calls = r["api_calls_per_run"] - b["api_calls_per_run"]
+            line += f"   p50 {delta:+.0f}%  calls {calls:+.1f}"
+        print(line)
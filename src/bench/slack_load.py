@@ -0,0 +1,205 @@
+import os
+import time
+import random
+import tempfile
+import importlib
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from slack_bolt.request import BoltRequest
+from src.bench.fakes import FakeSlack, FakeNtfy
+from src.bench.runner import percentile, apply_env, git_revision
+
+# Share of each synthetic event kind; override with --mix
+DEFAULT_MIX = {"mention": 0.45, "thread": 0.15, "dm": 0.15, "bot": 0.1, "plain": 0.15}
+
+# Set by the sending thread around dispatch() so the listener executor can tie handler runs to events
+_current = threading.local()
+
+
+def make_event(kind, n, my_id, rnd):
+    """An Events API envelope for one synthetic `message` event."""
+    ts = f"{time.time():.6f}"
+    user = f"U{rnd.randint(1, 50):04d}"
+    event = {"type": "message", "channel": f"C{rnd.randint(1, 20):04d}", "user": user, "ts": ts,
+             "text": f"<@{my_id}> can you take a look at PROP-{n}?"}
+    if kind == "thread":
+        event["thread_ts"] = f"{time.time() - rnd.randint(60, 3600):.6f}"
+    elif kind == "dm":
+        event["channel"] = f"D{rnd.randint(1, 20):04d}"
+        event["channel_type"] = "im"
+    elif kind == "bot":
+        event.update(subtype="bot_message", bot_id="BOTHER", text=f"Deploy finished, <@{my_id}> FYI")
+        event.pop("user")
+    elif kind == "plain":
+        event["text"] = f"Standup notes #{n}: nothing blocking"
+    return {"token": "bench", "team_id": "T1", "api_app_id": "A1", "type": "event_callback",
+            "event_id": f"Ev{n:08d}", "event_time": int(time.time()), "event": event}
+
+
+class TimedListenerExecutor(ThreadPoolExecutor):
+    """The Bolt listener pool, recording when each handler started and finished for the event being sent."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        record = getattr(_current, "record", None)
+
+        def timed():
+            if record is not None:
+                record["started"] = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                if record is not None:
+                    record["done"] = time.perf_counter()
+
+        return super().submit(timed)
+
+
+def load_service(spec):
+    """The responder class from "module:Class" (default SlackResponderService)."""
+    module, _, name = spec.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def parse_mix(text):
+    """"mention=0.5,dm=0.5" -> {"mention": 0.5, "dm": 0.5}"""
+    mix = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        kind, _, weight = part.partition("=")
+        if kind not in DEFAULT_MIX:
+            raise ValueError(f"Unknown event kind '{kind}' (choose from {', '.join(DEFAULT_MIX)})")
+        mix[kind] = float(weight or 1)
+    return mix
+
+
+def _stats(values):
+    return {"p50_ms": round(percentile(values, 50), 3), "p99_ms": round(percentile(values, 99), 3),
+            "max_ms": round(max(values), 3) if values else 0.0}
+
+
+def summarize(records, duration):
+    """Events/sec plus ack, queueing, handler and end-to-end latency percentiles (ms)."""
+    handled = [r for r in records if "done" in r]
+    ms = lambda a, b: [(r[b] - r[a]) * 1000 for r in handled]
+    summary = {
+        "events": len(records),
+        "handled": len(handled),
+        "ignored": len(records) - len(handled),
+        "errors": sum(1 for r in records if r.get("error")),
+        "duration_s": round(duration, 3),
+        "events_per_s": round(len(records) / duration, 2) if duration else 0.0,
+        "ack": _stats([r["ack_ms"] for r in records]),
+        # scheduled arrival -> handler start: sender backlog plus the wait for a free listener thread
+        "queue": _stats(ms("scheduled", "started")),
+        "handler": _stats(ms("started", "done")),
+        "end_to_end": _stats(ms("scheduled", "done")),
+    }
+    summary["by_kind"] = {}
+    for kind in sorted({r["kind"] for r in records}):
+        of_kind = [r for r in handled if r["kind"] == kind]
+        summary["by_kind"][kind] = {"events": sum(1 for r in records if r["kind"] == kind),
+                                    "handler": _stats([(r["done"] - r["started"]) * 1000 for r in of_kind])}
+    return summary
+
+
+def run_slack_load(events=500, rate=0.0, mix=None, senders=8, listener_threads=10, inline=False,
+                   latency_ms=20.0, jitter_ms=5.0, presence="away",
+                   service="src.services.slack_service:SlackResponderService", seed=0):
+    """Feeds synthetic message events into the responder's Bolt app and measures how it keeps up.
+
+    Events go through `app.dispatch()` exactly as Socket Mode delivers them; Web API and ntfy
+    calls are answered by local fakes after `latency_ms`. `rate` is the open-loop arrival rate in
+    events/sec (0 = as fast as the senders can dispatch). With `inline` the handler runs inside
+    dispatch (process_before_response) instead of on Bolt's listener pool.
+    """
+    fakes = {"slack": FakeSlack(presence=presence, latency_ms=latency_ms, jitter_ms=jitter_ms, seed=seed),
+             "ntfy": FakeNtfy(latency_ms=latency_ms, jitter_ms=jitter_ms, seed=seed)}
+    for fake in fakes.values():
+        fake.start()
+    executor = None
+    try:
+        scratch = tempfile.mkdtemp(prefix="slack-load-")
+        apply_env({
+            "SLACK_BOT_TOKEN": "xoxb-bench",
+            "SLACK_API_URL": f"{fakes['slack'].url}/api/",
+            "MY_SLACK_ID": "UME",
+            "NTFY_TOPIC": "bench",
+            "NTFY_URL": fakes["ntfy"].url,
+            "ACTIVITY_LOG_PATH": os.path.join(scratch, "activity.db"),
+        })
+        if inline:
+            options = {"process_before_response": True}
+        else:
+            executor = TimedListenerExecutor(max_workers=listener_threads, thread_name_prefix="bolt-listener")
+            options = {"listener_executor": executor}
+        app = load_service(service)(**options).app
+
+        rnd = random.Random(seed)
+        mix = mix or DEFAULT_MIX
+        kinds = rnd.choices(list(mix), weights=list(mix.values()), k=events)
+        bodies = [make_event(kind, n, "UME", rnd) for n, kind in enumerate(kinds)]
+        # Warm up auth.test and the client connection pool outside the measurement
+        app.dispatch(BoltRequest(body=make_event("plain", -1, "UME", rnd), mode="socket_mode"))
+        for fake in fakes.values():
+            fake.reset_counts()
+
+        records = [{"kind": kind} for kind in kinds]
+        start = time.perf_counter()
+
+        def send(i):
+            record = records[i]
+            record["scheduled"] = start + (i / rate if rate > 0 else 0.0)
+            delay = record["scheduled"] - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            _current.record = record
+            sent = time.perf_counter()
+            try:
+                response = app.dispatch(BoltRequest(body=bodies[i], mode="socket_mode"))
+                record["error"] = response.status >= 400
+            except Exception:
+                record["error"] = True
+            finally:
+                _current.record = None
+            record["ack_ms"] = (time.perf_counter() - sent) * 1000
+            if inline:
+                record["started"], record["done"] = sent, time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=senders, thread_name_prefix="slack-load") as pool:
+            list(pool.map(send, range(events)))
+        if executor:
+            executor.shutdown(wait=True)
+        duration = time.perf_counter() - start
+
+        return {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_rev": git_revision(),
+            "settings": {"events": events, "rate": rate, "mix": mix, "senders": senders,
+                         "listener_threads": listener_threads, "inline": inline, "latency_ms": latency_ms,
+                         "jitter_ms": jitter_ms, "presence": presence, "service": service, "seed": seed},
+            **summarize(records, duration),
+            "api_calls": {f.name: dict(f.calls) for f in fakes.values() if f.calls},
+        }
+    finally:
+        if executor:
+            executor.shutdown(wait=False)
+        for fake in fakes.values():
+            fake.stop()
+
+
+def print_slack_results(results, baseline=None):
+    print(f"\n{results['events']} events ({results['handled']} handled, {results['ignored']} ignored, "
+          f"{results['errors']} errors) in {results['duration_s']:.2f}s -> {results['events_per_s']:.1f} events/s")
+    print(f"\n{'latency':<14} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    print("-" * 44)
+    for name in ("ack", "queue", "handler", "end_to_end"):
+        s = results[name]
+        change = ""
+        if baseline and baseline.get(name, {}).get("p99_ms"):
+            change = f"  (p99 {(s['p99_ms'] / baseline[name]['p99_ms'] - 1) * 100:+.0f}%)"
+        print(f"{name:<14} {s['p50_ms']:>9.1f} {s['p99_ms']:>9.1f} {s['max_ms']:>9.1f}{change}")
+    print(f"\n{'kind':<10} {'events':>7} {'handler p50':>12} {'handler p99':>12}")
+    for kind, s in results["by_kind"].items():
+        print(f"{kind:<10} {s['events']:>7} {s['handler']['p50_ms']:>12.1f} {s['handler']['p99_ms']:>12.1f}")
+    if baseline:
+        print(f"\nThroughput vs baseline: {baseline['events_per_s']:.1f} -> {results['events_per_s']:.1f} events/s")
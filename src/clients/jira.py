@@ -1,14 +1,54 @@
 import os
+import re
 import requests
 from requests.auth import HTTPBasicAuth
 from atlassian import Jira
+from src.utils.tracing import trace_methods
+from src.utils.rate_limit import RateLimiter
+from src.core.filters import SprintFilter
 
+
+class JiraSearchError(Exception):
+    """A JQL search failed; raised by AsyncJiraClient.search_issues instead of returning a partial result."""
+
+
+def pick_transition(transitions, status_name="In Progress"):
+    """The (id, name) of the transition matching status_name (or our In Progress variants), else (None, "")."""
+    target_names = [
+        status_name.lower(),
+        "backend inprogress",
+        "backend in progress",
+        "backend started",
+        "in progress"
+    ]
+    for t in transitions:
+        name = str(t.get("name", "")).lower()
+        if name in target_names:
+            return t.get("id"), t.get("name")
+    return None, ""
+
+
+def latest_active_sprint(sprints, exclude_terms=("FE:", "FE ", "FRONTEND")):
+    """The most recently created active sprint whose name has none of exclude_terms, or None."""
+    # Skip FE sprints
+    active_sprints = [s for s in SprintFilter(exclude_terms).apply(sprints) if s.get("state") == "active"]
+
+    if not active_sprints:
+        return None
+
+    # Pick the sprint with the highest ID (the most recently created active one)
+    return max(active_sprints, key=lambda x: x.get("id", 0))
+
+
+@trace_methods("jira")
 class JiraClient:
     def __init__(self):
         self.url = os.getenv("JIRA_URL")
         self.email = os.getenv("JIRA_EMAIL")
         self.token = os.getenv("JIRA_API_TOKEN")
         self.project_key = os.getenv("JIRA_PROJECT_KEY")
+        # Shared by every caller of this client (e.g. all teams in a fan-out run)
+        self.limiter = RateLimiter(float(os.getenv("JIRA_RATE_LIMIT", 10)))
         self.client = None
 
         if self.url and self.email and self.token:
@@ -24,7 +64,18 @@ class JiraClient:
             except Exception as e:
                 print(f"❌ Jira Connection Error: {e}")
 
-    def create_issue(self, summary, description, issue_type="Task"):
+    def ping(self):
+        """One cheap authenticated call; returns a status message."""
+        if not self.client:
+            return "❌ Jira client not initialized."
+        try:
+            self.limiter.acquire()
+            me = self.client.myself()
+            return f"✅ Connected as {me.get('displayName', me.get('accountId', '?'))}"
+        except Exception as e:
+            return f"❌ Jira unreachable: {e}"
+
+    def create_issue(self, summary, description, issue_type="Task", labels=None):
         if not self.client:
             return "❌ Jira client not initialized."
         
@@ -38,6 +89,9 @@ class JiraClient:
                 'description': description,
                 'issuetype': {'name': issue_type},
             }
+            if labels:
+                fields['labels'] = labels
+            self.limiter.acquire()
             new_issue = self.client.issue_create(fields=fields)
             return f"✅ Success! Ticket created: {self.url}/browse/{new_issue['key']}"
         except Exception as e:
@@ -54,28 +108,14 @@ class JiraClient:
         try:
             # 1. Get Transitions
             url = f"{self.url.rstrip('/')}/rest/api/3/issue/{issue_key}/transitions"
+            self.limiter.acquire()
             response = requests.get(url, auth=auth, headers=headers)
             
             if response.status_code != 200:
                 return f"❌ Jira API Error: {response.status_code} - {response.text}"
             
             transitions = response.json().get("transitions", [])
-            target_names = [
-                status_name.lower(), 
-                "backend inprogress", 
-                "backend in progress", 
-                "backend started",
-                "in progress"
-            ]
-            
-            transition_id = None
-            found_name = ""
-            for t in transitions:
-                name = str(t.get("name", "")).lower()
-                if name in target_names:
-                    transition_id = t.get("id")
-                    found_name = t.get("name")
-                    break
+            transition_id, found_name = pick_transition(transitions, status_name)
             
             if not transition_id:
                 avail = [t.get("name") for t in transitions]
@@ -83,6 +123,7 @@ class JiraClient:
 
             # 2. Perform Transition
             payload = {"transition": {"id": transition_id}}
+            self.limiter.acquire()
             post_res = requests.post(url, json=payload, auth=auth, headers=headers)
             
             if post_res.status_code == 204:
@@ -93,23 +134,80 @@ class JiraClient:
         except Exception as e:
             return f"❌ System Error updating Jira: {str(e)}"
 
-    def search_issues(self, jql):
-        """Search for issues using JQL."""
+    def search_issues(self, jql, fields=None, page_size=100):
+        """Search for issues using JQL, following pagination. `fields` limits the returned fields."""
         if not self.client:
             return []
+        fields = ",".join(fields) if fields else "*all"
+        issues = []
         try:
-            results = self.client.jql(jql)
-            return results.get("issues", [])
+            if self.client.cloud:
+                # Jira Cloud only offers token-paginated search (/rest/api/3/search/jql)
+                token = None
+                while True:
+                    self.limiter.acquire()
+                    results = self.client.enhanced_jql(jql, fields=fields, nextPageToken=token, limit=page_size)
+                    page = results.get("issues", [])
+                    issues.extend(page)
+                    token = results.get("nextPageToken")
+                    if not page or not token or results.get("isLast"):
+                        return issues
+            while True:
+                self.limiter.acquire()
+                results = self.client.jql(jql, fields=fields, start=len(issues), limit=page_size)
+                page = results.get("issues", [])
+                issues.extend(page)
+                if not page or len(issues) >= results.get("total", 0):
+                    return issues
         except Exception as e:
             print(f"❌ Jira Search Error: {e}")
-            return []
+            return issues
 
-    def get_active_sprint(self, board_id):
+    def get_project_keys(self):
+        """Keys of every project visible to the API user, or None if they can't be listed."""
+        if not self.client:
+            return None
+        try:
+            self.limiter.acquire()
+            return {p["key"] for p in self.client.projects() if p.get("key")}
+        except Exception as e:
+            print(f"❌ Jira Project Fetch Error: {e}")
+            return None
+
+    def existing_keys(self, issue_keys):
+        """The subset of issue_keys that exist, from one `key IN (...)` search, or None on failure.
+
+        Jira rejects the whole query when one of the keys doesn't exist, naming it in the error, so
+        those keys are dropped and the search repeated with the rest.
+        """
+        keys = sorted(set(issue_keys))
+        if not self.client or not keys:
+            return set()
+        while keys:
+            jql = f"key IN ({', '.join(keys)})"
+            try:
+                self.limiter.acquire()
+                if self.client.cloud:
+                    results = self.client.enhanced_jql(jql, fields="status", limit=len(keys))
+                else:
+                    results = self.client.jql(jql, fields="status", limit=len(keys))
+                return {issue["key"] for issue in results.get("issues", [])}
+            except Exception as e:
+                missing = set(re.findall(r"'([A-Z][A-Z0-9]+-\d+)'", str(e))) & set(keys)
+                if not missing:
+                    print(f"❌ Jira Key Lookup Error: {e}")
+                    return None
+                keys = [k for k in keys if k not in missing]
+        return set()
+
+    def get_active_sprint(self, board_id, exclude_terms=("FE:", "FE ", "FRONTEND")):
         """Fetches the latest active sprint for a given board ID, ignoring FE sprints."""
         if not self.client or not board_id:
             return None
         try:
-            response = self.client.get_all_sprints_from_board(board_id)
+            self.limiter.acquire()
+            # Only active sprints cross the wire; name exclusions are applied locally
+            response = self.client.get_all_sprints_from_board(board_id, state="active")
             # Handle both list and dict response formats
             sprints = response.get("values", []) if isinstance(response, dict) else response
             
@@ -117,22 +215,8 @@ class JiraClient:
                 print(f"⚠️ Unexpected Jira response format: {type(response)}")
                 return None
 
-            active_sprints = []
-            for sprint in sprints:
-                if isinstance(sprint, dict) and sprint.get("state") == "active":
-                    name = sprint.get("name", "").upper()
-                    # Skip if it's an FE sprint
-                    if "FE:" in name or "FE " in name or "FRONTEND" in name:
-                        continue
-                    active_sprints.append(sprint)
-            
-            if not active_sprints:
-                return None
-            
-            # Pick the sprint with the highest ID (the most recently created active one)
-            latest_sprint = max(active_sprints, key=lambda x: x.get("id", 0))
-            return latest_sprint
-            
+            return latest_active_sprint(sprints, exclude_terms)
+
         except Exception as e:
             print(f"❌ Jira Sprint Fetch Error: {e}")
             return None
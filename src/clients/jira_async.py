@@ -0,0 +1,248 @@
+import os
+import asyncio
+import httpx
+from src.utils.tracing import trace_methods
+from src.utils.rate_limit import AsyncRateLimiter
+from src.clients.jira import pick_transition, latest_active_sprint, JiraSearchError
+
+
+@trace_methods("jira_async")
+class AsyncJiraClient:
+    """asyncio Jira client for bulk work: many searches, transitions and changelog fetches at once.
+
+    Calls go through one pooled HTTP client, a semaphore (JIRA_MAX_CONCURRENCY requests in flight)
+    and the same JIRA_RATE_LIMIT token bucket as JiraClient, and 429s are retried after Retry-After.
+    Methods return what the matching JiraClient methods return (lists, dicts or status strings).
+
+        async with AsyncJiraClient() as jira:
+            results = await jira.transition_issues(keys)
+    """
+
+    def __init__(self, max_concurrency=None):
+        self.url = (os.getenv("JIRA_URL") or "").rstrip("/")
+        self.email = os.getenv("JIRA_EMAIL")
+        self.token = os.getenv("JIRA_API_TOKEN")
+        self.project_key = os.getenv("JIRA_PROJECT_KEY")
+        self.limiter = AsyncRateLimiter(float(os.getenv("JIRA_RATE_LIMIT", 10)))
+        self.max_concurrency = max_concurrency or int(os.getenv("JIRA_MAX_CONCURRENCY", 20))
+        self._semaphore = None
+        self._http = None
+
+    @property
+    def configured(self):
+        return bool(self.url and self.email and self.token)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def _client(self):
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.url,
+                auth=(self.email, self.token),
+                headers={"Accept": "application/json"},
+                limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency),
+                timeout=30,
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._http
+
+    async def _request(self, method, path, retries=3, **kwargs):
+        """One API call under the semaphore and rate limiter; 429s are retried."""
+        client = self._client()
+        for attempt in range(retries + 1):
+            async with self._semaphore:
+                await self.limiter.acquire()
+                response = await client.request(method, path, **kwargs)
+            if response.status_code != 429 or attempt == retries:
+                return response
+            await asyncio.sleep(float(response.headers.get("Retry-After", 2 ** attempt)))
+
+    # --- Issues ---
+    async def search_issues(self, jql, fields=None, page_size=100):
+        """Search for issues using JQL, following Cloud's token pagination (/rest/api/3/search/jql).
+
+        Pages come one after another: each nextPageToken is only known once the previous page arrives,
+        so concurrency comes from running several searches at once. Raises JiraSearchError on failure
+        rather than returning a partial or empty result that looks like a real one.
+        """
+        if not self.configured:
+            raise JiraSearchError("Jira credentials missing.")
+        params = {"jql": jql, "fields": ",".join(fields) if fields else "*all", "maxResults": page_size}
+        issues = []
+        token = None
+        try:
+            while True:
+                response = await self._request("GET", "/rest/api/3/search/jql",
+                                               params={**params, "nextPageToken": token} if token else params)
+                response.raise_for_status()
+                body = response.json()
+                page = body.get("issues", [])
+                issues.extend(page)
+                token = body.get("nextPageToken")
+                if not page or not token or body.get("isLast"):
+                    return issues
+        except Exception as e:
+            raise JiraSearchError(f"Jira search failed after {len(issues)} issues ({jql}): {e}") from e
+
+    async def get_issue(self, issue_key, fields=None):
+        if not self.configured:
+            return None
+        params = {"fields": ",".join(fields)} if fields else None
+        try:
+            response = await self._request("GET", f"/rest/api/2/issue/{issue_key}", params=params)
+            if response.status_code != 200:
+                return None
+            return response.json()
+        except Exception as e:
+            print(f"❌ Jira Issue Fetch Error ({issue_key}): {e}")
+            return None
+
+    async def get_issues(self, issue_keys, fields=None):
+        """{key: issue or None} for every key, fetched concurrently."""
+        issues = await asyncio.gather(*(self.get_issue(key, fields) for key in issue_keys))
+        return dict(zip(issue_keys, issues))
+
+    async def create_issue(self, summary, description, issue_type="Task", labels=None):
+        if not self.configured:
+            return "❌ Jira client not initialized."
+        if not self.project_key:
+            return "❌ No Jira project key provided (JIRA_PROJECT_KEY)"
+        try:
+            response = await self._request("POST", "/rest/api/2/issue",
+                                           json={"fields": self._issue_fields(summary, description, issue_type, labels)})
+            if response.status_code not in (200, 201):
+                return f"❌ Failed to create Jira ticket: {response.status_code} - {response.text}"
+            return f"✅ Success! Ticket created: {self.url}/browse/{response.json()['key']}"
+        except Exception as e:
+            return f"❌ Failed to create Jira ticket: {str(e)}"
+
+    async def bulk_create(self, issues, chunk_size=50):
+        """Creates many issues ([{"summary", "description", "issue_type"?, "labels"?}]) through the bulk
+        endpoint, chunks in parallel. Returns one create_issue-style message per input issue, in order."""
+        if not self.configured:
+            return ["❌ Jira client not initialized."] * len(issues)
+        if not self.project_key:
+            return ["❌ No Jira project key provided (JIRA_PROJECT_KEY)"] * len(issues)
+
+        async def create_chunk(chunk):
+            updates = [{"fields": self._issue_fields(i["summary"], i["description"], i.get("issue_type", "Task"),
+                                                     i.get("labels"))} for i in chunk]
+            try:
+                response = await self._request("POST", "/rest/api/2/issue/bulk", json={"issueUpdates": updates})
+                body = response.json() if response.content else {}
+            except Exception as e:
+                return [f"❌ Failed to create Jira ticket: {str(e)}"] * len(chunk)
+            results = [f"❌ Failed to create Jira ticket: {response.status_code} - {response.text}"] * len(chunk)
+            created = iter(body.get("issues", []))
+            failed = {err.get("failedElementNumber"): err for err in body.get("errors", [])}
+            for n in range(len(chunk)):
+                if n in failed:
+                    results[n] = f"❌ Failed to create Jira ticket: {failed[n].get('elementErrors', {})}"
+                else:
+                    issue = next(created, None)
+                    if issue:
+                        results[n] = f"✅ Success! Ticket created: {self.url}/browse/{issue['key']}"
+            return results
+
+        chunks = [issues[i:i + chunk_size] for i in range(0, len(issues), chunk_size)]
+        return [result for chunk in await asyncio.gather(*(create_chunk(c) for c in chunks)) for result in chunk]
+
+    def _issue_fields(self, summary, description, issue_type="Task", labels=None):
+        fields = {
+            'project': {'key': self.project_key},
+            'summary': summary,
+            'description': description,
+            'issuetype': {'name': issue_type},
+        }
+        if labels:
+            fields['labels'] = labels
+        return fields
+
+    # --- Transitions ---
+    async def update_status_and_comment(self, issue_key, status_name="In Progress"):
+        if not self.configured:
+            return "❌ Jira credentials missing."
+        path = f"/rest/api/3/issue/{issue_key}/transitions"
+        try:
+            response = await self._request("GET", path)
+            if response.status_code != 200:
+                return f"❌ Jira API Error: {response.status_code} - {response.text}"
+
+            transitions = response.json().get("transitions", [])
+            transition_id, found_name = pick_transition(transitions, status_name)
+            if not transition_id:
+                avail = [t.get("name") for t in transitions]
+                return f"⚠️ Jira {issue_key}: No 'In Progress' button found. Available: {', '.join(avail)}"
+
+            post_res = await self._request("POST", path, json={"transition": {"id": transition_id}})
+            if post_res.status_code == 204:
+                return f"✅ Jira {issue_key}: Status updated via '{found_name}'"
+            return f"❌ Jira Transition Failed: {post_res.status_code} - {post_res.text}"
+        except Exception as e:
+            return f"❌ System Error updating Jira: {str(e)}"
+
+    async def transition_issues(self, issue_keys, status_name="In Progress"):
+        """Transitions every issue concurrently; returns one status message per key, in order."""
+        return list(await asyncio.gather(*(self.update_status_and_comment(k, status_name) for k in issue_keys)))
+
+    # --- Changelogs ---
+    async def get_changelog(self, issue_key, page_size=100):
+        """All changelog histories of an issue (oldest first)."""
+        if not self.configured:
+            return []
+        histories = []
+        try:
+            while True:
+                response = await self._request("GET", f"/rest/api/2/issue/{issue_key}/changelog",
+                                               params={"startAt": len(histories), "maxResults": page_size})
+                response.raise_for_status()
+                body = response.json()
+                page = body.get("values", [])
+                histories.extend(page)
+                if not page or body.get("isLast", True):
+                    return histories
+        except Exception as e:
+            print(f"❌ Jira Changelog Error ({issue_key}): {e}")
+            return histories
+
+    async def get_changelogs(self, issue_keys):
+        """{key: histories} for every key, fetched concurrently."""
+        changelogs = await asyncio.gather(*(self.get_changelog(key) for key in issue_keys))
+        return dict(zip(issue_keys, changelogs))
+
+    # --- Sprints ---
+    async def get_all_sprints_from_board(self, board_id, state=None, page_size=50):
+        """Every sprint of a board (optionally only 'active', 'closed' or 'future' ones)."""
+        if not self.configured or not board_id:
+            return []
+        sprints = []
+        params = {"maxResults": page_size}
+        if state:
+            params["state"] = state
+        try:
+            while True:
+                response = await self._request("GET", f"/rest/agile/1.0/board/{board_id}/sprint",
+                                               params={**params, "startAt": len(sprints)})
+                response.raise_for_status()
+                body = response.json()
+                page = body.get("values", [])
+                sprints.extend(page)
+                if not page or body.get("isLast", True):
+                    return sprints
+        except Exception as e:
+            print(f"❌ Jira Sprint Fetch Error: {e}")
+            return sprints
+
+    async def get_active_sprint(self, board_id, exclude_terms=("FE:", "FE ", "FRONTEND")):
+        """Fetches the latest active sprint for a given board ID, ignoring FE sprints."""
+        sprints = await self.get_all_sprints_from_board(board_id, state="active")
+        return latest_active_sprint(sprints, exclude_terms)
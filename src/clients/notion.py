@@ -1,34 +1,54 @@
 import os
-from notion_client import Client as NotionClient
+from notion_client import Client as NotionClient, APIResponseError
 from datetime import datetime, timedelta
+from src.utils.tracing import trace_methods
 
+@trace_methods("notion")
 class NotionClientWrapper:
     def __init__(self):
         self.token = os.getenv("NOTION_TOKEN")
         self.database_id = os.getenv("NOTION_DATABASE_ID")
+        self.base_url = os.getenv("NOTION_API_URL", "https://api.notion.com")
+        self.key_property = os.getenv("NOTION_KEY_PROPERTY", "Outbox Key")
         self.client = None
+        self._data_source_id = None
+        self._has_key_property = None
 
         if self.token and self.database_id:
             try:
-                self.client = NotionClient(auth=self.token)
+                self.client = NotionClient(auth=self.token, base_url=self.base_url)
                 print("✅ Notion connection initialized")
             except Exception as e:
                 print(f"❌ Notion Initialization Error: {e}")
 
-    def log_work(self, category, description):
+    def ping(self):
+        """One cheap authenticated call; returns a status message."""
+        if not self.client:
+            return "❌ Notion credentials not configured."
+        try:
+            me = self.client.users.me()
+            return f"✅ Connected as {me.get('name') or me.get('id', '?')}"
+        except Exception as e:
+            return f"❌ Notion unreachable: {e}"
+
+    def log_work(self, category, description, dedupe_key=None):
+        """Creates a work-log page; `dedupe_key` is stored in the key property (if the database has it)."""
         if not self.client:
             return "❌ Notion credentials not configured."
         
         try:
             date_str = datetime.now().strftime("%Y-%m-%d")
+            properties = {
+                "Name": {"title": [{"text": {"content": f"Work Log: {category}"}}]},
+                "Category": {"select": {"name": category}},
+                "Date": {"date": {"start": date_str}}
+            }
+            if dedupe_key and self.has_key_property():
+                properties[self.key_property] = {"rich_text": [{"text": {"content": dedupe_key}}]}
             
             self.client.pages.create(
                 parent={"database_id": self.database_id},
-                properties={
-                    "Name": {"title": [{"text": {"content": f"Work Log: {category}"}}]},
-                    "Category": {"select": {"name": category}},
-                    "Date": {"date": {"start": date_str}}
-                },
+                properties=properties,
                 children=[
                     {
                         "object": "block",
@@ -38,9 +58,47 @@ class NotionClientWrapper:
                 ]
             )
             return f"✅ Work logged in Notion under {category}"
+        except APIResponseError as e:
+            return f"❌ Failed to log to Notion ({e.code}): {str(e)}"
         except Exception as e:
             return f"❌ Failed to log to Notion: {str(e)}"
 
+    def find_logged(self, dedupe_key):
+        """id of the work-log page written with `dedupe_key`, or None.
+
+        Always None when the database has no key property, since nothing else identifies the page.
+        """
+        if not self.client:
+            return None
+        try:
+            if not self.has_key_property():
+                return None
+            pages = self._query({"property": self.key_property, "rich_text": {"equals": dedupe_key}})
+            return pages[0]["id"] if pages else None
+        except Exception as e:
+            print(f"⚠️ Could not check Notion for an earlier log: {e}")
+            return None
+
+    def has_key_property(self):
+        """Whether the work-log database has a text property named `key_property`."""
+        if self._has_key_property is None:
+            properties = self.client.data_sources.retrieve(data_source_id=self.data_source_id()).get("properties", {})
+            self._has_key_property = properties.get(self.key_property, {}).get("type") == "rich_text"
+            if not self._has_key_property:
+                print(f"⚠️ Notion database has no '{self.key_property}' text property; retried logs can't be deduplicated")
+        return self._has_key_property
+
+    def data_source_id(self):
+        """The work-log database's data source; since API version 2025-09-03 queries go to data sources."""
+        if self._data_source_id is None:
+            sources = self.client.databases.retrieve(database_id=self.database_id).get("data_sources", [])
+            self._data_source_id = sources[0]["id"] if sources else self.database_id
+        return self._data_source_id
+
+    def _query(self, filter):
+        """Pages of the work-log database matching a Notion filter."""
+        return self.client.data_sources.query(data_source_id=self.data_source_id(), filter=filter).get("results", [])
+
     def get_logs_for_last_7_days(self):
         """Fetches logs from the last 7 days from Notion."""
         if not self.client:
@@ -49,18 +107,15 @@ class NotionClientWrapper:
         try:
             seven_days_ago = (datetime.now() - timedelta(days=7)).isoformat()
             
-            query = self.client.databases.query(
-                database_id=self.database_id,
-                filter={
-                    "property": "Date",
-                    "date": {
-                        "on_or_after": seven_days_ago
-                    }
+            pages = self._query({
+                "property": "Date",
+                "date": {
+                    "on_or_after": seven_days_ago
                 }
-            )
+            })
             
             logs = []
-            for page in query.get("results", []):
+            for page in pages:
                 properties = page.get("properties", {})
                 
                 # Extract category
@@ -1,19 +1,38 @@
 import os
 from slack_sdk import WebClient
+from src.utils.tracing import trace_methods
+from src.utils.rate_limit import RateLimiter
 
+@trace_methods("slack")
 class SlackClient:
     def __init__(self):
         self.token = os.getenv("SLACK_BOT_TOKEN")
+        self.base_url = os.getenv("SLACK_API_URL", "https://slack.com/api/")
+        self.limiter = RateLimiter(float(os.getenv("SLACK_RATE_LIMIT", 1)), burst=5)
         self.client = None
+        # Channel name -> conversation ID, filled from conversations.list on first use
+        self._channel_ids = {}
 
         if self.token:
             try:
-                self.client = WebClient(token=self.token)
+                self.client = WebClient(token=self.token, base_url=self.base_url)
                 print("✅ Slack connection initialized")
             except Exception as e:
                 print(f"❌ Slack Initialization Error: {e}")
 
-    def send_message(self, channel, message, thread_ts=None):
+    def ping(self):
+        """One cheap authenticated call; returns a status message."""
+        if not self.client:
+            return "❌ Slack bot token not configured."
+        try:
+            self.limiter.acquire()
+            auth = self.client.auth_test()
+            return f"✅ Connected as {auth.get('user', auth.get('user_id', '?'))}"
+        except Exception as e:
+            return f"❌ Slack unreachable: {e}"
+
+    def send_message(self, channel, message, thread_ts=None, dedupe_key=None):
+        """Posts a message; `dedupe_key` is attached as message metadata so `find_posted` can spot it."""
         if not self.client:
             return "❌ Slack bot token not configured."
         
@@ -22,10 +41,50 @@ class SlackClient:
             formatted_message = message.replace('**', '*')
             
             target = channel if channel.startswith(('#', 'C', 'U')) else f"#{channel}"
-            self.client.chat_postMessage(channel=target, text=formatted_message, thread_ts=thread_ts)
+            self.limiter.acquire()
+            metadata = {"event_type": "outbox_write", "event_payload": {"key": dedupe_key}} if dedupe_key else None
+            self.client.chat_postMessage(channel=target, text=formatted_message, thread_ts=thread_ts, metadata=metadata)
             return f"✅ Slack message sent to {target}"
         except Exception as e:
             error_msg = str(e)
             if "channel_not_found" in error_msg:
                 return f"❌ Slack Error: Channel '{target}' not found. Ensure the bot is invited to the channel (/invite @YourBotName)."
             return f"❌ Failed to send Slack message: {error_msg}"
+
+    def channel_id(self, channel):
+        """Conversation ID for "#name", "name" or an ID; history can only be read by ID."""
+        name = channel.lstrip('#')
+        if name not in self._channel_ids:
+            cursor = None
+            while True:
+                self.limiter.acquire()
+                response = self.client.conversations_list(types="public_channel,private_channel",
+                                                          exclude_archived=True, limit=1000, cursor=cursor)
+                for conv in response.get("channels", []):
+                    self._channel_ids[conv["name"]] = conv["id"]
+                cursor = (response.get("response_metadata") or {}).get("next_cursor")
+                if not cursor:
+                    break
+            # Not a channel name, so it already is an ID (or the channel is gone)
+            self._channel_ids.setdefault(name, name)
+        return self._channel_ids[name]
+
+    def find_posted(self, channel, dedupe_key, oldest, thread_ts=None):
+        """ts of a message posted with `dedupe_key` since `oldest` (epoch seconds), or None."""
+        if not self.client:
+            return None
+        try:
+            channel = self.channel_id(channel)
+            self.limiter.acquire()
+            if thread_ts:
+                response = self.client.conversations_replies(channel=channel, ts=thread_ts, oldest=f"{oldest:.6f}",
+                                                             include_all_metadata=True, limit=200)
+            else:
+                response = self.client.conversations_history(channel=channel, oldest=f"{oldest:.6f}",
+                                                             include_all_metadata=True, limit=200)
+            for msg in response.get("messages", []):
+                if (msg.get("metadata") or {}).get("event_payload", {}).get("key") == dedupe_key:
+                    return msg.get("ts")
+        except Exception as e:
+            print(f"⚠️ Could not check {channel} for an earlier post: {e}")
+        return None
@@ -6,6 +6,16 @@ load_dotenv()
 class Config:
     # AI
     GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+    GROQ_API_BASE = os.getenv("GROQ_API_BASE", "https://api.groq.com").rstrip("/")
+    LLM_MODEL_LARGE = os.getenv("LLM_MODEL_LARGE", "llama-3.3-70b-versatile")
+    LLM_MODEL_SMALL = os.getenv("LLM_MODEL_SMALL", "llama-3.1-8b-instant")
+    MODEL_TIERING = os.getenv("MODEL_TIERING", "true").lower() in ("1", "true", "yes")
+    SMALL_MODEL_MAX_PROMPT_CHARS = int(os.getenv("SMALL_MODEL_MAX_PROMPT_CHARS", "240"))
+    SKILLS_PROMPT_MODE = os.getenv("SKILLS_PROMPT_MODE", "templates")
+    SKILLS_POLL_SECONDS = float(os.getenv("SKILLS_POLL_SECONDS", "2"))
+    STRUCTURED_OUTPUT = os.getenv("STRUCTURED_OUTPUT", "true").lower() in ("1", "true", "yes")
+    PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "8000"))
+    REVISION_SUMMARY_TOKENS = int(os.getenv("REVISION_SUMMARY_TOKENS", "300"))
     
     # Jira
     JIRA_URL = os.getenv("JIRA_URL")
@@ -18,15 +28,84 @@ class Config:
     SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")
     SLACK_APP_TOKEN = os.getenv("SLACK_APP_TOKEN")
     MY_SLACK_ID = os.getenv("MY_SLACK_ID")
+    SLACK_API_URL = os.getenv("SLACK_API_URL", "https://slack.com/api/")
     
     # Notion
     NOTION_TOKEN = os.getenv("NOTION_TOKEN")
     NOTION_DATABASE_ID = os.getenv("NOTION_DATABASE_ID")
+    NOTION_API_URL = os.getenv("NOTION_API_URL", "https://api.notion.com").rstrip("/")
+    # Text property holding each outbox write's key, so a retried log can be matched exactly
+    NOTION_KEY_PROPERTY = os.getenv("NOTION_KEY_PROPERTY", "Outbox Key")
     
     # Others
     NTFY_TOPIC = os.getenv("NTFY_TOPIC")
+    NTFY_URL = os.getenv("NTFY_URL", "https://ntfy.sh").rstrip("/")
     KOYEB_APP_URL = os.getenv("KOYEB_APP_URL")
     PORT = int(os.getenv("PORT", 8080))
 
+    # Teams (multi-board fan-out)
+    TEAMS_FILE = os.getenv("TEAMS_FILE", "teams.json")
+    FANOUT_MAX_WORKERS = int(os.getenv("FANOUT_MAX_WORKERS", 4))
+
+    # Scheduling (leader election and run history for multiple worker replicas)
+    LEADER_BACKEND = os.getenv("LEADER_BACKEND", "sqlite")
+    LEADER_LEASE_TTL = int(os.getenv("LEADER_LEASE_TTL", 30))
+    LEADER_LOCK_PATH = os.getenv("LEADER_LOCK_PATH", "data/leader.lock")
+    SCHEDULER_DB_PATH = os.getenv("SCHEDULER_DB_PATH", "data/scheduler.db")
+    JOB_MISFIRE_GRACE = int(os.getenv("JOB_MISFIRE_GRACE", 300))
+    JOB_CATCHUP_HOURS = int(os.getenv("JOB_CATCHUP_HOURS", 6))
+    # "process" runs each scheduled job in a fresh child process that is killed at its timeout; "thread" can only abandon it
+    JOB_ISOLATION = os.getenv("JOB_ISOLATION", "process")
+    JOB_TIMEOUT = int(os.getenv("JOB_TIMEOUT", 900))
+
+    # Worker memory diagnostics
+    MEMORY_PROFILING = os.getenv("MEMORY_PROFILING", "false").lower() in ("1", "true", "yes")
+    TRACEMALLOC_FRAMES = int(os.getenv("TRACEMALLOC_FRAMES", 10))
+    RSS_REPORT_MINUTES = int(os.getenv("RSS_REPORT_MINUTES", 60))
+
+    # Write outbox (post_content queues writes and returns immediately)
+    OUTBOX_ENABLED = os.getenv("OUTBOX_ENABLED", "true").lower() in ("1", "true", "yes")
+    OUTBOX_PATH = os.getenv("OUTBOX_PATH", "data/outbox.db")
+    OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 5))
+    OUTBOX_CONCURRENCY = int(os.getenv("OUTBOX_CONCURRENCY", 2))
+
+    # Near-duplicate detection before creating Jira tickets
+    SIMILARITY_INDEX_PATH = os.getenv("SIMILARITY_INDEX_PATH", "data/similarity_index.npz")
+    SIMILARITY_DIM = int(os.getenv("SIMILARITY_DIM", 512))
+    SIMILARITY_TOP_K = int(os.getenv("SIMILARITY_TOP_K", 3))
+    SIMILARITY_THRESHOLD = float(os.getenv("SIMILARITY_THRESHOLD", 0.45))
+    DUPLICATE_BLOCK_THRESHOLD = float(os.getenv("DUPLICATE_BLOCK_THRESHOLD", 0.8))
+    SIMILARITY_SYNC_MINUTES = int(os.getenv("SIMILARITY_SYNC_MINUTES", 15))
+
+    # Issue-key detection in work logs (dependency checker)
+    JIRA_PROJECT_KEYS_TTL = int(os.getenv("JIRA_PROJECT_KEYS_TTL", 3600))
+    JIRA_KEY_CACHE_TTL = int(os.getenv("JIRA_KEY_CACHE_TTL", 600))
+    JIRA_KEY_CACHE_SIZE = int(os.getenv("JIRA_KEY_CACHE_SIZE", 2000))
+
+    # Daily sprint burnup snapshots
+    BURNUP_DB_PATH = os.getenv("BURNUP_DB_PATH", "data/burnup.db")
+
+    # Sprint history backfill
+    SPRINT_HISTORY_PATH = os.getenv("SPRINT_HISTORY_PATH", "data/sprint_history.npz")
+    BACKFILL_WORKERS = int(os.getenv("BACKFILL_WORKERS", 0))
+    # Issue field listing every sprint an issue has been in (Jira Cloud's default "Sprint" field)
+    JIRA_SPRINT_FIELD = os.getenv("JIRA_SPRINT_FIELD", "customfield_10020")
+
+    # Tracing
+    TRACE_ENABLED = os.getenv("TRACE_ENABLED", "false").lower() in ("1", "true", "yes")
+    TRACE_FILE = os.getenv("TRACE_FILE", "traces/trace.jsonl")
+    TRACE_MAX_BYTES = int(os.getenv("TRACE_MAX_BYTES", 10 * 1024 * 1024))
+    TRACE_BACKUPS = int(os.getenv("TRACE_BACKUPS", 3))
+
+    # Dashboard (ui.py)
+    UI_WORKERS = int(os.getenv("UI_WORKERS", 4))
+    UI_REFRESH_SECONDS = float(os.getenv("UI_REFRESH_SECONDS", 2))
+    HEALTH_CACHE_SECONDS = int(os.getenv("HEALTH_CACHE_SECONDS", 60))
+
+    # Activity log (shared between worker and UI)
+    ACTIVITY_LOG_PATH = os.getenv("ACTIVITY_LOG_PATH", "data/activity.db")
+    ACTIVITY_LOG_CAPACITY = int(os.getenv("ACTIVITY_LOG_CAPACITY", 1000))
+    ACTIVITY_LOG_SOURCE = os.getenv("ACTIVITY_LOG_SOURCE")
+
 config = Config()
 
@@ -0,0 +1,122 @@
+import re
+from src.models.jira import normalize_status
+
+
+def _jql_list(values):
+    return ", ".join('"' + str(v).replace('"', '\\"') + '"' for v in values)
+
+
+def _words(terms):
+    """JQL text-search words for substring terms like "(FE)" or " FE" -> ["FE"]."""
+    words = []
+    for term in terms:
+        for word in re.findall(r"[A-Za-z0-9]+", term):
+            if word.upper() not in (w.upper() for w in words):
+                words.append(word)
+    return words
+
+
+class IssueFilter:
+    """Declarative issue filter shared by the sprint services.
+
+    `apply(collection)` runs the precompiled local predicate, which is always authoritative. With
+    pushdown on (the default), `jql(base)` also adds the clauses Jira can evaluate so fewer
+    issues are transferred: the kept statuses, "assignee IS NOT EMPTY" and summary word
+    exclusions. Jira rejects a query naming a status the board doesn't have, so callers fall back
+    to `jql(base, pushdown=False)` when a narrowed query fails or comes back empty; summary
+    exclusions use Jira's word search, so a summary like "FE-only" is dropped server-side even
+    though the local " FE" term would not catch it. Status exclusions are substring terms and
+    never leave the local predicate.
+
+    - statuses: keep only these (exact) statuses
+    - excluded_status_terms: drop statuses containing any of these terms (local only)
+    - done_states: statuses counted as done by `done_mask`
+    - excluded_assignees: drop issues whose assignee name contains any of these
+    - summary_excludes: drop issues whose summary contains any of these (case-insensitive)
+    - require_assignee: drop unassigned issues
+    """
+
+    def __init__(self, statuses=None, excluded_status_terms=(), done_states=(), excluded_assignees=(),
+                 summary_excludes=(), require_assignee=False, pushdown=True):
+        self.statuses = frozenset(normalize_status(s) for s in statuses) if statuses else None
+        self.excluded_status_terms = tuple(t.upper() for t in excluded_status_terms)
+        self.done_states = frozenset(normalize_status(s) for s in done_states)
+        self.excluded_assignees = tuple(excluded_assignees)
+        self.summary_excludes = tuple(t.upper() for t in summary_excludes)
+        self.require_assignee = require_assignee
+        self.pushdown = pushdown
+        # Verdicts per distinct status, filled lazily; there are only a handful of statuses per board
+        self._status_ok = {}
+
+    # --- Server side ---
+    def clauses(self, pushdown=None):
+        if not (self.pushdown if pushdown is None else pushdown):
+            return []
+        clauses = []
+        if self.statuses:
+            clauses.append(f"status IN ({_jql_list(sorted(self.statuses))})")
+        if self.require_assignee:
+            clauses.append("assignee IS NOT EMPTY")
+        for word in _words(self.summary_excludes):
+            clauses.append(f'summary !~ "{word}"')
+        return clauses
+
+    def jql(self, base, pushdown=None):
+        """`base` (e.g. "sprint = 12 AND project = BE") narrowed by every clause Jira can evaluate.
+
+        `pushdown=False` gives the plain base query for the local-only fallback.
+        """
+        return " AND ".join([f"({base})" if " OR " in base.upper() else base] + self.clauses(pushdown))
+
+    # --- Local side ---
+    def _status_allowed(self, status):
+        ok = self._status_ok.get(status)
+        if ok is None:
+            ok = (self.statuses is None or status in self.statuses) and not any(
+                t in status for t in self.excluded_status_terms
+            )
+            self._status_ok[status] = ok
+        return ok
+
+    def matches(self, issue):
+        if not self._status_allowed(issue.status):
+            return False
+        return self._rest_allowed(issue.assignee, issue.summary)
+
+    def _rest_allowed(self, assignee, summary):
+        if self.require_assignee and not assignee:
+            return False
+        if assignee and any(name in assignee for name in self.excluded_assignees):
+            return False
+        if self.summary_excludes:
+            upper = (summary or "").upper()
+            if any(term in upper for term in self.summary_excludes):
+                return False
+        return True
+
+    def mask(self, collection):
+        return [
+            self._status_allowed(status) and self._rest_allowed(assignee, summary)
+            for status, assignee, summary in zip(collection.statuses, collection.assignees, collection.summaries)
+        ]
+
+    def apply(self, collection):
+        """The issues of an IssueCollection that pass the filter."""
+        return collection.take(self.mask(collection))
+
+    def done_mask(self, collection):
+        return [s in self.done_states for s in collection.statuses]
+
+
+class SprintFilter:
+    """Sprint-name exclusions (e.g. FE sprints); the board API can only filter by state server-side."""
+
+    def __init__(self, name_excludes=()):
+        self.name_excludes = tuple(t.upper() for t in name_excludes)
+
+    def matches(self, sprint):
+        name = (sprint.get("name") or "").upper()
+        return not any(term in name for term in self.name_excludes)
+
+    def apply(self, sprints):
+        return [s for s in sprints if isinstance(s, dict) and self.matches(s)]
@@ -0,0 +1,162 @@
+import os
+import time
+import uuid
+import socket
+import sqlite3
+import logging
+import threading
+from src.core.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteLeaseBackend:
+    """Row lease in a SQLite table: the holder renews `expires_at`; anyone may take an expired lease."""
+
+    def __init__(self, path, name="scheduler"):
+        self.path = path
+        self.name = name
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS leases (name TEXT PRIMARY KEY, holder TEXT, expires_at REAL)")
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def try_acquire(self, holder, ttl):
+        conn = self._connect()
+        try:
+            now = time.time()
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT holder, expires_at FROM leases WHERE name = ?", (self.name,)).fetchone()
+            if row and row[0] != holder and row[1] > now:
+                conn.execute("ROLLBACK")
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO leases (name, holder, expires_at) VALUES (?, ?, ?)",
+                (self.name, holder, now + ttl)
+            )
+            conn.execute("COMMIT")
+            return True
+        finally:
+            conn.close()
+
+    def release(self, holder):
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM leases WHERE name = ? AND holder = ?", (self.name, holder))
+        finally:
+            conn.close()
+
+
+class FileLockLeaseBackend:
+    """Exclusive flock on a lock file; the lease lasts as long as the holding process keeps it open."""
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def try_acquire(self, holder, ttl):
+        import fcntl
+
+        if self._fd is not None:
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, holder.encode("utf-8"))
+        self._fd = fd
+        return True
+
+    def release(self, holder):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class AlwaysLeaderBackend:
+    """Single-replica deployments: this process is always the leader."""
+
+    def try_acquire(self, holder, ttl):
+        return True
+
+    def release(self, holder):
+        pass
+
+
+def create_lease_backend(kind=None):
+    kind = (kind or config.LEADER_BACKEND).lower()
+    if kind == "sqlite":
+        return SqliteLeaseBackend(config.SCHEDULER_DB_PATH)
+    if kind == "file":
+        return FileLockLeaseBackend(config.LEADER_LOCK_PATH)
+    if kind == "none":
+        return AlwaysLeaderBackend()
+    raise ValueError(f"Unknown LEADER_BACKEND '{kind}' (expected sqlite, file or none)")
+
+
+class LeaderElector:
+    """Keeps trying to hold the lease in the background and reports whether this replica leads."""
+
+    def __init__(self, backend, ttl=30, on_elected=None, on_lost=None):
+        self.backend = backend
+        self.ttl = ttl
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.on_elected = on_elected
+        self.on_lost = on_lost
+        self._valid_until = 0.0
+        self._leader = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def is_leader(self):
+        # A lease we failed to renew in time is treated as lost even before the next tick
+        return self._leader and time.monotonic() < self._valid_until
+
+    def tick(self):
+        try:
+            acquired = self.backend.try_acquire(self.holder, self.ttl)
+        except Exception as e:
+            logger.error(f"❌ Leader lease error: {e}")
+            acquired = False
+
+        was_leader = self._leader
+        self._leader = acquired
+        if acquired:
+            self._valid_until = time.monotonic() + self.ttl
+        if acquired and not was_leader:
+            logger.info(f"👑 This worker ({self.holder}) is now the scheduler leader")
+            if self.on_elected:
+                threading.Thread(target=self.on_elected, daemon=True).start()
+        elif was_leader and not acquired:
+            logger.warning(f"⚠️ This worker ({self.holder}) lost scheduler leadership")
+            if self.on_lost:
+                self.on_lost()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.tick()
+            self._stop.wait(max(self.ttl / 3, 1))
+
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, name="leader-elector", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._leader:
+            self.backend.release(self.holder)
+            self._leader = False
@@ -0,0 +1,258 @@
+import os
+import time
+import importlib
+import sqlite3
+import logging
+import threading
+import multiprocessing
+from datetime import datetime, timedelta
+from src.core.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class JobTimeout(Exception):
+    """A job ran past its timeout and was stopped (process isolation) or abandoned (thread isolation)."""
+
+
+def resolve_job(target):
+    """The callable named by "package.module:function", or target itself if it is already callable."""
+    if callable(target):
+        return target
+    module, _, name = target.partition(":")
+    func = importlib.import_module(module)
+    for part in name.split("."):
+        func = getattr(func, part)
+    return func
+
+
+def _run_child(target, conn):
+    try:
+        resolve_job(target)()
+        conn.send(None)
+    except BaseException as e:
+        conn.send(f"{type(e).__name__}: {e}")
+    finally:
+        conn.close()
+
+
+def _process_context():
+    # Never fork the worker itself: it runs the scheduler, Slack and health threads, and a fork taken
+    # while one of them holds a lock (logging, SQLite, HTTP pools) deadlocks the child. The fork server
+    # is a clean single-threaded process; job modules are preloaded there once.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(["src.services.jobs"])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+def run_isolated(job_id, target, timeout=None, isolation=None):
+    """Runs a job with a hard timeout so a hung upstream call can't hold a scheduler thread forever.
+
+    `target` is a "module:function" name (see src.services.jobs) or, except with process
+    isolation, any callable. isolation="process" runs it in a fresh child process started from
+    the fork server (spawn where unavailable); the function builds its own services there, the
+    child is terminated at the timeout, and whatever the job allocated is returned to the OS when
+    it exits. "thread" runs it on a daemon thread and stops waiting at the timeout (Python threads
+    can't be killed, so the thread may linger). "inline" just calls it. Raises JobTimeout on
+    timeout and RuntimeError if a child job failed.
+    """
+    timeout = timeout or config.JOB_TIMEOUT
+    isolation = isolation or config.JOB_ISOLATION
+    if isolation == "inline":
+        return resolve_job(target)()
+
+    started = time.monotonic()
+    if isolation == "thread":
+        func = resolve_job(target)
+        outcome = {}
+
+        def target():
+            try:
+                func()
+            except BaseException as e:
+                outcome["error"] = e
+
+        worker = threading.Thread(target=target, name=f"job-{job_id}", daemon=True)
+        worker.start()
+        worker.join(timeout)
+        if worker.is_alive():
+            raise JobTimeout(f"'{job_id}' still running after {timeout}s; abandoned its thread")
+        if "error" in outcome:
+            raise outcome["error"]
+        logger.info(f"🧰 '{job_id}' finished in {time.monotonic() - started:.1f}s")
+        return
+
+    if not isinstance(target, str):
+        raise TypeError(f"'{job_id}' needs a \"module:function\" target to run in a job process")
+    ctx = _process_context()
+    receiver, sender = ctx.Pipe(duplex=False)
+    child = ctx.Process(target=_run_child, args=(target, sender), name=f"job-{job_id}", daemon=True)
+    child.start()
+    sender.close()
+    child.join(timeout)
+    if child.is_alive():
+        child.terminate()
+        child.join(5)
+        if child.is_alive():
+            child.kill()
+            child.join()
+        raise JobTimeout(f"'{job_id}' killed after {timeout}s")
+    try:
+        error = receiver.recv() if receiver.poll() else f"child exited with code {child.exitcode}"
+    except EOFError:
+        error = f"child exited with code {child.exitcode}"
+    receiver.close()
+    if error:
+        raise RuntimeError(f"'{job_id}' failed in its job process: {error}")
+    logger.info(f"🧰 '{job_id}' finished in {time.monotonic() - started:.1f}s (pid {child.pid})")
+
+
+class JobStore:
+    """Persistent run history: one row per (job, scheduled fire time).
+
+    Claiming a fire time is an atomic insert, so a scheduled run happens at most once across
+    replicas and restarts, and the history tells us which runs were missed while we were down.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_runs ("
+                "job_id TEXT NOT NULL, fire_time TEXT NOT NULL, holder TEXT, started_at REAL, "
+                "finished_at REAL, status TEXT, PRIMARY KEY (job_id, fire_time))"
+            )
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def claim(self, job_id, fire_time, holder, status="running"):
+        """Returns True if this caller is the first to claim the fire time."""
+        conn = self._connect()
+        try:
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO job_runs (job_id, fire_time, holder, started_at, status) VALUES (?, ?, ?, ?, ?)",
+                (job_id, fire_time.isoformat(), holder, time.time(), status)
+            )
+            return cur.rowcount == 1
+        finally:
+            conn.close()
+
+    def finish(self, job_id, fire_time, status):
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE job_runs SET finished_at = ?, status = ? WHERE job_id = ? AND fire_time = ?",
+                (time.time(), status, job_id, fire_time.isoformat())
+            )
+        finally:
+            conn.close()
+
+    def has_history(self, job_id):
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT 1 FROM job_runs WHERE job_id = ? LIMIT 1", (job_id,)).fetchone() is not None
+        finally:
+            conn.close()
+
+    def recent_runs(self, limit=20):
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "SELECT job_id, fire_time, holder, status, started_at, finished_at FROM job_runs "
+                "ORDER BY started_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        finally:
+            conn.close()
+
+
+class LeaderGatedJobs:
+    """Registers cron jobs that only the elected leader executes, at most once per fire time.
+
+    All replicas keep the same schedule; on each fire the non-leaders skip, and the leader claims
+    the fire time in the JobStore before running. When a replica becomes leader it catches up on
+    the latest missed fire time of each job (within JOB_CATCHUP_HOURS).
+    """
+
+    def __init__(self, scheduler, store, elector, misfire_grace=None, catchup_hours=None):
+        self.scheduler = scheduler
+        self.store = store
+        self.elector = elector
+        self.misfire_grace = misfire_grace if misfire_grace is not None else config.JOB_MISFIRE_GRACE
+        self.catchup_window = timedelta(hours=catchup_hours if catchup_hours is not None else config.JOB_CATCHUP_HOURS)
+        self._funcs = {}
+        self._catchup_lock = threading.Lock()
+
+    def add_cron_job(self, job_id, target, timeout=None, isolation=None, max_instances=1, coalesce=True, **cron):
+        """Schedules target ("module:function"); each run is isolated (see run_isolated) and stopped after `timeout` seconds."""
+        self._funcs[job_id] = (target, timeout, isolation)
+        self.scheduler.add_job(
+            self.run, 'cron', args=[job_id], id=job_id, replace_existing=True,
+            misfire_grace_time=self.misfire_grace, coalesce=coalesce, max_instances=max_instances, **cron
+        )
+
+    def _latest_fire_time(self, job_id, now, window):
+        """The most recent scheduled fire time in (now - window, now], or None."""
+        trigger = self.scheduler.get_job(job_id).trigger
+        fire_time = trigger.get_next_fire_time(None, now - window)
+        latest = None
+        while fire_time and fire_time <= now:
+            latest = fire_time
+            fire_time = trigger.get_next_fire_time(fire_time, fire_time + timedelta(seconds=1))
+        return latest
+
+    def run(self, job_id, fire_time=None):
+        if not self.elector.is_leader:
+            logger.info(f"⏭️ Skipping '{job_id}': this worker is not the scheduler leader.")
+            return
+
+        trigger = self.scheduler.get_job(job_id).trigger
+        now = datetime.now(trigger.timezone)
+        fire_time = fire_time or self._latest_fire_time(job_id, now, timedelta(seconds=self.misfire_grace + 60)) or now
+        fire_time = fire_time.replace(microsecond=0)
+
+        if not self.store.claim(job_id, fire_time, self.elector.holder):
+            logger.info(f"⏭️ '{job_id}' for {fire_time} already ran on another worker.")
+            return
+
+        target, timeout, isolation = self._funcs[job_id]
+        try:
+            run_isolated(job_id, target, timeout, isolation)
+            self.store.finish(job_id, fire_time, "ok")
+        except JobTimeout as e:
+            self.store.finish(job_id, fire_time, "timeout")
+            logger.error(f"⏱️ {e}")
+            raise
+        except Exception as e:
+            self.store.finish(job_id, fire_time, f"error: {e}")
+            raise
+
+    def catch_up(self):
+        """Runs the latest missed fire time of each job. Called when this replica becomes leader."""
+        with self._catchup_lock:
+            for job_id in list(self._funcs):
+                job = self.scheduler.get_job(job_id)
+                if job is None:
+                    continue
+                now = datetime.now(job.trigger.timezone)
+                missed = self._latest_fire_time(job_id, now, self.catchup_window)
+                if missed is None:
+                    continue
+                missed = missed.replace(microsecond=0)
+                if not self.store.has_history(job_id):
+                    # First deploy with a job store: the old worker may already have run it
+                    self.store.claim(job_id, missed, self.elector.holder, status="seeded")
+                    continue
+                if self.elector.is_leader:
+                    logger.info(f"🔁 Catching up on missed '{job_id}' run scheduled for {missed}")
+                    try:
+                        self.run(job_id, missed)
+                    except Exception as e:
+                        logger.error(f"❌ Catch-up of '{job_id}' failed: {e}")
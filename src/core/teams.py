@@ -0,0 +1,95 @@
+import os
+import json
+from src.core.config import config
+from src.models.jira import POINT_FIELDS
+from src.core.filters import IssueFilter, SprintFilter
+
+# Defaults reflect the original single-board Backend setup
+DEFAULT_TEAM = {
+    "name": "backend",
+    "label": "Backend",
+    "channel": "propone-backend-dev",
+    "reminder_statuses": ["BACKEND INPROGRESS", "BACKEND TODO"],
+    # Now including 'BE PR REVIEW' and 'VERIFICATION' as completed work
+    "done_states": ["DONE", "BACKEND DONE", "VERIFICATION", "QA APPROVED", "READY FOR LIVE", "BE PR REVIEW"],
+    "excluded_statuses": ["PRODUCT", "DEPRECATED"],
+    "point_fields": list(POINT_FIELDS),
+    "excluded_assignees": ["Taimoor"],
+    "summary_excludes": ["FE ", " FE", "(FE)", "FRONTEND"],
+    "sprint_name_excludes": ["FE:", "FE ", "FRONTEND"],
+    # Also push reminder statuses, assignee and summary filters into the JQL. Jira rejects unknown
+    # statuses; the services then retry without them, so turn this off for boards where that is routine.
+    "jql_pushdown": True,
+}
+
+
+class Team:
+    """One board/project/channel the scheduled jobs run for."""
+
+    def __init__(self, name, board_id, project_key, channel, label="Backend", reminder_statuses=None,
+                 done_states=None, excluded_statuses=None, point_fields=None, excluded_assignees=None,
+                 summary_excludes=None, sprint_name_excludes=None, jql_pushdown=None):
+        self.name = name
+        self.board_id = str(board_id) if board_id else None
+        self.project_key = project_key
+        self.channel = channel
+        self.label = label
+        self.reminder_statuses = list(reminder_statuses if reminder_statuses is not None else DEFAULT_TEAM["reminder_statuses"])
+        self.done_states = list(done_states if done_states is not None else DEFAULT_TEAM["done_states"])
+        self.excluded_statuses = list(excluded_statuses if excluded_statuses is not None else DEFAULT_TEAM["excluded_statuses"])
+        self.point_fields = list(point_fields if point_fields is not None else DEFAULT_TEAM["point_fields"])
+        self.excluded_assignees = list(excluded_assignees if excluded_assignees is not None else DEFAULT_TEAM["excluded_assignees"])
+        self.summary_excludes = list(summary_excludes if summary_excludes is not None else DEFAULT_TEAM["summary_excludes"])
+        self.sprint_name_excludes = list(sprint_name_excludes if sprint_name_excludes is not None else DEFAULT_TEAM["sprint_name_excludes"])
+        self.jql_pushdown = DEFAULT_TEAM["jql_pushdown"] if jql_pushdown is None else bool(jql_pushdown)
+
+    # --- Filters shared by the sprint services ---
+    def velocity_filter(self):
+        """Issues that count towards the team's sprint progress."""
+        return IssueFilter(excluded_status_terms=self.excluded_statuses, done_states=self.done_states,
+                           pushdown=self.jql_pushdown)
+
+    def reminder_filter(self):
+        """In-progress work of the team's members that gets a status reminder."""
+        return IssueFilter(statuses=self.reminder_statuses, excluded_assignees=self.excluded_assignees,
+                           summary_excludes=self.summary_excludes, require_assignee=True,
+                           pushdown=self.jql_pushdown)
+
+    def sprint_filter(self):
+        return SprintFilter(self.sprint_name_excludes)
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        missing = [k for k in ("name", "board_id", "project_key", "channel") if not data.get(k)]
+        if missing:
+            raise ValueError(f"Team {data.get('name', '?')} is missing {', '.join(missing)}")
+        return cls(**data)
+
+    def __repr__(self):
+        return f"Team({self.name!r}, board={self.board_id}, project={self.project_key}, channel={self.channel})"
+
+
+def default_team():
+    """The single team described by JIRA_BOARD_ID / JIRA_PROJECT_KEY."""
+    return Team(
+        name=DEFAULT_TEAM["name"],
+        board_id=config.JIRA_BOARD_ID,
+        project_key=config.JIRA_PROJECT_KEY,
+        channel=DEFAULT_TEAM["channel"],
+        label=DEFAULT_TEAM["label"],
+    )
+
+
+def load_teams(path=None):
+    """Loads the team registry from TEAMS_FILE (a JSON list), falling back to the default team."""
+    path = path or config.TEAMS_FILE
+    if not path or not os.path.exists(path):
+        return [default_team()]
+    with open(path, "r") as f:
+        entries = json.load(f)
+    teams = [Team.from_dict(entry) for entry in entries]
+    names = [t.name for t in teams]
+    if len(names) != len(set(names)):
+        raise ValueError(f"Duplicate team names in {path}")
+    return teams
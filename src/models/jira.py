@@ -0,0 +1,191 @@
+import sys
+from array import array
+from datetime import datetime
+
+# Story point fields identified on our boards, in priority order
+POINT_FIELDS = ("customfield_10004", "customfield_11441")
+
+# The only issue fields the services read; pass to JiraClient.search_issues to project the response
+ISSUE_FIELDS = ("summary", "status", "assignee") + POINT_FIELDS
+
+_status_cache = {}
+
+
+def normalize_status(name):
+    """Upper-cases and interns a status name so comparisons are identity-cheap and memory is shared."""
+    if name is None:
+        return ""
+    normalized = _status_cache.get(name)
+    if normalized is None:
+        normalized = _status_cache[name] = sys.intern(str(name).upper())
+    return normalized
+
+
+def parse_jira_date(value):
+    """Parses Jira's '2023-10-23T09:00:00.000Z' timestamps into a date (None if missing)."""
+    if not value:
+        return None
+    clean = value.split('.')[0].replace('Z', '')
+    return datetime.fromisoformat(clean).date()
+
+
+def resolve_points(fields, point_fields=POINT_FIELDS):
+    """Story points from the first populated point field, 0.0 if none."""
+    for field in point_fields:
+        val = fields.get(field)
+        if val is not None:
+            try:
+                return float(val)
+            except (ValueError, TypeError):
+                continue
+    return 0.0
+
+
+class Issue:
+    __slots__ = ("key", "summary", "status", "assignee", "points")
+
+    def __init__(self, key, summary, status, assignee, points):
+        self.key = key
+        self.summary = summary
+        self.status = status
+        self.assignee = assignee
+        self.points = points
+
+    @classmethod
+    def from_json(cls, raw, point_fields=POINT_FIELDS):
+        fields = raw.get("fields") or {}
+        assignee = fields.get("assignee") or {}
+        return cls(
+            key=raw.get("key"),
+            summary=fields.get("summary") or "",
+            status=normalize_status((fields.get("status") or {}).get("name")),
+            assignee=sys.intern(assignee["displayName"]) if assignee.get("displayName") else None,
+            points=resolve_points(fields, point_fields),
+        )
+
+    def __repr__(self):
+        return f"Issue({self.key!r}, status={self.status!r}, points={self.points})"
+
+
+class Sprint:
+    __slots__ = ("id", "name", "state", "start_date", "end_date")
+
+    def __init__(self, id, name, state, start_date, end_date):
+        self.id = id
+        self.name = name
+        self.state = state
+        self.start_date = start_date
+        self.end_date = end_date
+
+    @classmethod
+    def from_json(cls, raw):
+        return cls(
+            id=raw.get("id"),
+            name=raw.get("name", ""),
+            state=raw.get("state"),
+            start_date=parse_jira_date(raw.get("startDate")),
+            end_date=parse_jira_date(raw.get("endDate")),
+        )
+
+    def __repr__(self):
+        return f"Sprint({self.id!r}, {self.name!r}, {self.state!r})"
+
+
+class IssueCollection:
+    """Column-oriented set of issues built once from search results.
+
+    Each attribute lives in its own column (points in a packed double array), so aggregations
+    walk flat sequences instead of re-indexing nested JSON per issue.
+    """
+
+    __slots__ = ("keys", "summaries", "statuses", "assignees", "points")
+
+    def __init__(self, keys=None, summaries=None, statuses=None, assignees=None, points=None):
+        self.keys = keys or []
+        self.summaries = summaries or []
+        self.statuses = statuses or []
+        self.assignees = assignees or []
+        self.points = points if points is not None else array("d")
+
+    @classmethod
+    def from_search(cls, raw_issues, point_fields=POINT_FIELDS):
+        collection = cls()
+        for raw in raw_issues:
+            collection.append(Issue.from_json(raw, point_fields))
+        return collection
+
+    def append(self, issue):
+        self.keys.append(issue.key)
+        self.summaries.append(issue.summary)
+        self.statuses.append(issue.status)
+        self.assignees.append(issue.assignee)
+        self.points.append(issue.points)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __bool__(self):
+        return bool(self.keys)
+
+    def __getitem__(self, i):
+        return Issue(self.keys[i], self.summaries[i], self.statuses[i], self.assignees[i], self.points[i])
+
+    def __iter__(self):
+        for i in range(len(self.keys)):
+            yield self[i]
+
+    # --- Selection ---
+    def take(self, mask):
+        """New collection with the rows where mask is truthy."""
+        selected = IssueCollection()
+        selected.keys = [v for v, m in zip(self.keys, mask) if m]
+        selected.summaries = [v for v, m in zip(self.summaries, mask) if m]
+        selected.statuses = [v for v, m in zip(self.statuses, mask) if m]
+        selected.assignees = [v for v, m in zip(self.assignees, mask) if m]
+        selected.points = array("d", (v for v, m in zip(self.points, mask) if m))
+        return selected
+
+    def status_mask(self, statuses):
+        wanted = {normalize_status(s) for s in statuses}
+        return [s in wanted for s in self.statuses]
+
+    def status_contains_mask(self, terms):
+        terms = [t.upper() for t in terms]
+        return [any(t in s for t in terms) for s in self.statuses]
+
+    def filter(self, predicate):
+        return self.take([predicate(issue) for issue in self])
+
+    # --- Aggregation ---
+    def total_points(self, mask=None):
+        if mask is None:
+            return sum(self.points)
+        return sum(p for p, m in zip(self.points, mask) if m)
+
+    def count(self, mask=None):
+        return len(self.keys) if mask is None else sum(1 for m in mask if m)
+
+    def _group(self, column, weights=None):
+        totals = {}
+        for value, weight in zip(column, weights if weights is not None else [1] * len(column)):
+            totals[value] = totals.get(value, 0) + weight
+        return totals
+
+    def count_by_status(self):
+        return self._group(self.statuses)
+
+    def points_by_status(self):
+        return self._group(self.statuses, self.points)
+
+    def count_by_assignee(self):
+        return self._group(self.assignees)
+
+    def points_by_assignee(self):
+        return self._group(self.assignees, self.points)
+
+    def group_by_assignee(self):
+        """Assignee -> list of Issues, in original order."""
+        groups = {}
+        for issue in self:
+            groups.setdefault(issue.assignee, []).append(issue)
+        return groups
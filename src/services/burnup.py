@@ -0,0 +1,115 @@
+import os
+import json
+import sqlite3
+from datetime import date
+from src.core.config import config
+
+
+class BurnupStore:
+    """Daily sprint snapshots in a local SQLite file: one row per (team, sprint, day).
+
+    Rows are only ever added (a re-run on the same day refreshes that day's row), so the burnup
+    of any sprint is a single indexed read. `added_points` is the scope added since the sprint's
+    first snapshot (negative if scope was removed).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                "team TEXT NOT NULL, sprint_id INTEGER NOT NULL, sprint_name TEXT, day TEXT NOT NULL, "
+                "total_points REAL NOT NULL, completed_points REAL NOT NULL, added_points REAL NOT NULL, "
+                "total_issues INTEGER NOT NULL, completed_issues INTEGER NOT NULL, status_counts TEXT NOT NULL, "
+                "PRIMARY KEY (team, sprint_id, day))"
+            )
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def record(self, team, sprint_id, sprint_name, total_points, completed_points, total_issues,
+               completed_issues, status_counts, day=None):
+        """Stores today's (or `day`'s) snapshot of a sprint."""
+        day = (day or date.today()).isoformat()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            first = conn.execute(
+                "SELECT total_points FROM snapshots WHERE team = ? AND sprint_id = ? AND day < ? ORDER BY day LIMIT 1",
+                (team, sprint_id, day)
+            ).fetchone()
+            added = total_points - first[0] if first else 0.0
+            conn.execute(
+                "INSERT OR REPLACE INTO snapshots (team, sprint_id, sprint_name, day, total_points, completed_points, "
+                "added_points, total_issues, completed_issues, status_counts) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (team, sprint_id, sprint_name, day, total_points, completed_points, added,
+                 total_issues, completed_issues, json.dumps(status_counts, sort_keys=True))
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def snapshots(self, team, sprint_id):
+        """The sprint's snapshots, oldest day first, as dicts."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT day, total_points, completed_points, added_points, total_issues, completed_issues, status_counts "
+                "FROM snapshots WHERE team = ? AND sprint_id = ? ORDER BY day", (team, sprint_id)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [
+            {"day": date.fromisoformat(r[0]), "total_points": r[1], "completed_points": r[2], "added_points": r[3],
+             "total_issues": r[4], "completed_issues": r[5], "status_counts": json.loads(r[6])}
+            for r in rows
+        ]
+
+    def sprints(self, team=None):
+        """(team, sprint_id, sprint_name, first_day, last_day) for every recorded sprint, newest first."""
+        conn = self._connect()
+        try:
+            query = ("SELECT team, sprint_id, MAX(sprint_name), MIN(day), MAX(day) FROM snapshots "
+                     + ("WHERE team = ? " if team else "") + "GROUP BY team, sprint_id ORDER BY MAX(day) DESC")
+            return conn.execute(query, (team,) if team else ()).fetchall()
+        finally:
+            conn.close()
+
+    def latest_sprint(self, team):
+        sprints = self.sprints(team)
+        return sprints[0] if sprints else None
+
+
+def create_burnup_store():
+    return BurnupStore(config.BURNUP_DB_PATH)
+
+
+def render_burnup_text(snapshots, width=12, use_points=True):
+    """Compact burnup for Slack: one bar per day (completed vs scope) plus scope change."""
+    if not snapshots:
+        return ""
+    total_key, done_key = ("total_points", "completed_points") if use_points else ("total_issues", "completed_issues")
+    scale = max(s[total_key] for s in snapshots) or 1
+    lines = []
+    for s in snapshots:
+        done = round(s[done_key] / scale * width)
+        scope = round(s[total_key] / scale * width)
+        bar = "█" * done + "░" * max(scope - done, 0) + " " * (width - max(scope, done))
+        change = f"  (scope {s['added_points']:+.0f})" if use_points and s["added_points"] else ""
+        lines.append(f"{s['day'].strftime('%a %d')} `{bar}` {s[done_key]:.0f}/{s[total_key]:.0f}{change}")
+    return "\n".join(lines)
+
+
+def burnup_chart_data(snapshots):
+    """Columns for st.line_chart / st.area_chart: day, Scope, Completed, Remaining."""
+    return {
+        "day": [s["day"] for s in snapshots],
+        "Scope": [s["total_points"] for s in snapshots],
+        "Completed": [s["completed_points"] for s in snapshots],
+        "Remaining": [s["total_points"] - s["completed_points"] for s in snapshots],
+    }
@@ -0,0 +1,57 @@
+import logging
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from src.clients.jira import JiraClient
+from src.clients.slack import SlackClient
+from src.core.config import config
+from src.core.teams import load_teams
+from src.services.velocity_service import VelocityService
+from src.services.status_reminder_service import StatusReminderService
+from src.utils.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+class TeamFanoutService:
+    """Runs each scheduled sprint job for every registered team on a bounded thread pool."""
+
+    def __init__(self, teams=None, max_workers=None):
+        self.teams = teams if teams is not None else load_teams()
+        self.max_workers = max_workers or config.FANOUT_MAX_WORKERS
+        # Shared upstream clients so all teams draw from the same connections and rate limits
+        self.jira = JiraClient()
+        self.slack = SlackClient()
+        self.velocity = {t.name: VelocityService(t, jira=self.jira, slack=self.slack) for t in self.teams}
+        self.reminders = {t.name: StatusReminderService(t, jira=self.jira, slack=self.slack) for t in self.teams}
+        logger.info(f"👥 Fan-out configured for {len(self.teams)} team(s): {', '.join(t.name for t in self.teams)}")
+
+    def run(self, job_name, job):
+        """Calls `job(team)` for every team; one team's failure never stops the others."""
+        if not self.teams:
+            return {}
+
+        results = {}
+        workers = max(1, min(self.max_workers, len(self.teams)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"fanout-{job_name}") as pool:
+            # Copy the context per task so tracing spans nest under the fan-out span
+            futures = {pool.submit(contextvars.copy_context().run, job, team): team for team in self.teams}
+            for future in as_completed(futures):
+                team = futures[future]
+                try:
+                    future.result()
+                    results[team.name] = "ok"
+                except Exception as e:
+                    logger.error(f"❌ {job_name} failed for team '{team.name}': {e}")
+                    results[team.name] = f"error: {e}"
+
+        failed = [name for name, status in results.items() if status != "ok"]
+        logger.info(f"✅ {job_name} finished for {len(results) - len(failed)}/{len(results)} team(s)"
+                    + (f" (failed: {', '.join(failed)})" if failed else ""))
+        return results
+
+    @traced("job.fanout.forecast_sprint")
+    def forecast_sprint(self):
+        return self.run("forecast_sprint", lambda team: self.velocity[team.name].forecast_sprint())
+
+    @traced("job.fanout.check_and_send_reminders")
+    def check_and_send_reminders(self):
+        return self.run("check_and_send_reminders", lambda team: self.reminders[team.name].check_and_send_reminders())
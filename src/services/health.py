@@ -0,0 +1,47 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src.utils.logger import get_global_logger
+
+
+def _probe(name, ping):
+    started = time.perf_counter()
+    try:
+        message = ping()
+    except Exception as e:
+        message = f"❌ {name} check failed: {e}"
+    return {
+        "name": name,
+        "ok": message.startswith("✅"),
+        "message": message,
+        "latency_ms": (time.perf_counter() - started) * 1000,
+    }
+
+
+def check_services(agent, timeout=10):
+    """Live status of the upstreams the agent writes to, probed concurrently.
+
+    Each entry is {"name", "ok", "message", "latency_ms"}; a probe that doesn't answer within
+    `timeout` seconds is reported as down instead of holding up the caller.
+    """
+    probes = {"Jira": agent.jira.ping, "Slack": agent.slack.ping, "Notion": agent.notion.ping}
+    pool = ThreadPoolExecutor(max_workers=len(probes))
+    futures = {name: pool.submit(_probe, name, ping) for name, ping in probes.items()}
+    results = []
+    for name, future in futures.items():
+        try:
+            results.append(future.result(timeout=timeout))
+        except Exception:
+            results.append({"name": name, "ok": False, "message": f"❌ {name} did not answer within {timeout}s",
+                            "latency_ms": timeout * 1000})
+    pool.shutdown(wait=False)
+    return results
+
+
+def worker_status(source="worker", stale_after=3600):
+    """(ok, message) from the newest entry the worker wrote to the shared activity log."""
+    seen = get_global_logger().last_seen(source)
+    if seen is None:
+        return False, "No activity recorded yet"
+    age = time.time() - seen
+    ago = f"{age / 60:.0f} min ago" if age < 3600 else f"{age / 3600:.1f} h ago"
+    return age < stale_after, f"Last activity {ago}"
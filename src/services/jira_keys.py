@@ -0,0 +1,96 @@
+import re
+import time
+import logging
+import threading
+from collections import OrderedDict
+from src.core.config import config
+
+logger = logging.getLogger(__name__)
+
+# A key is PROJECT-NUMBER as a whole token: "ISO-8601" matches the shape, "xUTF-8" and "A-1.2" don't
+KEY_PATTERN = re.compile(r"(?<![A-Za-z0-9_-])([A-Z][A-Z0-9]+)-([1-9][0-9]*)(?![A-Za-z0-9_-]|\.[0-9])")
+
+
+class JiraKeyResolver:
+    """Finds the real Jira issue keys mentioned in free text.
+
+    Tokens shaped like keys (UTF-8, ISO-8601, SHA-256) are dropped unless their prefix is a known
+    project key; the project set is fetched from Jira and refreshed every JIRA_PROJECT_KEYS_TTL
+    seconds. The keys that remain are checked with one bulk JQL search, and the verdicts are kept in
+    a small LRU cache so repeated mentions never reach the network. If Jira can't be asked, keys are
+    let through as before rather than silently dropped.
+    """
+
+    def __init__(self, jira, project_ttl=None, cache_ttl=None, cache_size=None):
+        self.jira = jira
+        self.project_ttl = config.JIRA_PROJECT_KEYS_TTL if project_ttl is None else project_ttl
+        self.cache_ttl = config.JIRA_KEY_CACHE_TTL if cache_ttl is None else cache_ttl
+        self.cache_size = cache_size or config.JIRA_KEY_CACHE_SIZE
+        self._projects = None
+        self._projects_at = 0.0
+        self._seen = OrderedDict()  # key -> (exists, checked_at)
+        self._lock = threading.Lock()
+
+    def project_keys(self):
+        """The cached set of project keys, refreshed when stale; None when unknown."""
+        now = time.monotonic()
+        with self._lock:
+            if self._projects is not None and now - self._projects_at < self.project_ttl:
+                return self._projects
+        keys = self.jira.get_project_keys()
+        with self._lock:
+            if keys:
+                self._projects = frozenset(keys)
+            elif self._projects is None and self.jira.project_key:
+                # Listing failed: the configured project is the one we know exists
+                self._projects = frozenset([self.jira.project_key])
+            # Retry a failed listing after the TTL rather than on every call
+            self._projects_at = now
+            return self._projects
+
+    def candidates(self, text):
+        """Key-shaped tokens whose prefix is a known project, in order of first mention."""
+        found = list(dict.fromkeys(f"{p}-{n}" for p, n in KEY_PATTERN.findall(text or "")))
+        if not found:
+            return []
+        projects = self.project_keys()
+        if projects is None:
+            return found
+        return [key for key in found if key.split("-", 1)[0] in projects]
+
+    def resolve(self, text):
+        """The issue keys in text that exist in Jira, sorted."""
+        keys = self.candidates(text)
+        if not keys:
+            return []
+        now = time.monotonic()
+        known, unknown = set(), []
+        with self._lock:
+            for key in keys:
+                hit = self._seen.get(key)
+                if hit and now - hit[1] < self.cache_ttl:
+                    self._seen.move_to_end(key)
+                    if hit[0]:
+                        known.add(key)
+                else:
+                    unknown.append(key)
+
+        if unknown:
+            existing = self.jira.existing_keys(unknown)
+            if existing is None:
+                known.update(unknown)
+            else:
+                known.update(existing)
+                self._remember(unknown, existing, now)
+        dropped = len(keys) - len(known)
+        if dropped:
+            logger.info(f"🔑 Ignored {dropped} key-like token(s) that aren't Jira issues")
+        return sorted(known)
+
+    def _remember(self, keys, existing, now):
+        with self._lock:
+            for key in keys:
+                self._seen[key] = (key in existing, now)
+                self._seen.move_to_end(key)
+            while len(self._seen) > self.cache_size:
+                self._seen.popitem(last=False)
@@ -0,0 +1,31 @@
+import logging
+from src.utils.logger import ActivityLogHandler
+
+# Entry points for the worker's scheduled jobs, referenced as "src.services.jobs:<name>".
+# Isolated runs start in a fresh process, so each job builds its own services there.
+
+
+def _configure_logging():
+    root = logging.getLogger()
+    if not root.handlers:
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if not any(isinstance(h, ActivityLogHandler) for h in root.handlers):
+        root.addHandler(ActivityLogHandler(level=logging.INFO))
+
+
+def weekly_report():
+    from src.services.report_service import ReportService
+    _configure_logging()
+    ReportService().generate_weekly_report()
+
+
+def velocity_forecast():
+    from src.services.fanout_service import TeamFanoutService
+    _configure_logging()
+    TeamFanoutService().forecast_sprint()
+
+
+def sprint_reminders():
+    from src.services.fanout_service import TeamFanoutService
+    _configure_logging()
+    TeamFanoutService().check_and_send_reminders()
@@ -0,0 +1,262 @@
+import os
+import re
+import json
+import time
+import uuid
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.core.config import config
+from src.utils.logger import get_global_logger
+
+logger = get_global_logger()
+
+PENDING, RUNNING, DONE, FAILED = "pending", "running", "done", "failed"
+
+# Failures that will fail the same way on every attempt: bad config, a missing target, a rejected
+# payload. Anything else (timeouts, 5xx, rate limits) is assumed transient and retried.
+PERMANENT_ERRORS = re.compile(
+    r"not configured|credentials missing|unknown write operation|skipped:"
+    r"|channel_not_found|Channel '[^']*' not found|not_in_channel|is_archived|invalid_auth|not_authed|account_inactive|missing_scope"
+    r"|validation_error|object_not_found|unauthorized|restricted_resource"
+    r"|(?:Jira API Error|Jira Transition Failed): 4(?!29)\d\d",
+    re.IGNORECASE,
+)
+
+
+def is_permanent(result):
+    """True when a "❌" result will not go away by retrying the op."""
+    return bool(PERMANENT_ERRORS.search(result or ""))
+
+
+class Outbox:
+    """Durable queue of write operations (SQLite WAL) drained in the background.
+
+    `enqueue` persists a batch of typed operations and returns a handle immediately. The drainer
+    runs them with a small thread pool per upstream, retries transient failures with exponential
+    backoff (permanent ones, see `is_permanent`, fail at once), and records each result so callers
+    can poll `status(handle)`. Rows left "running" for `stale_after` seconds by a crashed drainer are
+reclaimed by whichever drainer is still alive; the claim counts as an attempt, so the rerun is
+treated as a retry and checks for an earlier write first.
+    An op may depend on an earlier op of its batch (`depends_on` = its index); it runs once that op
+    is done, with the result in op["dependency_result"], and fails without running if that op
+    failed. Each op carries its attempt number, idempotency key and first-queued time
+    (op["created_at"]) so the executor can check whether an earlier attempt already landed before
+    writing again.
+    """
+
+    def __init__(self, path, executor, max_attempts=5, concurrency=2, poll_interval=1.0, stale_after=300):
+        self.path = path
+        self.executor = executor
+        self.max_attempts = max_attempts
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self._local = threading.local()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._pools = {}
+        self._inflight = set()
+        self._inflight_lock = threading.Lock()
+        self._thread = None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS outbox ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, batch TEXT NOT NULL, seq INTEGER NOT NULL, "
+            "type TEXT NOT NULL, upstream TEXT NOT NULL, payload TEXT NOT NULL, idempotency_key TEXT UNIQUE, "
+            "status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, next_attempt_at REAL NOT NULL, "
+            "result TEXT, created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(outbox)")}
+        if "depends_on" not in columns:
+            conn.execute("ALTER TABLE outbox ADD COLUMN depends_on INTEGER")
+        conn.execute("CREATE INDEX IF NOT EXISTS outbox_due ON outbox(status, next_attempt_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS outbox_batch ON outbox(batch)")
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # --- Producer side ---
+    def enqueue(self, ops):
+        """Persists ops ([{"type", "upstream", "args", "depends_on"?}]) as one batch and returns its handle."""
+        batch = uuid.uuid4().hex[:12]
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for seq, op in enumerate(ops):
+                conn.execute(
+                    "INSERT INTO outbox (batch, seq, type, upstream, payload, idempotency_key, depends_on, status, "
+                    "next_attempt_at, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (batch, seq, op["type"], op["upstream"], json.dumps(op.get("args", {})),
+                     f"{batch}:{seq}", op.get("depends_on"), PENDING, now, now, now)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        logger.add(f"📨 Queued {len(ops)} write(s) as {batch}")
+        self._wake.set()
+        return batch
+
+    def status(self, handle):
+        """Returns {"state": pending|running|done|failed, "results": [...], "ops": [...]} for a batch."""
+        rows = self._conn().execute(
+            "SELECT seq, type, status, attempts, result FROM outbox WHERE batch = ? ORDER BY seq", (handle,)
+        ).fetchall()
+        if not rows:
+            return {"state": "unknown", "results": [], "ops": []}
+        statuses = {r[2] for r in rows}
+        if statuses <= {DONE}:
+            state = DONE
+        elif statuses <= {DONE, FAILED}:
+            state = FAILED
+        elif RUNNING in statuses or DONE in statuses:
+            state = RUNNING
+        else:
+            state = PENDING
+        return {
+            "state": state,
+            "results": [r[4] for r in rows if r[4]],
+            "ops": [{"seq": r[0], "type": r[1], "status": r[2], "attempts": r[3], "result": r[4]} for r in rows],
+        }
+
+    def wait(self, handle, timeout=60):
+        """Blocks until the batch is finished (or timeout) and returns its status."""
+        deadline = time.monotonic() + timeout
+        while True:
+            status = self.status(handle)
+            if status["state"] in (DONE, FAILED, "unknown") or time.monotonic() >= deadline:
+                return status
+            time.sleep(0.2)
+
+    # --- Drainer side ---
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, name="outbox-drainer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        for pool in self._pools.values():
+            pool.shutdown(wait=False)
+
+    def _pool(self, upstream):
+        if upstream not in self._pools:
+            self._pools[upstream] = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix=f"outbox-{upstream}")
+        return self._pools[upstream]
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.reclaim_stale()
+                self.drain_once()
+            except sqlite3.Error as e:
+                print(f"❌ Outbox drain error: {e}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def reclaim_stale(self):
+        """Puts ops that have been running for over `stale_after` seconds back in the queue.
+
+        Those belong to a drainer that died mid-write; ops still in flight here are left alone.
+        """
+        now = time.time()
+        with self._inflight_lock:
+            inflight = list(self._inflight)
+        placeholders = ", ".join("?" * len(inflight))
+        exclude = f" AND id NOT IN ({placeholders})" if inflight else ""
+        reclaimed = self._conn().execute(
+            f"UPDATE outbox SET status = ?, next_attempt_at = ?, updated_at = ? WHERE status = ? AND updated_at < ?{exclude}",
+            (PENDING, now, now, RUNNING, now - self.stale_after, *inflight)
+        ).rowcount
+        if reclaimed:
+            logger.add(f"♻️ Reclaimed {reclaimed} stale outbox write(s)")
+        return reclaimed
+
+    def drain_once(self):
+        """Claims every due op and submits it to its upstream's pool."""
+        conn = self._conn()
+        due = conn.execute(
+            "SELECT o.id, o.type, o.upstream, o.payload, o.attempts, o.idempotency_key, o.depends_on, o.created_at, "
+            "d.status, d.result "
+            "FROM outbox o LEFT JOIN outbox d ON d.batch = o.batch AND d.seq = o.depends_on "
+            "WHERE o.status = ? AND o.next_attempt_at <= ? ORDER BY o.id LIMIT 100", (PENDING, time.time())
+        ).fetchall()
+        for op_id, op_type, upstream, payload, attempts, key, depends_on, created_at, dep_status, dep_result in due:
+            with self._inflight_lock:
+                if op_id in self._inflight:
+                    continue
+            if depends_on is not None and dep_status != DONE:
+                if dep_status == FAILED:
+                    result = f"❌ {op_type} skipped: the write it depends on failed."
+                    conn.execute(
+                        "UPDATE outbox SET status = ?, result = ?, updated_at = ? WHERE id = ? AND status = ?",
+                        (FAILED, result, time.time(), op_id, PENDING)
+                    )
+                    logger.add(result)
+                continue
+            # Compare-and-set so two draining processes never run the same op. The claim counts the
+            # attempt up front, so a crash mid-write still makes the next run a retry.
+            claimed = conn.execute(
+                "UPDATE outbox SET status = ?, attempts = attempts + 1, updated_at = ? WHERE id = ? AND status = ?",
+                (RUNNING, time.time(), op_id, PENDING)
+            ).rowcount
+            if not claimed:
+                continue
+            with self._inflight_lock:
+                self._inflight.add(op_id)
+            op = {"type": op_type, "upstream": upstream, "args": json.loads(payload),
+                  "attempt": attempts + 1, "idempotency_key": key, "created_at": created_at,
+                  "depends_on": depends_on, "dependency_result": dep_result}
+            self._pool(upstream).submit(self._execute, op_id, op)
+        return len(due)
+
+    def _execute(self, op_id, op):
+        try:
+            try:
+                result = self.executor(op)
+                failed = result.startswith("❌")
+            except Exception as e:
+                result, failed = f"❌ {op['type']} crashed: {e}", True
+
+            conn = self._conn()
+            now = time.time()
+            permanent = failed and is_permanent(result)
+            if failed and not permanent and op["attempt"] < self.max_attempts:
+                backoff = min(2 ** op["attempt"], 300)
+                conn.execute(
+                    "UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, result = ?, updated_at = ? WHERE id = ?",
+                    (PENDING, op["attempt"], now + backoff, result, now, op_id)
+                )
+                logger.add(f"🔁 {op['type']} attempt {op['attempt']} failed, retrying in {backoff}s: {result}")
+            else:
+                conn.execute(
+                    "UPDATE outbox SET status = ?, attempts = ?, result = ?, updated_at = ? WHERE id = ?",
+                    (FAILED if failed else DONE, op["attempt"], result, now, op_id)
+                )
+                logger.add(f"⛔ {op['type']} failed permanently, not retrying: {result}" if permanent else result)
+        finally:
+            with self._inflight_lock:
+                self._inflight.discard(op_id)
+            self._wake.set()
+
+
+def create_outbox(executor):
+    return Outbox(
+        config.OUTBOX_PATH,
+        executor,
+        max_attempts=config.OUTBOX_MAX_ATTEMPTS,
+        concurrency=config.OUTBOX_CONCURRENCY,
+    )
@@ -3,13 +3,15 @@ import requests
 from datetime import datetime, timedelta
 from notion_client import Client as NotionClient
 from src.core.config import config
+from src.utils.tracing import span, traced
 
 logger = logging.getLogger(__name__)
 
 class ReportService:
     def __init__(self):
-        self.notion = NotionClient(auth=config.NOTION_TOKEN)
+        self.notion = NotionClient(auth=config.NOTION_TOKEN, base_url=config.NOTION_API_URL)
         self.db_id = config.NOTION_DATABASE_ID
+        self._source_id = None
         self.groq_key = config.GROQ_API_KEY
         self.ntfy_topic = config.NTFY_TOPIC
 
@@ -17,13 +19,21 @@ class ReportService:
         if not self.ntfy_topic:
             return
         try:
-            requests.post(f"https://ntfy.sh/{self.ntfy_topic}",
+            requests.post(f"{config.NTFY_URL}/{self.ntfy_topic}",
                 data=message.encode('utf-8'),
                 headers={"Title": title, "Priority": "high", "Tags": "robot,chart_with_upwards_trend"}
             )
         except Exception as e:
             logger.error(f"❌ Push error: {e}")
 
+    def _data_source_id(self):
+        """The log database's data source; since API version 2025-09-03 queries go to data sources."""
+        if self._source_id is None:
+            sources = self.notion.databases.retrieve(database_id=self.db_id).get("data_sources", [])
+            self._source_id = sources[0]["id"] if sources else self.db_id
+        return self._source_id
+
+    @traced("job.weekly_report")
     def generate_weekly_report(self):
         """Fetches last 7 days of logs and saves a summary to Notion."""
         logger.info("📊 Starting Weekly Report generation...")
@@ -35,10 +45,11 @@ class ReportService:
         try:
             # 1. Fetch logs from Notion
             seven_days_ago = (datetime.now() - timedelta(days=7)).isoformat()
-            query = self.notion.databases.query(
-                database_id=self.db_id,
-                filter={"property": "Date", "date": {"on_or_after": seven_days_ago}}
-            )
+            with span("notion.data_sources.query"):
+                query = self.notion.data_sources.query(
+                    data_source_id=self._data_source_id(),
+                    filter={"property": "Date", "date": {"on_or_after": seven_days_ago}}
+                )
             
             logs = []
             for page in query.get("results", []):
@@ -57,35 +68,37 @@ class ReportService:
             logger.info(f"🧠 Summarizing {len(logs)} logs using AI...")
             prompt = f"Analyze these work logs from the last 7 days and write a professional, high-level summary of the week's progress and focus areas:\n\n" + "\n".join(logs)
             
-            groq_res = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={"Authorization": f"Bearer {self.groq_key}", "Content-Type": "application/json"},
-                json={
-                    "model": "llama-3.3-70b-versatile",
-                    "messages": [
-                        {"role": "system", "content": "You are a senior project manager writing a weekly executive summary."},
-                        {"role": "user", "content": prompt}
-                    ]
-                }
-            )
+            with span("groq.chat_completions", logs=len(logs)):
+                groq_res = requests.post(
+                    f"{config.GROQ_API_BASE}/openai/v1/chat/completions",
+                    headers={"Authorization": f"Bearer {self.groq_key}", "Content-Type": "application/json"},
+                    json={
+                        "model": "llama-3.3-70b-versatile",
+                        "messages": [
+                            {"role": "system", "content": "You are a senior project manager writing a weekly executive summary."},
+                            {"role": "user", "content": prompt}
+                        ]
+                    }
+                )
             summary = groq_res.json()['choices'][0]['message']['content']
 
             # 3. Save Report back to Notion
-            self.notion.pages.create(
-                parent={"database_id": self.db_id},
-                properties={
-                    "Name": {"title": [{"text": {"content": f"📅 Weekly Report: {datetime.now().strftime('%b %d, %Y')}"}}]},
-                    "Category": {"select": {"name": "Reporting"}},
-                    "Date": {"date": {"start": datetime.now().strftime("%Y-%m-%d")}}
-                },
-                children=[
-                    {
-                        "object": "block",
-                        "type": "paragraph",
-                        "paragraph": {"rich_text": [{"type": "text", "text": {"content": summary}}]}
-                    }
-                ]
-            )
+            with span("notion.pages.create"):
+                self.notion.pages.create(
+                    parent={"database_id": self.db_id},
+                    properties={
+                        "Name": {"title": [{"text": {"content": f"📅 Weekly Report: {datetime.now().strftime('%b %d, %Y')}"}}]},
+                        "Category": {"select": {"name": "Reporting"}},
+                        "Date": {"date": {"start": datetime.now().strftime("%Y-%m-%d")}}
+                    },
+                    children=[
+                        {
+                            "object": "block",
+                            "type": "paragraph",
+                            "paragraph": {"rich_text": [{"type": "text", "text": {"content": summary}}]}
+                        }
+                    ]
+                )
             
             logger.info("✅ Weekly Report saved to Notion!")
             self._send_push_notification("Your Weekly Work Report has been generated and saved to Notion.", "Report Ready")
@@ -0,0 +1,211 @@
+import os
+import re
+import zlib
+import logging
+import threading
+import numpy as np
+from datetime import datetime, timedelta
+from src.core.config import config
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _jira_time(value):
+    """Parses a Jira timestamp ("2026-01-05T14:03:11.000+0100"), keeping its offset; None if unparseable."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+    except (TypeError, ValueError):
+        return None
+
+
+def _text_of(value):
+    """Flattens Jira descriptions, which are plain text (API v2) or Atlassian Document Format (v3)."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return " ".join(filter(None, [value.get("text", "")] + [_text_of(c) for c in value.get("content", [])]))
+    if isinstance(value, list):
+        return " ".join(_text_of(v) for v in value)
+    return str(value)
+
+
+class SimilarityIndex:
+    """TF-IDF over hashed word/bigram/char-trigram features, stored as a dense NumPy matrix.
+
+    Rows are log-scaled term frequencies; IDF weights and row norms are applied at query time,
+    so upserts only touch one row plus the document-frequency vector. Everything lives in a
+    local .npz file, so queries never touch the network.
+    """
+
+    def __init__(self, path, dim=512):
+        self.path = path
+        self.dim = dim
+        self.keys = []
+        self.rows = {}
+        self.matrix = np.zeros((0, dim), dtype=np.float32)
+        self.df = np.zeros(dim, dtype=np.int32)
+        self.watermark = None
+        self._norms = None
+        self._mtime = None
+        self._lock = threading.RLock()
+
+    # --- Features ---
+    def vectorize(self, text):
+        words = _WORD.findall(text.lower())
+        features = list(words)
+        features += [f"{a} {b}" for a, b in zip(words, words[1:])]
+        for word in words:
+            padded = f"#{word}#"
+            features += [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+        vec = np.zeros(self.dim, dtype=np.float32)
+        if features:
+            buckets = np.fromiter((zlib.crc32(f.encode()) % self.dim for f in features), dtype=np.int64, count=len(features))
+            np.add.at(vec, buckets, 1.0)
+            np.log1p(vec, out=vec)
+        return vec
+
+    def _idf(self):
+        n = len(self.keys)
+        return (np.log((n + 1) / (self.df + 1)) + 1).astype(np.float32)
+
+    # --- Mutation ---
+    def _ensure_capacity(self, n):
+        if n > self.matrix.shape[0]:
+            grown = np.zeros((max(n, self.matrix.shape[0] * 2, 64), self.dim), dtype=np.float32)
+            grown[:len(self.keys)] = self.matrix[:len(self.keys)]
+            self.matrix = grown
+
+    def upsert(self, key, text):
+        vec = self.vectorize(text)
+        with self._lock:
+            row = self.rows.get(key)
+            if row is None:
+                row = len(self.keys)
+                self._ensure_capacity(row + 1)
+                self.keys.append(key)
+                self.rows[key] = row
+            else:
+                self.df -= (self.matrix[row] > 0)
+            self.matrix[row] = vec
+            self.df += (vec > 0)
+            self._norms = None
+
+    def remove(self, key):
+        with self._lock:
+            row = self.rows.pop(key, None)
+            if row is None:
+                return
+            self.df -= (self.matrix[row] > 0)
+            last = len(self.keys) - 1
+            if row != last:
+                # Move the last row into the hole so the matrix stays dense
+                self.matrix[row] = self.matrix[last]
+                self.keys[row] = self.keys[last]
+                self.rows[self.keys[row]] = row
+            self.matrix[last] = 0
+            self.keys.pop()
+            self._norms = None
+
+    # --- Query ---
+    def query(self, text, k=5, exclude=()):
+        """Top-k (key, cosine score) pairs for the text, best first."""
+        with self._lock:
+            n = len(self.keys)
+            if n == 0:
+                return []
+            idf = self._idf()
+            matrix = self.matrix[:n]
+            if self._norms is None:
+                self._norms = np.sqrt((matrix * matrix) @ (idf * idf))
+                self._norms[self._norms == 0] = 1.0
+            q = self.vectorize(text) * idf
+            q_norm = float(np.linalg.norm(q))
+            if q_norm == 0:
+                return []
+            scores = (matrix @ (q * idf)) / (self._norms * q_norm)
+            fetch = min(k + len(exclude), n)
+            top = np.argpartition(-scores, fetch - 1)[:fetch]
+            top = top[np.argsort(-scores[top])]
+            results = [(self.keys[i], round(float(scores[i]), 4)) for i in top if self.keys[i] not in exclude]
+            return results[:k]
+
+    # --- Persistence ---
+    def save(self):
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp = f"{self.path}.tmp.npz"
+            np.savez_compressed(
+                tmp, keys=np.array(self.keys, dtype=str), matrix=self.matrix[:len(self.keys)],
+                df=self.df, watermark=np.array(self.watermark or "")
+            )
+            os.replace(tmp, self.path)
+            self._mtime = os.path.getmtime(self.path)
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return self
+        with self._lock:
+            data = np.load(self.path)
+            if data["matrix"].shape[1] != self.dim:
+                logger.warning(f"⚠️ Similarity index dimension changed ({data['matrix'].shape[1]} -> {self.dim}); rebuilding.")
+                return self
+            self.keys = [str(key) for key in data["keys"]]
+            self.rows = {key: i for i, key in enumerate(self.keys)}
+            self.matrix = np.array(data["matrix"], dtype=np.float32)
+            self.df = np.array(data["df"], dtype=np.int32)
+            self.watermark = str(data["watermark"]) or None
+            self._norms = None
+            self._mtime = os.path.getmtime(self.path)
+        return self
+
+    def reload_if_changed(self):
+        """Picks up a newer file written by another process (e.g. the worker's sync job)."""
+        if os.path.exists(self.path) and os.path.getmtime(self.path) != self._mtime:
+            self.load()
+
+    # --- Sync ---
+    def sync(self, jira, project_key):
+        """Incrementally applies issues updated since the last sync; done issues are dropped.
+
+        The watermark is the newest `updated` time Jira returned, not the local clock: Jira reports
+        timestamps in the API user's time zone, which is also the zone it reads JQL dates in.
+        """
+        if self.watermark:
+            jql = f'project = {project_key} AND updated >= "{self.watermark}" ORDER BY updated ASC'
+        else:
+            jql = f"project = {project_key} AND statusCategory != Done ORDER BY updated ASC"
+
+        issues = jira.search_issues(jql, fields=["summary", "description", "status", "updated"])
+        added = removed = 0
+        latest = None
+        for issue in issues:
+            fields = issue.get("fields") or {}
+            updated = _jira_time(fields.get("updated"))
+            if updated and (latest is None or updated > latest):
+                latest = updated
+            category = ((fields.get("status") or {}).get("statusCategory") or {}).get("key")
+            if category == "done":
+                self.remove(issue["key"])
+                removed += 1
+            else:
+                self.upsert(issue["key"], f"{fields.get('summary') or ''}\n{_text_of(fields.get('description'))}")
+                added += 1
+
+        if latest:
+            # Overlap by a few minutes; re-applying an issue is harmless. Never move the watermark back.
+            watermark = (latest - timedelta(minutes=5)).strftime("%Y/%m/%d %H:%M")
+            self.watermark = max(watermark, self.watermark or "")
+        self.save()
+        logger.info(f"🔎 Similarity index synced: {added} upserted, {removed} removed, {len(self.keys)} open issues indexed")
+        return added, removed
+
+
+def load_similarity_index():
+    return SimilarityIndex(config.SIMILARITY_INDEX_PATH, dim=config.SIMILARITY_DIM).load()
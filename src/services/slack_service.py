@@ -1,13 +1,17 @@
 import logging
 import requests
 from slack_bolt import App
+from slack_sdk import WebClient
 from src.core.config import config
+from src.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 class SlackResponderService:
-    def __init__(self):
-        self.app = App(token=config.SLACK_BOT_TOKEN)
+    def __init__(self, client=None, **app_options):
+        # app_options go to the Bolt App, e.g. listener_executor or process_before_response
+        self.app = App(client=client or WebClient(token=config.SLACK_BOT_TOKEN, base_url=config.SLACK_API_URL),
+                       **app_options)
         self.my_id = config.MY_SLACK_ID
         self.ntfy_topic = config.NTFY_TOPIC
         self._setup_handlers()
@@ -18,7 +22,7 @@ class SlackResponderService:
             return
         try:
             requests.post(
-                f"https://ntfy.sh/{self.ntfy_topic}",
+                f"{config.NTFY_URL}/{self.ntfy_topic}",
                 data=message.encode('utf-8'),
                 headers={"Title": title, "Priority": "high", "Tags": "robot,chart_with_upwards_trend"}
             )
@@ -27,6 +31,7 @@ class SlackResponderService:
 
     def _setup_handlers(self):
         @self.app.event("message")
+        @traced("job.slack_mention")
         def handle_message(body, client, say):
             event = body.get("event", {})
             text = event.get("text", "")
@@ -0,0 +1,221 @@
+import os
+import re
+import asyncio
+import logging
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from src.core.config import config
+from src.clients.jira import JiraSearchError
+from src.clients.jira_async import AsyncJiraClient
+from src.models.jira import IssueCollection, Sprint, parse_jira_date
+
+logger = logging.getLogger(__name__)
+
+# Column name -> dtype of the history file; one row per (team, sprint).
+# scope_* is the sprint's final scope (issues still in it when it closed, including ones added mid-sprint),
+# not what was committed at sprint start; that would need each issue's changelog.
+COLUMNS = {
+    "team": str,
+    "board_id": np.int64,
+    "sprint_id": np.int64,
+    "sprint_name": str,
+    "start": "datetime64[D]",
+    "end": "datetime64[D]",
+    "scope_points": np.float64,
+    "completed_points": np.float64,
+    "scope_issues": np.int32,
+    "completed_issues": np.int32,
+    "carried_over_issues": np.int32,
+    "throughput_per_day": np.float64,
+}
+
+# Files written before the scope_* rename
+RENAMED_COLUMNS = {"committed_points": "scope_points", "committed_issues": "scope_issues"}
+
+
+def _sprint_refs(value):
+    """(id, start date) of each sprint in an issue's sprint field: dicts on Cloud, "...[id=12,...]" strings on old servers."""
+    refs = []
+    for sprint in value or []:
+        if isinstance(sprint, dict):
+            refs.append((sprint.get("id"), parse_jira_date(sprint.get("startDate"))))
+        elif isinstance(sprint, str):
+            sprint_id = re.search(r"\bid=(\d+)", sprint)
+            start = re.search(r"\bstartDate=([0-9T:.\-]+)", sprint)
+            refs.append((int(sprint_id.group(1)) if sprint_id else None,
+                         parse_jira_date(start.group(1)) if start and start.group(1) != "<null>" else None))
+    return refs
+
+
+def carried_over_mask(raw_issues, sprint, sprint_field):
+    """True for issues that moved on to a later sprint, so their current status says nothing about this one."""
+    mask = []
+    for raw in raw_issues:
+        later = False
+        for sprint_id, start in _sprint_refs((raw.get("fields") or {}).get(sprint_field)):
+            if sprint_id is None or sprint_id == sprint.id:
+                continue
+            if start and sprint.start_date:
+                later = later or start > sprint.start_date
+            else:
+                # Sprint ids grow with creation order
+                later = later or sprint_id > sprint.id
+        mask.append(later)
+    return mask
+
+
+def summarize_sprint(payload):
+    """Per-sprint metrics from its raw issues. Runs in a worker process, so it takes and returns plain data.
+
+    `sprint = X` also returns issues that were carried over into later sprints, and an issue's status
+    is the current one; so an issue only counts as completed in the last sprint it was part of.
+    """
+    team, sprint_json, raw_issues = payload
+    sprint = Sprint.from_json(sprint_json)
+    issue_filter = team["filter"]
+    all_issues = IssueCollection.from_search(raw_issues, team["point_fields"])
+    keep = issue_filter.mask(all_issues)
+    issues = all_issues.take(keep)
+    carried = [c for c, k in zip(carried_over_mask(raw_issues, sprint, team["sprint_field"]), keep) if k]
+    done = [d and not c for d, c in zip(issue_filter.done_mask(issues), carried)]
+    completed_issues = issues.count(done)
+
+    start = sprint.start_date
+    end = sprint.end_date
+    days = max((end - start).days, 1) if start and end else 1
+    return {
+        "team": team["name"],
+        "board_id": int(team["board_id"]),
+        "sprint_id": int(sprint.id),
+        "sprint_name": sprint.name,
+        "start": np.datetime64(start, "D") if start else np.datetime64("NaT", "D"),
+        "end": np.datetime64(end, "D") if end else np.datetime64("NaT", "D"),
+        "scope_points": issues.total_points(),
+        "completed_points": issues.total_points(done),
+        "scope_issues": len(issues),
+        "completed_issues": completed_issues,
+        "carried_over_issues": issues.count(carried),
+        "throughput_per_day": completed_issues / days,
+    }
+
+
+class SprintHistory:
+    """Columnar per-sprint metrics in a NumPy .npz file; backfills append only the sprints not stored yet."""
+
+    def __init__(self, path):
+        self.path = path
+        self.columns = {name: np.array([], dtype=dtype) for name, dtype in COLUMNS.items()}
+
+    def __len__(self):
+        return len(self.columns["sprint_id"])
+
+    def load(self):
+        if os.path.exists(self.path):
+            with np.load(self.path) as data:
+                stored = {RENAMED_COLUMNS.get(name, name): data[name] for name in data.files}
+            rows = len(stored.get("sprint_id", []))
+            for name, dtype in COLUMNS.items():
+                if name in stored:
+                    self.columns[name] = stored[name].astype(dtype)
+                else:
+                    # Column added after the file was written
+                    self.columns[name] = np.zeros(rows, dtype=dtype)
+        return self
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{self.path}.tmp.npz"
+        np.savez_compressed(tmp, **self.columns)
+        os.replace(tmp, self.path)
+
+    def known_sprints(self, team_name):
+        mask = self.columns["team"] == team_name
+        return set(self.columns["sprint_id"][mask].tolist())
+
+    def append(self, rows):
+        """Adds rows; a row for a (team, sprint) that is already stored replaces the stored one."""
+        if not rows:
+            return
+        keys = {(row["team"], int(row["sprint_id"])) for row in rows}
+        stale = np.array([(team, int(sprint)) in keys for team, sprint in
+                          zip(self.columns["team"].tolist(), self.columns["sprint_id"].tolist())], dtype=bool)
+        if stale.any():
+            self.columns = {name: column[~stale] for name, column in self.columns.items()}
+        for name, dtype in COLUMNS.items():
+            added = np.array([row[name] for row in rows], dtype=dtype)
+            self.columns[name] = np.concatenate([self.columns[name], added])
+        # Keep rows ordered by team then sprint start so trends read top to bottom
+        order = np.lexsort((self.columns["start"], self.columns["team"]))
+        self.columns = {name: column[order] for name, column in self.columns.items()}
+
+    def for_team(self, team_name):
+        """Columns restricted to one team's sprints."""
+        mask = self.columns["team"] == team_name
+        return {name: column[mask] for name, column in self.columns.items()}
+
+
+class SprintBackfill:
+    """Pages through every closed sprint of each team's board and appends the missing ones to the history.
+
+    Sprint and issue fetches run concurrently on the async Jira client; the per-sprint aggregation is
+    handed to a process pool as each sprint's issues arrive. Sprints whose issues couldn't be fetched
+    are left out rather than stored as empty, so a later run picks them up. With `full`, every closed
+    sprint of the given teams is recomputed and replaces its stored row; other teams' rows are kept.
+    """
+
+    def __init__(self, teams, history, jira=None, workers=None, full=False):
+        self.teams = teams
+        self.history = history
+        self.full = full
+        self.jira = jira or AsyncJiraClient()
+        self.workers = workers or config.BACKFILL_WORKERS or os.cpu_count()
+
+    async def _team_rows(self, team, pool):
+        if not team.board_id:
+            logger.warning(f"⚠️ Team {team.name} has no board; skipping backfill.")
+            return []
+        sprints = await self.jira.get_all_sprints_from_board(team.board_id, state="closed")
+        known = set() if self.full else self.history.known_sprints(team.name)
+        todo = [s for s in team.sprint_filter().apply(sprints) if s.get("id") not in known]
+        logger.info(f"📚 {team.name}: {len(sprints)} closed sprints, {len(todo)} to compute")
+
+        issue_filter = team.velocity_filter()
+        spec = {"name": team.name, "board_id": team.board_id, "point_fields": team.point_fields,
+                "filter": issue_filter, "sprint_field": config.JIRA_SPRINT_FIELD}
+        fields = ["summary", "status", "assignee", config.JIRA_SPRINT_FIELD] + list(team.point_fields)
+        loop = asyncio.get_running_loop()
+
+        async def one(sprint):
+            base = f"sprint = {sprint['id']} AND project = {team.project_key}"
+            try:
+                try:
+                    raw = await self.jira.search_issues(issue_filter.jql(base), fields=fields)
+                except JiraSearchError:
+                    if not issue_filter.clauses():
+                        raise
+                    raw = await self.jira.search_issues(issue_filter.jql(base, pushdown=False), fields=fields)
+            except JiraSearchError as e:
+                # Not stored, so the next backfill tries this sprint again
+                logger.warning(f"⚠️ {team.name}: skipping sprint {sprint.get('name')}: {e}")
+                return None
+            return await loop.run_in_executor(pool, summarize_sprint, (spec, sprint, raw))
+
+        rows = await asyncio.gather(*(one(s) for s in todo))
+        return [row for row in rows if row is not None]
+
+    async def run_async(self):
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            try:
+                per_team = await asyncio.gather(*(self._team_rows(team, pool) for team in self.teams))
+            finally:
+                await self.jira.aclose()
+        rows = [row for team_rows in per_team for row in team_rows]
+        self.history.append(rows)
+        self.history.save()
+        logger.info(f"✅ Sprint history: {len(rows)} sprints written, {len(self.history)} stored in {self.history.path}")
+        return rows
+
+    def run(self):
+        return asyncio.run(self.run_async())
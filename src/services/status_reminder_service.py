@@ -2,24 +2,28 @@ import logging
 from datetime import datetime, timedelta
 from src.clients.jira import JiraClient
 from src.clients.slack import SlackClient
-from src.core.config import config
+from src.utils.tracing import traced
+from src.models.jira import IssueCollection, Sprint
+from src.core.teams import default_team
 
 logger = logging.getLogger(__name__)
 
 class StatusReminderService:
-    def __init__(self):
-        self.jira = JiraClient()
-        self.slack = SlackClient()
-        self.target_channel = "propone-backend-dev"
+    def __init__(self, team=None, jira=None, slack=None):
+        self.team = team or default_team()
+        self.jira = jira or JiraClient()
+        self.slack = slack or SlackClient()
+        self.target_channel = self.team.channel
 
+    @traced("job.check_and_send_reminders")
     def check_and_send_reminders(self):
         """Checks if today is 5 days after sprint start and sends reminders if so."""
-        board_id = config.JIRA_BOARD_ID
+        board_id = self.team.board_id
         if not board_id:
             logger.warning("⚠️ JIRA_BOARD_ID not set. Skipping status reminders.")
             return
 
-        active_sprint = self.jira.get_active_sprint(board_id)
+        active_sprint = self.jira.get_active_sprint(board_id, exclude_terms=self.team.sprint_name_excludes)
         if not active_sprint:
             logger.info("ℹ️ No active sprint found. Skipping reminders.")
             return
@@ -31,17 +35,13 @@ class StatusReminderService:
 
         # Jira date format usually '2023-10-23T09:00:00.000Z'
         try:
-            # Clean up the timezone part for simple parsing
-            clean_date = start_date_str.split('.')[0].replace('Z', '')
-            start_date = datetime.fromisoformat(clean_date).date()
+            sprint = Sprint.from_json(active_sprint)
+            start_date = sprint.start_date
             
             # Get end date as well
-            end_date_str = active_sprint.get("endDate")
             formatted_end_date = "Unknown"
-            if end_date_str:
-                clean_end = end_date_str.split('.')[0].replace('Z', '')
-                end_date = datetime.fromisoformat(clean_end).date()
-                formatted_end_date = end_date.strftime("%b %d, %Y")
+            if sprint.end_date:
+                formatted_end_date = sprint.end_date.strftime("%b %d, %Y")
 
             today = datetime.now().date()
             
@@ -57,50 +57,40 @@ class StatusReminderService:
         except Exception as e:
             logger.error(f"❌ Error processing sprint dates: {e}")
 
+    @traced("job.send_reminders")
     def _send_reminders(self, sprint_name, end_date):
-        logger.info(f"🔍 Fetching active backend tickets for sprint '{sprint_name}'...")
+        logger.info(f"🔍 Fetching active {self.team.label.lower()} tickets for sprint '{sprint_name}'...")
         
-        # JQL: Tickets in active sprint that ARE ONLY in BACKEND statuses and NOT frontend related
-        jql = (
-            f"sprint in openSprints() "
-            f"AND project = {config.JIRA_PROJECT_KEY} "
-            f"AND status IN ('BACKEND INPROGRESS', 'BACKEND TODO') "
-            f"AND assignee IS NOT EMPTY "
-            f"AND summary !~ 'FE' AND summary !~ 'Frontend'"
-        )
+        # Tickets in the active sprint that are in the team's statuses, assigned and NOT frontend related.
+        # Jira applies what JQL can express; the filter re-checks name/summary substrings locally.
+        # If Jira rejects the narrowed query (e.g. a status the board doesn't have), fetch without it.
+        issue_filter = self.team.reminder_filter()
+        base = f"sprint in openSprints() AND project = {self.team.project_key}"
+        fields = ["summary", "status", "assignee"]
+        raw = self.jira.search_issues(issue_filter.jql(base), fields=fields)
+        if not raw and issue_filter.clauses():
+            raw = self.jira.search_issues(issue_filter.jql(base, pushdown=False), fields=fields)
+        fetched = IssueCollection.from_search(raw)
         
-        issues = self.jira.search_issues(jql)
-        
-        if not issues:
+        if not fetched:
             logger.info("✅ No stale tickets found for reminder.")
             return
 
+        # Skips Taimoor (and any other excluded assignees) and FE/Frontend summaries
+        issues = issue_filter.apply(fetched)
+
         # Group by assignee
         reminders = {}
-        for issue in issues:
-            summary = issue['fields'].get('summary', '')
-            
-            # Extra safety check: skip if FE or Frontend is in the summary
-            if any(term in summary.upper() for term in ["FE ", " FE", "(FE)", "FRONTEND"]):
-                continue
-
-            assignee_name = issue['fields']['assignee']['displayName']
-            
-            # Skip Taimoor
-            if "Taimoor" in assignee_name:
-                continue
-                
-            key = issue['key']
-            if assignee_name not in reminders:
-                reminders[assignee_name] = []
-            reminders[assignee_name].append(f"• *{key}*: {summary}")
+        for assignee_name, assigned in issues.group_by_assignee().items():
+            reminders[assignee_name] = [f"• *{issue.key}*: {issue.summary}" for issue in assigned]
 
         if not reminders:
             logger.info("✅ No relevant tickets found after filtering (e.g., all tickets belong to Taimoor).")
             return
 
         # Construct Slack message
-        message = f"👋 *Active Sprint Status Update ({sprint_name})*\n\n🗓️ *Ends on*: {end_date}\n\nWe are 5 days into the sprint! Could you please provide a quick update on your active tasks in 'BACKEND TODO' and 'BACKEND INPROGRESS'?\n\n"
+        status_list = " and ".join(f"'{s}'" for s in self.team.reminder_statuses)
+        message = f"👋 *Active Sprint Status Update ({sprint_name})*\n\n🗓️ *Ends on*: {end_date}\n\nWe are 5 days into the sprint! Could you please provide a quick update on your active tasks in {status_list}?\n\n"
         
         for person_name, tasks in reminders.items():
             message += f"👤 *{person_name}*\n" + "\n".join(tasks) + "\n\n"
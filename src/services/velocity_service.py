@@ -2,38 +2,33 @@ import logging
 from datetime import datetime
 from src.clients.jira import JiraClient
 from src.clients.slack import SlackClient
-from src.core.config import config
+from src.utils.tracing import traced
+from src.models.jira import IssueCollection, Sprint, ISSUE_FIELDS
+from src.core.teams import default_team
+from src.services.burnup import create_burnup_store, render_burnup_text
 
 logger = logging.getLogger(__name__)
 
 class VelocityService:
-    def __init__(self):
-        self.jira = JiraClient()
-        self.slack = SlackClient()
-        self.target_channel = "propone-backend-dev"
+    def __init__(self, team=None, jira=None, slack=None, burnup=None):
+        self.team = team or default_team()
+        self.jira = jira or JiraClient()
+        self.slack = slack or SlackClient()
+        # Daily snapshots for burnup charts; written every time the forecast runs
+        self.burnup = burnup or create_burnup_store()
+        self.target_channel = self.team.channel
         # Story point fields identified
-        self.point_fields = ["customfield_10004", "customfield_11441"]
-
-    def _get_points(self, issue):
-        """Extract story points from an issue."""
-        fields = issue.get("fields", {})
-        for field in self.point_fields:
-            val = fields.get(field)
-            if val is not None:
-                try:
-                    return float(val)
-                except (ValueError, TypeError):
-                    continue
-        return 0.0
+        self.point_fields = self.team.point_fields
 
+    @traced("job.forecast_sprint")
     def forecast_sprint(self):
         """Analyzes the current sprint velocity and forecasts completion."""
-        board_id = config.JIRA_BOARD_ID
+        board_id = self.team.board_id
         if not board_id:
             logger.warning("⚠️ JIRA_BOARD_ID not set. Skipping velocity forecast.")
             return
 
-        active_sprint = self.jira.get_active_sprint(board_id)
+        active_sprint = self.jira.get_active_sprint(board_id, exclude_terms=self.team.sprint_name_excludes)
         if not active_sprint:
             logger.info("ℹ️ No active sprint found for velocity forecasting.")
             return
@@ -41,55 +36,54 @@ class VelocityService:
         sprint_name = active_sprint.get("name")
         sprint_id = active_sprint.get("id")
         
-        # Fetch all issues in the sprint
-        jql = f"sprint = {sprint_id} AND project = {config.JIRA_PROJECT_KEY}"
-        all_issues = self.jira.search_issues(jql)
+        # Fetch the sprint's issues; status exclusions are partial names, so they are applied locally below
+        issue_filter = self.team.velocity_filter()
+        base = f"sprint = {sprint_id} AND project = {self.team.project_key}"
+        fields = list(ISSUE_FIELDS) + [f for f in self.point_fields if f not in ISSUE_FIELDS]
+        raw = self.jira.search_issues(issue_filter.jql(base), fields=fields)
+        if not raw and issue_filter.clauses():
+            raw = self.jira.search_issues(issue_filter.jql(base, pushdown=False), fields=fields)
+        all_issues = IssueCollection.from_search(raw, self.point_fields)
         
         if not all_issues:
             logger.info(f"📭 No issues found in sprint {sprint_name}.")
             return
 
         # Backend-only logic: Exclude Product and Deprecated
-        backend_issues = []
-        for issue in all_issues:
-            status = issue['fields']['status']['name'].upper()
-            if "PRODUCT" not in status and "DEPRECATED" not in status:
-                backend_issues.append(issue)
+        backend_issues = issue_filter.apply(all_issues)
 
         if not backend_issues:
-            logger.info(f"📭 No backend issues identified in {sprint_name}.")
+            logger.info(f"📭 No {self.team.label.lower()} issues identified in {sprint_name}.")
             return
 
-        # Define Done States based on Workflow Image
-        # Now including 'BE PR REVIEW' and 'VERIFICATION' as completed work
-        done_states = ['DONE', 'BACKEND DONE', 'VERIFICATION', 'QA APPROVED', 'READY FOR LIVE', 'BE PR REVIEW']
-        
-        remaining_tasks = []
-        total_points = 0.0
-        completed_points = 0.0
-        
-        for issue in backend_issues:
-            points = self._get_points(issue)
-            total_points += points
-            status = issue['fields']['status']['name'].upper()
-            if status in done_states:
-                completed_points += points
-            else:
-                remaining_tasks.append(f"• *{issue['key']}*: {issue['fields'].get('summary', 'No summary')}")
+        # Done States (based on Workflow Image) come from the team's filter
+        done_mask = issue_filter.done_mask(backend_issues)
+        total_points = backend_issues.total_points()
+        completed_points = backend_issues.total_points(done_mask)
+        remaining_tasks = [
+            f"• *{key}*: {summary or 'No summary'}"
+            for key, summary, done in zip(backend_issues.keys, backend_issues.summaries, done_mask) if not done
+        ]
+
+        try:
+            self.burnup.record(
+                self.team.name, sprint_id, sprint_name, total_points, completed_points,
+                len(backend_issues), backend_issues.count(done_mask), backend_issues.count_by_status()
+            )
+        except Exception as e:
+            logger.error(f"❌ Burnup snapshot failed for {sprint_name}: {e}")
         
         using_ticket_count = False
         if total_points == 0:
             using_ticket_count = True
             total_points = float(len(backend_issues))
-            completed_points = float(sum(1 for i in backend_issues if i['fields']['status']['name'].upper() in done_states))
+            completed_points = float(backend_issues.count(done_mask))
 
         # Date calculations
         try:
-            start_date_str = active_sprint.get("startDate").split('.')[0].replace('Z', '')
-            end_date_str = active_sprint.get("endDate").split('.')[0].replace('Z', '')
-            
-            start_date = datetime.fromisoformat(start_date_str).date()
-            end_date = datetime.fromisoformat(end_date_str).date()
+            sprint = Sprint.from_json(active_sprint)
+            start_date = sprint.start_date
+            end_date = sprint.end_date
             today = datetime.now().date()
             
             total_duration = max((end_date - start_date).days, 1)
@@ -114,17 +108,22 @@ class VelocityService:
             elif required_velocity > current_velocity:
                 status_emoji = "🟡"
 
-            metric_name = "Backend Tickets" if using_ticket_count else "Backend Points"
+            label = self.team.label
+            metric_name = f"{label} Tickets" if using_ticket_count else f"{label} Points"
             
             # Construct Message
             message = (
-                f"{status_emoji} *Backend Velocity Forecast: {sprint_name}*\n\n"
+                f"{status_emoji} *{label} Velocity Forecast: {sprint_name}*\n\n"
                 f"📊 *Progress*: {completed_points:.0f} / {total_points:.0f} {metric_name} ({progress_pct:.0f}%)\n"
                 f"⏳ *Time*: {elapsed_days} days elapsed / {max(0, remaining_days)} days left\n\n"
                 f"🚀 *Current Velocity*: {current_velocity:.1f} {metric_name}/day\n"
                 f"🎯 *Required Velocity*: {required_velocity:.1f} {metric_name}/day\n\n"
             )
 
+            history = self.burnup.snapshots(self.team.name, sprint_id)
+            if len(history) > 1:
+                message += "*Burnup*:\n" + render_burnup_text(history[-10:], use_points=not using_ticket_count) + "\n\n"
+
             if remaining_tasks:
                 message += "*Remaining Tasks*:\n" + "\n".join(remaining_tasks[:10]) + "\n"
                 if len(remaining_tasks) > 10:
@@ -134,16 +133,16 @@ class VelocityService:
             if is_overdue and remaining_points > 0:
                 message += f"🚨 *Overdue Alert*: This sprint was scheduled to end on {end_date.strftime('%b %d')} but still has {remaining_points:.0f} tasks to finish!"
             elif status_emoji == "🔴":
-                message += "⚠️ *Risk Alert*: The backend team is falling behind. Consider moving tasks to the next sprint."
+                message += f"⚠️ *Risk Alert*: The {label.lower()} team is falling behind. Consider moving tasks to the next sprint."
             elif status_emoji == "🟡":
                 message += "⚖️ *Pace Warning*: Team needs to accelerate to hit the deadline."
             else:
-                message += "✅ *On Track*: Backend progress is looking solid!"
+                message += f"✅ *On Track*: {label} progress is looking solid!"
 
             # Only send the message if it's within 4 days of ending or overdue
             if remaining_days <= 4 or is_overdue:
                 self.slack.send_message(self.target_channel, message)
-                logger.info(f"✅ Backend Velocity forecast sent for {sprint_name} (Days left: {remaining_days})")
+                logger.info(f"✅ {label} Velocity forecast sent for {sprint_name} (Days left: {remaining_days})")
             else:
                 logger.info(f"ℹ️ Forecast skipped: {remaining_days} days left (Reminders start at 4 days left).")
 
@@ -1,20 +1,187 @@
+import os
+import sys
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
 from datetime import datetime
+from src.core.config import config
+
+
+class ActivityLog:
+    """Fixed-size ring buffer in a SQLite WAL database, shared by every process on the host.
+
+    Entries get a monotonically increasing sequence number and live in slot `seq % capacity`,
+    so appends overwrite the oldest entry in place and readers can ask for "everything after seq N".
+    """
+
+    def __init__(self, path, capacity=1000):
+        self.path = path
+        self.capacity = capacity
+        self._local = threading.local()
+        # A process forked from this one (e.g. by the job fork server) must not share its SQLite connections
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset_connections)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ring ("
+                "slot INTEGER PRIMARY KEY, seq INTEGER NOT NULL, ts REAL NOT NULL, source TEXT, msg TEXT)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ring_seq ON ring(seq)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (id INTEGER PRIMARY KEY CHECK (id = 0), seq INTEGER NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO meta (id, seq) VALUES (0, 0)")
+            # Capacity may have shrunk since the file was created
+            conn.execute("DELETE FROM ring WHERE slot >= ?", (capacity,))
+
+    def _reset_connections(self):
+        self._local = threading.local()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def append(self, msg, source=None, ts=None):
+        """Appends one entry and returns its sequence number."""
+        conn = self._conn()
+        ts = ts or time.time()
+        # BEGIN IMMEDIATE takes the write lock up front, so concurrent writers serialise cleanly
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            seq = conn.execute("UPDATE meta SET seq = seq + 1 WHERE id = 0 RETURNING seq").fetchone()[0]
+            conn.execute(
+                "INSERT OR REPLACE INTO ring (slot, seq, ts, source, msg) VALUES (?, ?, ?, ?, ?)",
+                (seq % self.capacity, seq, ts, source, msg)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return seq
+
+    def since(self, seq=0, limit=None):
+        """Returns (seq, ts, source, msg) tuples newer than `seq`, oldest first."""
+        if not limit:
+            return self._conn().execute(
+                "SELECT seq, ts, source, msg FROM ring WHERE seq > ? ORDER BY seq", (seq,)
+            ).fetchall()
+        # Only the newest `limit` entries, still returned oldest first
+        rows = self._conn().execute(
+            "SELECT seq, ts, source, msg FROM ring WHERE seq > ? ORDER BY seq DESC LIMIT ?", (seq, limit)
+        ).fetchall()
+        return rows[::-1]
+
+    def last_seq(self):
+        return self._conn().execute("SELECT seq FROM meta WHERE id = 0").fetchone()[0]
+
+    def last_seen(self, source):
+        """Timestamp of the newest entry written by `source`, or None."""
+        return self._conn().execute("SELECT MAX(ts) FROM ring WHERE source = ?", (source,)).fetchone()[0]
+
+
+class MemoryActivityLog:
+    """In-process fallback with the same API, used when the shared file cannot be opened."""
+
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self._entries = deque(maxlen=capacity)
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def append(self, msg, source=None, ts=None):
+        with self._lock:
+            self._seq += 1
+            self._entries.append((self._seq, ts or time.time(), source, msg))
+            return self._seq
+
+    def since(self, seq=0, limit=None):
+        entries = [e for e in list(self._entries) if e[0] > seq]
+        return entries[-limit:] if limit else entries
+
+    def last_seq(self):
+        return self._seq
+
+    def last_seen(self, source):
+        return max((e[1] for e in list(self._entries) if e[2] == source), default=None)
+
+
+def format_entry(entry):
+    _, ts, _, msg = entry
+    return f"[{datetime.fromtimestamp(ts).strftime('%H:%M:%S')}] {msg}"
+
 
 class GlobalLogger:
     _instance = None
-    
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance.logs = [f"[{datetime.now().strftime('%H:%M:%S')}] 🖥️ UI initialized"]
+            cls._instance.source = config.ACTIVITY_LOG_SOURCE or os.path.splitext(os.path.basename(sys.argv[0]))[0]
+            try:
+                cls._instance.store = ActivityLog(config.ACTIVITY_LOG_PATH, config.ACTIVITY_LOG_CAPACITY)
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ Shared activity log unavailable ({e}), falling back to in-memory logs.")
+                cls._instance.store = MemoryActivityLog(config.ACTIVITY_LOG_CAPACITY)
         return cls._instance
-    
-    def add(self, msg):
-        ts = datetime.now().strftime("%H:%M:%S")
-        self.logs.append(f"[{ts}] {msg}")
-        if len(self.logs) > 20:
-            self.logs.pop(0)
-        print(f"LOG: {msg}")
+
+    def add(self, msg, echo=True):
+        try:
+            self.store.append(msg, source=self.source)
+        except sqlite3.Error as e:
+            print(f"⚠️ Failed to write activity log: {e}")
+        if echo:
+            print(f"LOG: {msg}")
+
+    def since(self, seq=0, limit=None):
+        """Returns (seq, formatted line) pairs newer than `seq`, oldest first."""
+        return [(entry[0], format_entry(entry)) for entry in self.store.since(seq, limit)]
+
+    def last_seen(self, source):
+        """When `source` (e.g. "worker") last wrote to the log, as a timestamp, or None."""
+        try:
+            return self.store.last_seen(source)
+        except sqlite3.Error:
+            return None
+
+    @property
+    def logs(self):
+        """The latest 20 lines, oldest first."""
+        return [line for _, line in self.since(0, limit=20)]
+
+
+class ActivityLogHandler(logging.Handler):
+    """Forwards `logging` records into the shared activity log so the UI can show worker activity.
+
+    Only records from the app's own loggers (`loggers`, matched with their children) are kept, so
+    library chatter (httpx, apscheduler, slack_bolt) doesn't push worker activity out of the ring.
+    """
+
+    def __init__(self, level=logging.NOTSET, loggers=("src", "__main__")):
+        super().__init__(level)
+        self.loggers = tuple(loggers)
+
+    def filter(self, record):
+        if not any(record.name == name or record.name.startswith(name + ".") for name in self.loggers):
+            return False
+        return super().filter(record)
+
+    def emit(self, record):
+        try:
+            get_global_logger().add(record.getMessage(), echo=False)
+        except Exception:
+            self.handleError(record)
+
 
 _global_logger = None
 
@@ -24,5 +191,3 @@ def get_global_logger():
     if _global_logger is None:
         _global_logger = GlobalLogger()
     return _global_logger
-
-
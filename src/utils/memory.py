@@ -0,0 +1,100 @@
+import os
+import gc
+import time
+import resource
+import threading
+import tracemalloc
+
+
+def rss_bytes():
+    """Current resident set size of this process (peak RSS where /proc isn't available)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+# Groupings tracemalloc's Snapshot.compare_to accepts
+GROUP_BY = ("lineno", "filename", "traceback")
+
+
+def _mb(n):
+    return f"{n / (1024 * 1024):.1f} MB"
+
+
+class MemoryMonitor:
+    """RSS reporting and opt-in tracemalloc snapshot diffs for a long-running process.
+
+    `report()` returns a one-line summary of RSS and its change since start and since the last
+    report. With profiling started, `diff()` compares a fresh tracemalloc snapshot to the baseline
+    (the first snapshot, or the last one taken with reset=True) and lists the biggest growers.
+    """
+
+    def __init__(self):
+        self.started_rss = rss_bytes()
+        self.last_rss = self.started_rss
+        self.started_at = time.time()
+        self._baseline = None
+        self._lock = threading.Lock()
+
+    @property
+    def profiling(self):
+        return tracemalloc.is_tracing()
+
+    def start_profiling(self, frames=10):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        with self._lock:
+            self._baseline = self._snapshot()
+
+    @staticmethod
+    def _snapshot():
+        gc.collect()
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+
+    def report(self, update=True):
+        rss = rss_bytes()
+        hours = (time.time() - self.started_at) / 3600
+        line = (f"🧠 RSS {_mb(rss)} ({_mb(rss - self.started_rss)} since start {hours:.1f} h ago, "
+                f"{_mb(rss - self.last_rss)} since last report), {threading.active_count()} threads")
+        if self.profiling:
+            current, peak = tracemalloc.get_traced_memory()
+            line += f", traced {_mb(current)} (peak {_mb(peak)})"
+        if update:
+            self.last_rss = rss
+        return line
+
+    def diff(self, limit=25, group_by="lineno", reset=False):
+        """Text listing of the allocation sites that grew most since the baseline snapshot.
+
+        Raises ValueError for a `group_by` outside GROUP_BY or a `limit` below 1.
+        """
+        if group_by not in GROUP_BY:
+            raise ValueError(f"group must be one of {', '.join(GROUP_BY)}")
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+        if not self.profiling:
+            return "tracemalloc is off; start the worker with MEMORY_PROFILING=true."
+        snapshot = self._snapshot()
+        with self._lock:
+            baseline = self._baseline
+            if reset or baseline is None:
+                self._baseline = snapshot
+        lines = [self.report(update=False)]
+        if baseline is None:
+            lines.append("Baseline snapshot taken; request again later for a diff.")
+            return "\n".join(lines)
+        stats = snapshot.compare_to(baseline, group_by)
+        growth = sum(s.size_diff for s in stats)
+        lines.append(f"Traced growth since baseline: {_mb(growth)} across {len(stats)} {group_by} groups")
+        for stat in stats[:limit]:
+            lines.append(str(stat))
+        if reset:
+            lines.append("Baseline reset to this snapshot.")
+        return "\n".join(lines)
@@ -0,0 +1,195 @@
+import os
+import json
+import time
+import uuid
+import threading
+import inspect
+import functools
+import contextvars
+from src.core.config import config
+
+# The span currently open in this thread/task (None at the root)
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+class RotatingJsonlExporter:
+    """Appends finished spans to a JSONL file, rotating it once it grows past max_bytes."""
+
+    def __init__(self, path, max_bytes=10 * 1024 * 1024, backups=3):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+        self._file = None
+
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _rotate(self):
+        self._file.close()
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open()
+
+    def export(self, record):
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._open()
+            self._file.write(line)
+            self._file.flush()
+            if self._file.tell() >= self.max_bytes:
+                self._rotate()
+
+    def files(self):
+        """Returns the current file followed by its rotated backups, oldest last."""
+        paths = [self.path] + [f"{self.path}.{i}" for i in range(1, self.backups + 1)]
+        return [p for p in paths if os.path.exists(p)]
+
+
+class Span:
+    __slots__ = ("tracer", "name", "attrs", "trace_id", "span_id", "parent_id",
+                 "start", "_wall", "_cpu", "_token", "error")
+
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.error = None
+
+    def set(self, key, value):
+        self.attrs[key] = value
+
+    def __enter__(self):
+        parent = _current_span.get()
+        self.span_id = uuid.uuid4().hex[:16]
+        if parent is None:
+            self.trace_id = uuid.uuid4().hex
+            self.parent_id = None
+        else:
+            self.trace_id = parent.trace_id
+            self.parent_id = parent.span_id
+        self._token = _current_span.set(self)
+        self.start = time.time()
+        self._cpu = time.thread_time()
+        self._wall = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall_ms = (time.perf_counter() - self._wall) * 1000
+        cpu_ms = (time.thread_time() - self._cpu) * 1000
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        self.tracer.exporter.export({
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "wall_ms": round(wall_ms, 3),
+            "cpu_ms": round(cpu_ms, 3),
+            "thread": threading.current_thread().name,
+            "attrs": self.attrs,
+            "error": self.error,
+        })
+        return False
+
+
+class _NoopSpan:
+    """Shared stand-in returned while tracing is disabled."""
+
+    __slots__ = ()
+
+    def set(self, key, value):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    def __init__(self, enabled=False, path="traces/trace.jsonl", max_bytes=10 * 1024 * 1024, backups=3):
+        self.enabled = enabled
+        self.exporter = RotatingJsonlExporter(path, max_bytes=max_bytes, backups=backups)
+
+    def span(self, name, **attrs):
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(self, name, attrs)
+
+
+tracer = Tracer(
+    enabled=config.TRACE_ENABLED,
+    path=config.TRACE_FILE,
+    max_bytes=config.TRACE_MAX_BYTES,
+    backups=config.TRACE_BACKUPS,
+)
+
+
+def span(name, **attrs):
+    """Opens a tracing span: `with span("jira.transition", key=key): ...`."""
+    if not tracer.enabled:
+        return _NOOP_SPAN
+    return Span(tracer, name, attrs)
+
+
+def traced(name=None):
+    """Decorator that records every call of the wrapped function as a span."""
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not tracer.enabled:
+                    return await func(*args, **kwargs)
+                with Span(tracer, span_name, {}):
+                    return await func(*args, **kwargs)
+            async_wrapper.__traced__ = True
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with Span(tracer, span_name, {}):
+                return func(*args, **kwargs)
+        wrapper.__traced__ = True
+        return wrapper
+    return decorator
+
+
+def trace_methods(prefix):
+    """Class decorator that wraps every method defined on the class (including __init__) in a span."""
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if not callable(value) or getattr(value, "__traced__", False):
+                continue
+            if attr.startswith("__") and attr != "__init__":
+                continue
+            if isinstance(value, (staticmethod, classmethod, type)):
+                continue
+            setattr(cls, attr, traced(f"{prefix}.{attr}")(value))
+        return cls
+    return decorator
+
+
+def get_tracer():
+    """Get the process-wide tracer."""
+    return tracer
@@ -0,0 +1,17 @@
+import os
+import tempfile
+
+# Point every store at a scratch directory and blank the upstream credentials before src is
+# imported, so a developer's .env can't make the suite talk to real services.
+_scratch = tempfile.mkdtemp(prefix="tests-")
+os.environ.update({
+    "ACTIVITY_LOG_PATH": os.path.join(_scratch, "activity.db"),
+    "OUTBOX_PATH": os.path.join(_scratch, "outbox.db"),
+    "SIMILARITY_INDEX_PATH": os.path.join(_scratch, "similarity_index.npz"),
+    "SCHEDULER_DB_PATH": os.path.join(_scratch, "scheduler.db"),
+    "OUTBOX_ENABLED": "false",
+    "TRACE_ENABLED": "false",
+})
+for name in ("JIRA_URL", "JIRA_EMAIL", "JIRA_API_TOKEN", "JIRA_PROJECT_KEY", "SLACK_BOT_TOKEN",
+             "NOTION_TOKEN", "NOTION_DATABASE_ID", "GROQ_API_KEY"):
+    os.environ[name] = ""
@@ -0,0 +1,21 @@
+import logging
+import pytest
+from src.utils.logger import ActivityLogHandler
+
+
+def _record(name, level=logging.INFO):
+    return logging.LogRecord(name, level, __file__, 1, "message", None, None)
+
+
+@pytest.mark.parametrize("name, kept", [
+    ("src.services.velocity_service", True),
+    ("src", True),
+    ("__main__", True),
+    ("httpx", False),
+    ("apscheduler.scheduler", False),
+    ("slack_bolt.App", False),
+    ("srcfoo", False),
+])
+def test_handler_keeps_only_app_loggers(name, kept):
+    assert bool(ActivityLogHandler(level=logging.INFO).filter(_record(name))) is kept
+
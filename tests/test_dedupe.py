@@ -0,0 +1,59 @@
+import time
+import pytest
+from src.bench.fakes import FakeNotion, FakeSlack
+from src.clients.notion import NotionClientWrapper
+from src.clients.slack import SlackClient
+
+
+@pytest.fixture
+def fake_notion(monkeypatch):
+    fake = FakeNotion(log_count=3).start()
+    monkeypatch.setenv("NOTION_TOKEN", "secret_test")
+    monkeypatch.setenv("NOTION_DATABASE_ID", "db")
+    monkeypatch.setenv("NOTION_API_URL", fake.url)
+    yield fake
+    fake.stop()
+
+
+def test_notion_matches_retried_log_by_key(fake_notion):
+    notion = NotionClientWrapper()
+    assert notion.find_logged("batch:0") is None
+    assert notion.log_work("Development", "Fixed BE-1", dedupe_key="batch:0").startswith("✅")
+    notion.log_work("Development", "Fixed BE-2", dedupe_key="batch:1")
+    assert notion.find_logged("batch:0")
+    assert notion.find_logged("other:0") is None
+
+
+def test_notion_without_key_property_never_matches(fake_notion):
+    notion = NotionClientWrapper()
+    notion.key_property = "Missing"
+    notion.log_work("Development", "Fixed BE-1", dedupe_key="batch:0")
+    assert notion.find_logged("batch:0") is None
+
+
+@pytest.fixture
+def fake_slack(monkeypatch):
+    fake = FakeSlack().start()
+    monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+    monkeypatch.setenv("SLACK_API_URL", fake.url + "/api/")
+    monkeypatch.setenv("SLACK_RATE_LIMIT", "1000")
+    yield fake
+    fake.stop()
+
+
+@pytest.mark.parametrize("channel", ["Customer-feedback", "#Customer-feedback"])
+def test_slack_finds_post_in_channel_given_by_name(fake_slack, channel):
+    slack = SlackClient()
+    since = time.time() - 1
+    slack.send_message(channel, "Deployed", dedupe_key="batch:0")
+    assert slack.find_posted(channel, "batch:0", since)
+    assert slack.find_posted(channel, "batch:1", since) is None
+
+
+def test_slack_channel_ids_pass_through(fake_slack):
+    slack = SlackClient()
+    since = time.time() - 1
+    slack.send_message("backend", "Deployed", dedupe_key="batch:0")
+    channel = fake_slack.channels["backend"]
+    assert slack.channel_id(channel) == channel
+    assert slack.find_posted(channel, "batch:0", since)
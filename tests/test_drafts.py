@@ -0,0 +1,79 @@
+import json
+import pytest
+from src.agents.drafts import (
+    DraftError, JiraDraft, SlackDraft, NotionDraft, parse_draft, parse_drafts, draft_from_text, drafts_from_text,
+    render_drafts, check_structure
+)
+
+JIRA = {"platform": "jira", "issue_type": "bug", "summary": "Fix login",
+        "description": "**Description**\nUsers can't sign in."}
+SLACK = {"platform": "slack", "channel": "#backend", "message": "Filed the login bug."}
+NOTION = {"platform": "notion", "task_category": "Development", "description": "Worked on the login fix."}
+
+
+def test_parse_draft_inside_prose():
+    draft = parse_draft("Here you go:\n" + json.dumps(JIRA) + "\nAnything else?")
+    assert isinstance(draft, JiraDraft)
+    # Enum values are normalized to the schema's spelling
+    assert draft.issue_type == "Bug"
+
+
+@pytest.mark.parametrize("data, cls", [(JIRA, JiraDraft), (SLACK, SlackDraft), (NOTION, NotionDraft)])
+def test_each_platform_parses(data, cls):
+    assert isinstance(parse_draft(json.dumps(data)), cls)
+
+
+@pytest.mark.parametrize("reply, error", [
+    ("no json here", "no JSON object"),
+    ('{"platform": "jira", "summary": ', "no JSON object"),
+    ('{"platform": "jira", "summary": "x" "description": "y"}', "invalid JSON"),
+    (json.dumps({"platform": "email", "message": "hi"}), "'platform' must be one of"),
+    (json.dumps({"platform": "slack", "channel": "#backend"}), "missing required field 'message'"),
+    (json.dumps({"platform": "jira", "summary": "x", "description": "y", "issue_type": "Saga"}), "must be one of"),
+    (json.dumps({"platform": "slack", "channel": "#backend", "message": 3}), "must be a string"),
+])
+def test_parse_rejects_invalid_replies(reply, error):
+    with pytest.raises(DraftError, match=error):
+        parse_draft(reply)
+
+
+@pytest.mark.parametrize("data", [JIRA, SLACK, NOTION])
+def test_rendered_draft_parses_back(data):
+    draft = parse_draft(json.dumps(data))
+    assert draft_from_text(draft.render()).fields() == draft.fields()
+
+
+def test_free_text_is_not_a_rendered_draft():
+    assert draft_from_text("**Summary**: Fix login\n**Description**\nBroken") is None
+
+
+def test_parse_multi_destination_reply():
+    drafts = parse_drafts(json.dumps({"drafts": [JIRA, SLACK, NOTION]}))
+    assert [type(d) for d in drafts] == [JiraDraft, SlackDraft, NotionDraft]
+    assert [type(d) for d in parse_drafts(json.dumps(SLACK))] == [SlackDraft]
+
+
+def test_empty_multi_destination_reply():
+    with pytest.raises(DraftError, match="non-empty list"):
+        parse_drafts(json.dumps({"drafts": []}))
+
+
+def test_rendered_drafts_parse_back():
+    drafts = parse_drafts(json.dumps({"drafts": [JIRA, SLACK, NOTION]}))
+    again = drafts_from_text(render_drafts(drafts))
+    assert [d.fields() for d in again] == [d.fields() for d in drafts]
+    assert drafts_from_text("just some notes") == []
+
+
+def test_check_structure_accepts_good_drafts():
+    assert check_structure(parse_drafts(json.dumps({"drafts": [JIRA, SLACK]})), {"jira", "slack"}) is None
+
+
+@pytest.mark.parametrize("draft, expected, problem", [
+    (SLACK, {"jira"}, "expected drafts for jira"),
+    ({**SLACK, "channel": "the backend channel"}, None, "is not a channel"),
+    ({**JIRA, "description": "Users can't sign in."}, None, "no template sections"),
+    ({**NOTION, "description": "Login fix"}, None, "too short"),
+])
+def test_check_structure_problems(draft, expected, problem):
+    assert problem in check_structure(parse_drafts(json.dumps(draft)), expected)
@@ -0,0 +1,68 @@
+from src.core.filters import IssueFilter, SprintFilter
+from src.models.jira import IssueCollection
+
+
+def _issue(key, status, assignee="Alice Smith", summary="Backend change"):
+    return {"key": key, "fields": {"summary": summary, "status": {"name": status},
+                                   "assignee": {"displayName": assignee} if assignee else None}}
+
+
+ISSUES = IssueCollection.from_search([
+    _issue("BE-1", "Backend Todo"),
+    _issue("BE-2", "Backend Done"),
+    _issue("BE-3", "FE Review"),
+    _issue("BE-4", "Backend Todo", assignee=None),
+    _issue("BE-5", "Backend Todo", assignee="Bot Account"),
+    _issue("BE-6", "Backend Todo", summary="(FE) button colour"),
+])
+
+
+def test_no_clauses_without_pushdown():
+    f = IssueFilter(statuses=["Backend Todo"], require_assignee=True, summary_excludes=["(FE)"], pushdown=False)
+    assert f.clauses() == []
+    assert f.jql("sprint = 12") == "sprint = 12"
+
+
+def test_jql_fallback_drops_pushed_clauses():
+    f = IssueFilter(statuses=["Backend Todo"], require_assignee=True)
+    assert f.jql("sprint = 12") == 'sprint = 12 AND status IN ("BACKEND TODO") AND assignee IS NOT EMPTY'
+    assert f.jql("sprint = 12", pushdown=False) == "sprint = 12"
+
+
+def test_pushdown_clauses():
+    f = IssueFilter(statuses=["Backend Todo", "Backend Done"], excluded_status_terms=["FE"],
+                    require_assignee=True, summary_excludes=["(FE)", " fe"], pushdown=True)
+    assert f.clauses() == [
+        'status IN ("BACKEND DONE", "BACKEND TODO")',
+        "assignee IS NOT EMPTY",
+        'summary !~ "FE"',
+    ]
+
+
+def test_status_exclusions_stay_local():
+    f = IssueFilter(excluded_status_terms=["FE"], pushdown=True)
+    assert f.clauses() == []
+    assert f.apply(ISSUES).keys == ["BE-1", "BE-2", "BE-4", "BE-5", "BE-6"]
+
+
+def test_jql_parenthesizes_or_bases():
+    f = IssueFilter(require_assignee=True, pushdown=True)
+    assert f.jql("sprint = 1 OR sprint = 2") == "(sprint = 1 OR sprint = 2) AND assignee IS NOT EMPTY"
+
+
+def test_mask_combines_every_condition():
+    f = IssueFilter(statuses=["backend todo", "backend done"], excluded_assignees=["Bot"],
+                    summary_excludes=["(fe)"], require_assignee=True)
+    assert f.mask(ISSUES) == [True, True, False, False, False, False]
+    assert f.apply(ISSUES).keys == ["BE-1", "BE-2"]
+    assert all(f.matches(issue) == keep for issue, keep in zip(ISSUES, f.mask(ISSUES)))
+
+
+def test_done_mask():
+    f = IssueFilter(done_states=["Backend Done"])
+    assert f.done_mask(ISSUES) == [False, True, False, False, False, False]
+
+
+def test_sprint_filter_drops_excluded_names():
+    sprints = [{"name": "BE Sprint 10"}, {"name": "FE: Sprint 10"}, None]
+    assert SprintFilter(["fe:"]).apply(sprints) == [{"name": "BE Sprint 10"}]
@@ -0,0 +1,52 @@
+from src.models.jira import Issue, Sprint, IssueCollection, normalize_status, parse_jira_date
+
+
+def _raw(key, status, points=None, fallback=None, assignee=None):
+    return {"key": key, "fields": {"summary": key, "status": {"name": status},
+                                   "assignee": {"displayName": assignee} if assignee else None,
+                                   "customfield_10004": points, "customfield_11441": fallback}}
+
+
+def test_normalize_status_interns_upper_case():
+    assert normalize_status("In Progress") == "IN PROGRESS"
+    assert normalize_status("In Progress") is normalize_status("In Progress")
+    assert normalize_status(None) == ""
+
+
+def test_points_fall_back_to_the_next_field():
+    assert Issue.from_json(_raw("A-1", "Todo", points=3)).points == 3.0
+    assert Issue.from_json(_raw("A-2", "Todo", fallback="5")).points == 5.0
+    assert Issue.from_json(_raw("A-3", "Todo", points="n/a")).points == 0.0
+
+
+def test_sprint_dates():
+    sprint = Sprint.from_json({"id": 7, "name": "BE Sprint 7", "state": "active",
+                               "startDate": "2026-01-05T09:00:00.000Z", "endDate": None})
+    assert sprint.start_date == parse_jira_date("2026-01-05T23:59:59.000Z")
+    assert sprint.end_date is None
+
+
+def test_collection_columns_and_selection():
+    issues = IssueCollection.from_search([_raw("A-1", "Todo", 1), _raw("A-2", "Done", 2), _raw("A-3", "done", 3)])
+    assert len(issues) == 3 and issues
+    assert issues.statuses == ["TODO", "DONE", "DONE"]
+
+    done = issues.take(issues.status_mask(["Done"]))
+    assert done.keys == ["A-2", "A-3"]
+    assert list(done.points) == [2.0, 3.0]
+    assert [i.key for i in done] == ["A-2", "A-3"]
+    assert not IssueCollection()
+
+
+def test_collection_aggregates():
+    issues = IssueCollection.from_search([
+        _raw("A-1", "Todo", 1, assignee="Alice"), _raw("A-2", "Done", 2, assignee="Bob"),
+        _raw("A-3", "Done", 3, assignee="Alice"), _raw("A-4", "FE Review", 5),
+    ])
+    assert issues.total_points() == 11.0
+    assert issues.total_points(issues.status_mask(["done"])) == 5.0
+    assert issues.count(issues.status_contains_mask(["fe"])) == 1
+    assert issues.count_by_status() == {"TODO": 1, "DONE": 2, "FE REVIEW": 1}
+    assert issues.points_by_assignee() == {"Alice": 4.0, "Bob": 2.0, None: 5.0}
+    assert [i.key for i in issues.group_by_assignee()["Alice"]] == ["A-1", "A-3"]
+    assert issues.filter(lambda i: i.points > 2).keys == ["A-3", "A-4"]
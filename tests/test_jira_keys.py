@@ -0,0 +1,56 @@
+import pytest
+from src.services.jira_keys import KEY_PATTERN, JiraKeyResolver
+
+
+@pytest.mark.parametrize("text, keys", [
+    ("Fixed BE-12 and BE-7.", ["BE-12", "BE-7"]),
+    ("(see PROP-101)", ["PROP-101"]),
+    ("export as UTF-8", ["UTF-8"]),
+    ("xUTF-8 ISO-8601x", []),
+    ("version A1-1.2", []),
+    ("BE-0 is not an issue number", []),
+    ("be-12 lower case", []),
+])
+def test_key_pattern(text, keys):
+    assert [f"{p}-{n}" for p, n in KEY_PATTERN.findall(text)] == keys
+
+
+class StubJira:
+    project_key = "BE"
+
+    def __init__(self, projects=("BE", "OPS"), existing=("BE-1", "OPS-2")):
+        self.projects = projects
+        self.existing = existing
+        self.lookups = []
+
+    def get_project_keys(self):
+        return list(self.projects) if self.projects is not None else None
+
+    def existing_keys(self, keys):
+        self.lookups.append(list(keys))
+        return None if self.existing is None else {k for k in keys if k in self.existing}
+
+
+def test_resolve_drops_lookalikes_and_missing_issues():
+    jira = StubJira()
+    resolver = JiraKeyResolver(jira, project_ttl=60, cache_ttl=60, cache_size=10)
+    assert resolver.resolve("BE-1, BE-404, OPS-2 in UTF-8 / ISO-8601") == ["BE-1", "OPS-2"]
+    assert jira.lookups == [["BE-1", "BE-404", "OPS-2"]]
+
+
+def test_resolve_caches_verdicts():
+    jira = StubJira()
+    resolver = JiraKeyResolver(jira, project_ttl=60, cache_ttl=60, cache_size=10)
+    resolver.resolve("BE-1 BE-404")
+    assert resolver.resolve("BE-404 and BE-1 again") == ["BE-1"]
+    assert len(jira.lookups) == 1
+
+
+def test_unknown_projects_fall_back_to_the_configured_one():
+    resolver = JiraKeyResolver(StubJira(projects=None), project_ttl=60, cache_ttl=60, cache_size=10)
+    assert resolver.candidates("BE-1 OPS-2") == ["BE-1"]
+
+
+def test_keys_pass_through_when_jira_cant_be_asked():
+    resolver = JiraKeyResolver(StubJira(existing=None), project_ttl=60, cache_ttl=60, cache_size=10)
+    assert resolver.resolve("BE-1 BE-404") == ["BE-1", "BE-404"]
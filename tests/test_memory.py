@@ -0,0 +1,12 @@
+import pytest
+from src.utils.memory import MemoryMonitor
+
+
+@pytest.mark.parametrize("kwargs", [{"group_by": "module"}, {"limit": 0}])
+def test_diff_rejects_bad_arguments(kwargs):
+    with pytest.raises(ValueError):
+        MemoryMonitor().diff(**kwargs)
+
+
+def test_diff_without_profiling():
+    assert MemoryMonitor().diff(group_by="traceback").startswith("tracemalloc is off")
@@ -0,0 +1,81 @@
+import json
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from src.core.config import config
+from src.agents.models import ModelRouter, classify_intents
+from src.agents.jira_agent import JiraAgent
+
+SLACK_JSON = json.dumps({"platform": "slack", "channel": "#backend", "message": "Deploy finished."})
+SLACK_TEXT = "**Platform**: Slack\n**Channel**: #backend\n**Message**:\nDeploy finished."
+
+
+def _router(**kwargs):
+    return ModelRouter({"small": object(), "large": object()}, max_prompt_chars=200, enabled=True, **kwargs)
+
+
+@pytest.mark.parametrize("prompt, intents", [
+    ("tell #backend the deploy finished", {"slack"}),
+    ("log that I worked on the importer", {"notion"}),
+    ("create a bug for the login failure and ping #backend", {"jira", "slack"}),
+    ("what's the weather", set()),
+])
+def test_classify_intents(prompt, intents):
+    assert classify_intents(prompt) == intents
+
+
+def test_short_single_destination_requests_go_small():
+    assert _router().route("tell #backend the deploy finished") == ("small", {"slack"})
+
+
+@pytest.mark.parametrize("prompt, notes", [
+    ("create a bug for the login failure", None),
+    ("create a bug for the login failure and tell #backend", None),
+    ("tell #backend the deploy finished", "x" * 300),
+    ("hello there", None),
+])
+def test_other_requests_go_large(prompt, notes):
+    assert _router().route(prompt, notes)[0] == "large"
+
+
+def test_tiering_off_or_no_small_model():
+    assert ModelRouter({"small": object(), "large": object()}, enabled=False).route("tell #a hi")[0] == "large"
+    assert ModelRouter({"large": object()}, enabled=True).route("tell #a hi")[0] == "large"
+    with pytest.raises(ValueError):
+        ModelRouter({"small": object()})
+
+
+@pytest.fixture
+def agent_with(monkeypatch):
+    monkeypatch.setattr(config, "MODEL_TIERING", True)
+
+    def build(small, large, structured=True):
+        monkeypatch.setattr(config, "STRUCTURED_OUTPUT", structured)
+        return JiraAgent(models={"small": FakeListChatModel(responses=small),
+                                 "large": FakeListChatModel(responses=large)})
+    return build
+
+
+def test_valid_small_reply_is_not_escalated(agent_with):
+    agent = agent_with([SLACK_JSON], ["unused"])
+    assert "#backend" in agent.generate_ticket("tell #backend the deploy finished")
+    assert (agent.usage["small_calls"], agent.usage["large_calls"]) == (1, 0)
+
+
+def test_invalid_small_reply_escalates(agent_with):
+    agent = agent_with(['{"platform": "slack", "channel": "#backend"}'], [SLACK_JSON])
+    out = agent.generate_ticket("tell #backend the deploy finished")
+    assert "Deploy finished." in out
+    assert (agent.usage["small_calls"], agent.usage["large_calls"]) == (1, 1)
+
+
+def test_free_text_small_reply_missing_sections_escalates(agent_with):
+    agent = agent_with(["Sure, I'll let them know!"], [SLACK_TEXT], structured=False)
+    assert "**Channel**" in agent.generate_ticket("tell #backend the deploy finished")
+    assert (agent.usage["small_calls"], agent.usage["large_calls"]) == (1, 1)
+
+
+def test_unrepairable_structured_reply_falls_back_to_free_text(agent_with):
+    agent = agent_with([], ['{"platform": "jira"', '{"platform": "jira"', "**Summary**: Fix login"])
+    out = agent.generate_ticket("create a bug for the login failure")
+    assert out.startswith("**Summary**") and "{" not in out
+    assert agent.usage["large_calls"] == 3
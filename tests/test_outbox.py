@@ -0,0 +1,139 @@
+import pytest
+from src.services.outbox import Outbox, is_permanent, DONE, FAILED, PENDING
+
+
+def drain(outbox):
+    """One drain pass, waiting for the submitted ops to finish."""
+    outbox.drain_once()
+    for pool in outbox._pools.values():
+        pool.shutdown(wait=True)
+    outbox._pools.clear()
+
+
+@pytest.fixture
+def make_outbox(tmp_path):
+    def build(executor, max_attempts=3):
+        return Outbox(str(tmp_path / "outbox.db"), executor, max_attempts=max_attempts)
+    return build
+
+
+def _ops(*types, **extra):
+    return [{"type": t, "upstream": t, "args": {"n": i}, **extra.get(t, {})} for i, t in enumerate(types)]
+
+
+def test_successful_batch_is_done(make_outbox):
+    seen = []
+    outbox = make_outbox(lambda op: seen.append(op) or f"✅ {op['type']}")
+    handle = outbox.enqueue(_ops("create_issue", "send_slack"))
+    drain(outbox)
+    status = outbox.status(handle)
+    assert status["state"] == DONE
+    assert status["results"] == ["✅ create_issue", "✅ send_slack"]
+    assert [op["idempotency_key"] for op in seen] == [f"{handle}:0", f"{handle}:1"]
+    assert all(op["attempt"] == 1 and op["created_at"] for op in seen)
+
+
+def test_transient_failure_is_retried_later(make_outbox):
+    outbox = make_outbox(lambda op: "❌ Failed to send Slack message: timed out")
+    handle = outbox.enqueue(_ops("send_slack"))
+    drain(outbox)
+    op = outbox.status(handle)["ops"][0]
+    assert (op["status"], op["attempts"]) == (PENDING, 1)
+    # Backed off: not due yet
+    drain(outbox)
+    assert outbox.status(handle)["ops"][0]["attempts"] == 1
+
+
+def test_gives_up_after_max_attempts(make_outbox):
+    outbox = make_outbox(lambda op: "❌ timed out", max_attempts=2)
+    handle = outbox.enqueue(_ops("send_slack"))
+    for _ in range(2):
+        outbox._conn().execute("UPDATE outbox SET next_attempt_at = 0")
+        drain(outbox)
+    op = outbox.status(handle)["ops"][0]
+    assert (op["status"], op["attempts"]) == (FAILED, 2)
+
+
+def test_permanent_failure_is_not_retried(make_outbox):
+    outbox = make_outbox(lambda op: "❌ Notion credentials not configured.")
+    handle = outbox.enqueue(_ops("log_work"))
+    drain(outbox)
+    op = outbox.status(handle)["ops"][0]
+    assert (op["status"], op["attempts"]) == (FAILED, 1)
+
+
+def test_crash_counts_as_failure(make_outbox):
+    def explode(op):
+        raise RuntimeError("boom")
+    outbox = make_outbox(explode, max_attempts=1)
+    handle = outbox.enqueue(_ops("transition"))
+    drain(outbox)
+    assert outbox.status(handle)["results"] == ["❌ transition crashed: boom"]
+
+
+def test_dependent_op_gets_the_dependency_result(make_outbox):
+    seen = {}
+
+    def executor(op):
+        seen[op["type"]] = op
+        return "✅ Success! Ticket created: https://jira/browse/BE-7" if op["type"] == "create_issue" else "✅ sent"
+
+    outbox = make_outbox(executor)
+    handle = outbox.enqueue(_ops("create_issue", "send_slack", send_slack={"depends_on": 0}))
+    drain(outbox)
+    assert "send_slack" not in seen
+    drain(outbox)
+    assert seen["send_slack"]["dependency_result"].endswith("BE-7")
+    assert outbox.status(handle)["state"] == DONE
+
+
+def test_dependent_op_is_skipped_when_its_dependency_failed(make_outbox):
+    calls = []
+    outbox = make_outbox(lambda op: calls.append(op["type"]) or "❌ Jira credentials missing.")
+    handle = outbox.enqueue(_ops("create_issue", "send_slack", send_slack={"depends_on": 0}))
+    drain(outbox)
+    drain(outbox)
+    status = outbox.status(handle)
+    assert calls == ["create_issue"]
+    assert status["state"] == FAILED
+    assert "skipped" in status["ops"][1]["result"]
+
+
+def test_stale_running_op_is_retried(make_outbox):
+    seen = []
+    outbox = make_outbox(lambda op: seen.append(op["attempt"]) or "✅ sent")
+    handle = outbox.enqueue(_ops("send_slack"))
+    # A drainer claimed the op and died before recording a result
+    outbox._conn().execute("UPDATE outbox SET status = 'running', attempts = 1, updated_at = 0")
+    assert outbox.reclaim_stale() == 1
+    drain(outbox)
+    assert seen == [2]
+    assert outbox.status(handle)["state"] == DONE
+
+
+def test_reclaim_leaves_own_inflight_ops_alone(make_outbox):
+    outbox = make_outbox(lambda op: "✅")
+    handle = outbox.enqueue(_ops("send_slack", "log_work"))
+    outbox._conn().execute("UPDATE outbox SET status = 'running', updated_at = 0")
+    outbox._inflight.add(1)
+    assert outbox.reclaim_stale() == 1
+    assert [op["status"] for op in outbox.status(handle)["ops"]] == ["running", PENDING]
+
+
+def test_unknown_handle(make_outbox):
+    assert make_outbox(lambda op: "✅").status("nope")["state"] == "unknown"
+
+
+@pytest.mark.parametrize("result, permanent", [
+    ("❌ Slack bot token not configured.", True),
+    ("❌ Slack Error: Channel '#nope' not found. Ensure the bot is invited", True),
+    ("❌ Failed to send Slack message: ... {'ok': False, 'error': 'not_in_channel'}", True),
+    ("❌ Failed to log to Notion (validation_error): Category is not a property", True),
+    ("❌ Jira API Error: 404 - Issue does not exist", True),
+    ("❌ Unknown write operation: email", True),
+    ("❌ Jira API Error: 429 - Too many requests", False),
+    ("❌ Jira Transition Failed: 503 - unavailable", False),
+    ("❌ Failed to log to Notion: timed out", False),
+])
+def test_is_permanent(result, permanent):
+    assert is_permanent(result) is permanent
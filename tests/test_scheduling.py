@@ -0,0 +1,115 @@
+import time
+from datetime import datetime, timedelta
+import pytest
+from apscheduler.schedulers.background import BackgroundScheduler
+from src.core.leader import SqliteLeaseBackend, LeaderElector
+from src.core.scheduling import JobStore, JobTimeout, LeaderGatedJobs, run_isolated
+
+
+class StubElector:
+    holder = "test-host"
+
+    def __init__(self, leader=True):
+        self.is_leader = leader
+
+
+@pytest.fixture
+def jobs(tmp_path):
+    scheduler = BackgroundScheduler()
+    gated = LeaderGatedJobs(scheduler, JobStore(str(tmp_path / "jobs.db")), StubElector(), misfire_grace=60,
+                            catchup_hours=1)
+    runs = []
+    gated.add_cron_job("minutely", lambda: runs.append(time.time()), isolation="inline", minute="*")
+    return gated, runs
+
+
+def test_first_catch_up_only_seeds_history(jobs):
+    gated, runs = jobs
+    gated.catch_up()
+    assert runs == []
+    assert [row[3] for row in gated.store.recent_runs()] == ["seeded"]
+
+
+def test_catch_up_runs_the_missed_fire_time_once(jobs):
+    gated, runs = jobs
+    gated.store.claim("minutely", datetime.now().astimezone() - timedelta(hours=3), "old-host", status="ok")
+    gated.catch_up()
+    gated.catch_up()
+    assert len(runs) == 1
+    assert "ok" in [row[3] for row in gated.store.recent_runs()]
+
+
+def test_non_leaders_skip(jobs):
+    gated, runs = jobs
+    gated.elector.is_leader = False
+    gated.run("minutely")
+    assert runs == [] and gated.store.recent_runs() == []
+
+
+def test_failed_run_is_recorded(tmp_path):
+    def fail():
+        raise ValueError("upstream down")
+    gated = LeaderGatedJobs(BackgroundScheduler(), JobStore(str(tmp_path / "jobs.db")), StubElector(),
+                            misfire_grace=60, catchup_hours=1)
+    gated.add_cron_job("failing", fail, isolation="inline", minute="*")
+    with pytest.raises(ValueError):
+        gated.run("failing")
+    assert gated.store.recent_runs()[0][3] == "error: upstream down"
+
+
+def test_one_lease_holder_at_a_time(tmp_path):
+    backend = SqliteLeaseBackend(str(tmp_path / "lease.db"))
+    first, second = LeaderElector(backend, ttl=30), LeaderElector(backend, ttl=30)
+    first.tick()
+    second.tick()
+    assert (first.is_leader, second.is_leader) == (True, False)
+    first.stop()
+    second.tick()
+    assert second.is_leader
+
+
+def test_timeout_is_recorded(tmp_path):
+    gated = LeaderGatedJobs(BackgroundScheduler(), JobStore(str(tmp_path / "jobs.db")), StubElector(),
+                            misfire_grace=60, catchup_hours=1)
+    gated.add_cron_job("slow", lambda: time.sleep(2), timeout=0.1, isolation="thread", minute="*")
+    with pytest.raises(JobTimeout):
+        gated.run("slow")
+    assert gated.store.recent_runs()[0][3] == "timeout"
+
+
+def test_thread_isolation_times_out():
+    with pytest.raises(JobTimeout):
+        run_isolated("slow", lambda: time.sleep(2), timeout=0.1, isolation="thread")
+
+
+def test_thread_isolation_reraises_job_errors():
+    def fail():
+        raise ValueError("upstream down")
+    with pytest.raises(ValueError):
+        run_isolated("failing", fail, timeout=5, isolation="thread")
+
+
+def hang():
+    time.sleep(30)
+
+
+def fail():
+    raise ValueError("upstream down")
+
+
+def test_process_isolation_needs_an_importable_target():
+    with pytest.raises(TypeError):
+        run_isolated("lambda", lambda: None, timeout=1, isolation="process")
+    run_isolated("importable", "os:getpid", timeout=30, isolation="process")
+
+
+def test_process_isolation_kills_hung_jobs():
+    started = time.monotonic()
+    with pytest.raises(JobTimeout):
+        run_isolated("hung", "tests.test_scheduling:hang", timeout=1, isolation="process")
+    assert time.monotonic() - started < 10
+
+
+def test_process_isolation_reports_child_failures():
+    with pytest.raises(RuntimeError, match="ValueError: upstream down"):
+        run_isolated("failing", "tests.test_scheduling:fail", timeout=30, isolation="process")
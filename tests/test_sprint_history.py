@@ -0,0 +1,28 @@
+import numpy as np
+from src.services.sprint_history import SprintHistory
+
+
+def _row(team, sprint_id, completed=5.0):
+    return {"team": team, "board_id": 1, "sprint_id": sprint_id, "sprint_name": f"Sprint {sprint_id}",
+            "start": np.datetime64(f"2026-01-{sprint_id:02d}", "D"), "end": np.datetime64("NaT", "D"),
+            "scope_points": 10.0, "completed_points": completed, "scope_issues": 4, "completed_issues": 2,
+            "carried_over_issues": 0, "throughput_per_day": 0.2}
+
+
+def test_append_replaces_only_the_recomputed_rows(tmp_path):
+    path = str(tmp_path / "history.npz")
+    history = SprintHistory(path)
+    history.append([_row("backend", 1), _row("backend", 2), _row("mobile", 1)])
+    history.save()
+
+    # What `backfill.py --team backend --full` does: load, recompute backend's sprints, save
+    history = SprintHistory(path).load()
+    history.append([_row("backend", 1, completed=8.0)])
+    history.save()
+
+    stored = SprintHistory(path).load()
+    assert len(stored) == 3
+    assert stored.known_sprints("mobile") == {1}
+    backend = stored.for_team("backend")
+    assert backend["sprint_id"].tolist() == [1, 2]
+    assert backend["completed_points"].tolist() == [8.0, 5.0]
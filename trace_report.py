@@ -0,0 +1,105 @@
+import argparse
+import json
+from src.core.config import config
+from src.utils.tracing import RotatingJsonlExporter
+
+
+def load_spans(paths):
+    spans = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    spans.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A crash mid-write can leave a truncated final line
+                    continue
+    return spans
+
+
+def build_tree(spans):
+    """Folds spans into a tree keyed by call path (root -> child names), flame-graph style."""
+    by_id = {s["span_id"]: s for s in spans}
+    root = {"children": {}, "count": 0, "wall_ms": 0.0, "cpu_ms": 0.0, "self_ms": 0.0, "errors": 0}
+
+    child_wall = {}
+    for s in spans:
+        if s.get("parent_id") in by_id:
+            child_wall[s["parent_id"]] = child_wall.get(s["parent_id"], 0.0) + s["wall_ms"]
+
+    path_cache = {}
+
+    def path_of(s):
+        if s["span_id"] in path_cache:
+            return path_cache[s["span_id"]]
+        parent = by_id.get(s.get("parent_id"))
+        path = (path_of(parent) if parent else ()) + (s["name"],)
+        path_cache[s["span_id"]] = path
+        return path
+
+    for s in spans:
+        node = root
+        for name in path_of(s):
+            node = node["children"].setdefault(
+                name, {"children": {}, "count": 0, "wall_ms": 0.0, "cpu_ms": 0.0, "self_ms": 0.0, "errors": 0}
+            )
+        node["count"] += 1
+        node["wall_ms"] += s["wall_ms"]
+        node["cpu_ms"] += s["cpu_ms"]
+        node["self_ms"] += max(s["wall_ms"] - child_wall.get(s["span_id"], 0.0), 0.0)
+        if s.get("error"):
+            node["errors"] += 1
+    return root
+
+
+def print_tree(node, total_ms, min_ms, depth=0, width=30):
+    children = sorted(node["children"].items(), key=lambda kv: kv[1]["wall_ms"], reverse=True)
+    for name, child in children:
+        if child["wall_ms"] < min_ms:
+            continue
+        share = child["wall_ms"] / total_ms if total_ms else 0
+        bar = "█" * max(1, round(share * width))
+        errors = f"  ❌ {child['errors']}" if child["errors"] else ""
+        label = ("  " * depth + name)[:48]
+        print(
+            f"{label:<48} {child['count']:>6} {child['wall_ms']:>11.1f} {child['self_ms']:>11.1f} "
+            f"{child['cpu_ms']:>10.1f}  {bar}{errors}"
+        )
+        print_tree(child, total_ms, min_ms, depth + 1, width)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flame-style summary of recorded tracing spans.")
+    parser.add_argument("files", nargs="*", help="Trace files (defaults to TRACE_FILE and its rotations)")
+    parser.add_argument("--name", help="Only include traces whose root span has this name")
+    parser.add_argument("--min-ms", type=float, default=0.0, help="Hide nodes with less total wall time")
+    args = parser.parse_args()
+
+    paths = args.files or RotatingJsonlExporter(config.TRACE_FILE, backups=config.TRACE_BACKUPS).files()
+    if not paths:
+        print(f"📭 No trace files found at {config.TRACE_FILE}. Set TRACE_ENABLED=true to record spans.")
+        return
+
+    spans = load_spans(paths)
+    if args.name:
+        keep = {s["trace_id"] for s in spans if s.get("parent_id") is None and s["name"] == args.name}
+        spans = [s for s in spans if s["trace_id"] in keep]
+    if not spans:
+        print("📭 No spans recorded.")
+        return
+
+    tree = build_tree(spans)
+    total_ms = sum(child["wall_ms"] for child in tree["children"].values())
+    traces = len({s["trace_id"] for s in spans})
+
+    print(f"📊 {len(spans)} spans across {traces} traces ({total_ms / 1000:.2f}s wall at the roots)\n")
+    print(f"{'span':<48} {'calls':>6} {'wall ms':>11} {'self ms':>11} {'cpu ms':>10}")
+    print("-" * 100)
+    print_tree(tree, total_ms, args.min_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
 import streamlit as st
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from src.agents.jira_agent import JiraAgent
 from src.utils.logger import get_global_logger
 from src.core.config import config
+from src.services.burnup import create_burnup_store, burnup_chart_data
+from src.services.health import check_services, worker_status
 
 # Page configuration
 st.set_page_config(page_title="Jira Agent Dashboard", page_icon="🚀", layout="wide")
@@ -18,45 +22,149 @@ st.markdown("Automate your Jira tickets, Slack messages, and Notion work logs wi
 def get_agent():
     return JiraAgent()
 
+@st.cache_resource
+def get_burnup_store():
+    return create_burnup_store()
+
+@st.cache_resource
+def get_executor():
+    # Shared by every session: LLM calls and writes run here so script runs never wait on them
+    return ThreadPoolExecutor(max_workers=config.UI_WORKERS, thread_name_prefix="ui-job")
+
+@st.cache_resource(ttl=config.HEALTH_CACHE_SECONDS)
+def get_health_check(_agent):
+    """One live probe of the upstreams per HEALTH_CACHE_SECONDS, shared by every session."""
+    return get_executor().submit(check_services, _agent)
+
+@st.cache_resource
+def announce_ui():
+    logger.add("🖥️ UI initialized")
+
+announce_ui()
+
 if "agent" not in st.session_state:
     try:
         st.session_state.agent = get_agent()
     except Exception as e:
         st.error(f"Failed to initialize agent: {e}")
 
-# Sidebar
-with st.sidebar:
+# --- Background jobs ---
+# Generation and posting run on the executor; the session keeps the future and a fragment
+# polls it, so the page stays usable (and other sessions unaffected) while a job runs.
+def start_job(kind, label, func, *args, meta=None, **kwargs):
+    future = get_executor().submit(func, *args, **kwargs)
+    st.session_state.job = {"kind": kind, "label": label, "started": time.time(), "future": future, **(meta or {})}
+
+def finish_job():
+    """Moves a finished job's result into the session state. Returns True if one finished."""
+    job = st.session_state.get("job")
+    if not job or not job["future"].done():
+        return False
+    st.session_state.job = None
+    try:
+        result = job["future"].result()
+    except Exception as e:
+        st.session_state.flash = f"❌ {job['label']} failed: {e}"
+        return True
+    if job["kind"] == "post":
+        handle, message = result
+        if handle:
+            st.session_state.setdefault("pending_posts", []).append(handle)
+        st.session_state.flash = message
+    else:
+        st.session_state.current_version = result
+        if job["kind"] == "revise":
+            st.session_state.revision_notes.append(job["notes"])
+    return True
+
+def show_result(message):
+    if "❌" in message:
+        st.error(message)
+    elif "⚠️" in message:
+        st.warning(message)
+    else:
+        st.success(message)
+
+@st.fragment(run_every=config.UI_REFRESH_SECONDS)
+def job_status():
+    if finish_job():
+        st.rerun(scope="app")
+    job = st.session_state.get("job")
+    if job:
+        st.info(f"⏳ {job['label']}... ({time.time() - job['started']:.0f}s)")
+
+@st.fragment(run_every=config.UI_REFRESH_SECONDS)
+def post_statuses():
+    # Queued posts finish in the outbox; show their latest state
+    for handle in st.session_state.get("pending_posts", [])[-5:]:
+        status = st.session_state.agent.post_status(handle)
+        message = st.session_state.agent.combined_result(status)
+        if status["state"] == "failed":
+            st.error(f"{handle}: {message}")
+        elif status["state"] == "done":
+            st.success(f"{handle}: {message}")
+        else:
+            st.info(f"{handle}: {message}")
+
+@st.fragment(run_every=config.UI_REFRESH_SECONDS)
+def live_sidebar():
     st.header("Service Status")
-    st.write(f"**Jira:** {'✅' if config.JIRA_URL else '❌'}")
-    st.write(f"**Slack:** {'✅' if config.SLACK_BOT_TOKEN else '❌'}")
-    st.write(f"**Notion:** {'✅' if config.NOTION_TOKEN else '❌'}")
+    health = get_health_check(st.session_state.agent) if "agent" in st.session_state else None
+    if health is None or not health.done():
+        st.caption("⏳ Checking services...")
+    else:
+        for service in health.result():
+            icon = "✅" if service["ok"] else "❌"
+            st.write(f"**{service['name']}:** {icon} {service['latency_ms']:.0f} ms")
+            if not service["ok"]:
+                st.caption(service["message"])
     st.divider()
-    st.write(f"**Worker Status:** 🟢 Running")
+    ok, detail = worker_status()
+    st.write(f"**Worker Status:** {'🟢' if ok else '🟡'} {detail}")
     st.caption(f"Listening for: {config.MY_SLACK_ID}")
-    
-    if st.button("🔄 Refresh Logs"):
-        st.rerun()
 
     st.subheader("Live Activity Logs")
-    for log in reversed(logger.logs):
+    # Only fetch entries newer than the last one we've already shown
+    if "log_lines" not in st.session_state:
+        st.session_state.log_lines = logger.since(0, limit=50)
+    else:
+        last_seq = st.session_state.log_lines[-1][0] if st.session_state.log_lines else 0
+        st.session_state.log_lines = (st.session_state.log_lines + logger.since(last_seq))[-50:]
+    for _, log in reversed(st.session_state.log_lines):
         st.caption(log)
 
+# Sidebar
+with st.sidebar:
+    live_sidebar()
+
 # Main UI
 if "current_version" not in st.session_state:
     st.session_state.current_version = None
 if "original_prompt" not in st.session_state:
     st.session_state.original_prompt = None
+if "revision_notes" not in st.session_state:
+    st.session_state.revision_notes = []
+if "job" not in st.session_state:
+    st.session_state.job = None
+
+finish_job()
+busy = st.session_state.job is not None
 
 user_input = st.text_area("What would you like to do?", placeholder="e.g. Create a bug for login failure or Log my work...")
 
-if st.button("Generate", type="primary"):
+if st.button("Generate", type="primary", disabled=busy):
     if user_input:
-        with st.spinner("AI is thinking..."):
-            st.session_state.original_prompt = user_input
-            st.session_state.current_version = st.session_state.agent.generate_ticket(user_input)
+        st.session_state.original_prompt = user_input
+        st.session_state.revision_notes = []
+        start_job("generate", "AI is thinking", st.session_state.agent.generate_ticket, user_input)
+        busy = True
     else:
         st.warning("Please enter a prompt.")
 
+job_status()
+if "flash" in st.session_state:
+    show_result(st.session_state.pop("flash"))
+
 if st.session_state.current_version:
     st.divider()
     st.subheader("Generated Output")
@@ -66,26 +174,45 @@ if st.session_state.current_version:
     action_col1, action_col2, action_col3 = st.columns(3)
     
     with action_col1:
-        if st.button("🚀 Post to Platform"):
-            content = st.session_state.current_version
-            with st.spinner("Executing..."):
-                result = st.session_state.agent.post_content(content)
-                if "❌" in result:
-                    st.error(result)
-                elif "⚠️" in result:
-                    st.warning(result)
-                else:
-                    st.success(result)
+        force_post = st.checkbox("Create even if similar tickets exist")
+        if st.button("🚀 Post to Platform", disabled=busy):
+            start_job("post", "Executing", st.session_state.agent.submit_content,
+                      st.session_state.current_version, force=force_post)
+            st.rerun()
+        post_statuses()
 
     with action_col2:
         rev_notes = st.text_input("Revision Notes")
-        if st.button("🔄 Revise"):
+        if st.button("🔄 Revise", disabled=busy):
             if rev_notes:
-                st.session_state.current_version = st.session_state.agent.generate_ticket(st.session_state.original_prompt, st.session_state.current_version, rev_notes)
+                start_job("revise", "Revising", st.session_state.agent.generate_ticket,
+                          st.session_state.original_prompt, st.session_state.current_version, rev_notes,
+                          earlier_notes=list(st.session_state.revision_notes), meta={"notes": rev_notes})
                 st.rerun()
 
     with action_col3:
-        if st.button("🗑️ Clear"):
+        if st.button("🗑️ Clear", disabled=busy):
             st.session_state.current_version = None
             st.session_state.original_prompt = None
+            st.session_state.revision_notes = []
             st.rerun()
+
+# Sprint burnup from the worker's daily snapshots (local file, no Jira calls)
+st.divider()
+with st.expander("📈 Sprint Burnup"):
+    burnup = get_burnup_store()
+    recorded = burnup.sprints()
+    if not recorded:
+        st.info("No snapshots yet. The worker records one per active sprint with each morning's velocity forecast.")
+    else:
+        labels = [f"{team} · {name} ({first} → {last})" for team, _, name, first, last in recorded]
+        choice = st.selectbox("Sprint", range(len(recorded)), format_func=lambda i: labels[i])
+        team, sprint_id = recorded[choice][:2]
+        snapshots = burnup.snapshots(team, sprint_id)
+        latest = snapshots[-1]
+        m1, m2, m3 = st.columns(3)
+        m1.metric("Completed", f"{latest['completed_points']:.0f} / {latest['total_points']:.0f}")
+        m2.metric("Scope change", f"{latest['added_points']:+.0f}")
+        m3.metric("Issues done", f"{latest['completed_issues']} / {latest['total_issues']}")
+        st.line_chart(burnup_chart_data(snapshots), x="day", y=["Scope", "Completed"])
+        st.caption("Issues per status today: " + ", ".join(f"{k or 'None'}: {v}" for k, v in latest["status_counts"].items()))
@@ -3,15 +3,22 @@ import logging
 import threading
 import requests
 import time
+from functools import partial
+from datetime import datetime
+from urllib.parse import urlparse, parse_qs
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from src.core.config import config
 from src.services.slack_service import SlackResponderService
-from src.services.report_service import ReportService
-from src.services.status_reminder_service import StatusReminderService
-from src.services.velocity_service import VelocityService
+from src.clients.jira import JiraClient
+from src.services.similarity_index import load_similarity_index
+from src.utils.tracing import traced
+from src.utils.logger import ActivityLogHandler
+from src.core.leader import LeaderElector, create_lease_backend
+from src.core.scheduling import JobStore, LeaderGatedJobs, run_isolated
+from src.utils.memory import MemoryMonitor
 
 # Configure logging
 logging.basicConfig(
@@ -20,9 +27,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Mirror worker activity (this module and src.*, not library loggers) into the shared log shown in the UI sidebar
+_activity_handler = ActivityLogHandler(level=logging.INFO)
+logging.getLogger().addHandler(_activity_handler)
+
+memory = MemoryMonitor()
+
 # --- Health Check Server ---
 class HealthHandler(BaseHTTPRequestHandler):
     def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/debug/memory" and config.MEMORY_PROFILING:
+            # tracemalloc diff against the baseline; ?reset=1 moves the baseline, ?limit=N, ?group=lineno/filename/traceback
+            query = parse_qs(url.query)
+            try:
+                limit = query.get("limit", ["25"])[0]
+                if not limit.isdigit():
+                    raise ValueError("limit must be a positive integer")
+                body = memory.diff(limit=int(limit), group_by=query.get("group", ["lineno"])[0],
+                                   reset=query.get("reset", ["0"])[0] in ("1", "true"))
+                status = 200
+            except ValueError as e:
+                body, status = f"❌ {e}\n", 400
+            self.send_response(status)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.end_headers()
+            self.wfile.write(body.encode("utf-8"))
+            return
         self.send_response(200)
         self.end_headers()
         self.wfile.write(b"OK")
@@ -34,6 +65,7 @@ def run_health_server():
     logger.info(f"🏥 Health server starting on port {port}")
     HTTPServer(("0.0.0.0", port), HealthHandler).serve_forever()
 
+@traced("job.self_ping")
 def self_ping():
     """Pings the app itself to prevent Koyeb from sleeping."""
     if not config.KOYEB_APP_URL:
@@ -54,30 +86,59 @@ def main():
         logger.error("❌ Missing critical environment variables.")
         return
 
+    if config.MEMORY_PROFILING:
+        memory.start_profiling(config.TRACEMALLOC_FRAMES)
+        logger.info(f"🧠 tracemalloc on ({config.TRACEMALLOC_FRAMES} frames); diffs at /debug/memory")
+
     # 1. Start Health Server
     threading.Thread(target=run_health_server, daemon=True).start()
 
     # 2. Start Scheduler for Weekly Report
-    report_service = ReportService()
-    reminder_service = StatusReminderService()
-    velocity_service = VelocityService()
-    
     scheduler = BackgroundScheduler()
+
+    # Only the elected leader runs the jobs below; every replica still serves Slack events
+    job_store = JobStore(config.SCHEDULER_DB_PATH)
+    elector = LeaderElector(create_lease_backend(), ttl=config.LEADER_LEASE_TTL)
+    jobs = LeaderGatedJobs(scheduler, job_store, elector)
+    elector.on_elected = jobs.catch_up
+
+    # Each run happens in its own process (JOB_ISOLATION) that builds its own services and is killed
+    # after its timeout. Sprint jobs run for every team in the registry (TEAMS_FILE).
     # SCHEDULE: Friday at 5:00 PM (17:00)
-    scheduler.add_job(report_service.generate_weekly_report, 'cron', day_of_week='fri', hour=17, minute=0)
+    jobs.add_cron_job("weekly_report", "src.services.jobs:weekly_report", timeout=config.JOB_TIMEOUT,
+                      day_of_week='fri', hour=17, minute=0)
     
     # SCHEDULE: Daily at 9:30 AM for Velocity Forecast
-    scheduler.add_job(velocity_service.forecast_sprint, 'cron', hour=9, minute=30)
+    jobs.add_cron_job("velocity_forecast", "src.services.jobs:velocity_forecast", timeout=config.JOB_TIMEOUT,
+                      hour=9, minute=30)
     
     # SCHEDULE: Daily at 10:00 AM to check for sprint progress (Day 5)
-    scheduler.add_job(reminder_service.check_and_send_reminders, 'cron', hour=10, minute=0)
+    jobs.add_cron_job("sprint_reminders", "src.services.jobs:sprint_reminders", timeout=config.JOB_TIMEOUT,
+                      hour=10, minute=0)
     
-    # SCHEDULE: Every 10 minutes to keep Koyeb awake
+    # SCHEDULE: Keep the local duplicate-detection index in sync (every replica keeps its own copy)
+    if config.JIRA_PROJECT_KEY:
+        similarity_index = load_similarity_index()
+        # Updates this process's index, so it runs on a thread; a hung sync is abandoned before the next one
+        sync = partial(similarity_index.sync, JiraClient(), config.JIRA_PROJECT_KEY)
+        scheduler.add_job(
+            run_isolated, 'interval', args=["similarity_sync", sync],
+            kwargs={"timeout": config.SIMILARITY_SYNC_MINUTES * 60, "isolation": "thread"},
+            minutes=config.SIMILARITY_SYNC_MINUTES, next_run_time=datetime.now(), max_instances=1, coalesce=True
+        )
+
+    # SCHEDULE: Every 10 minutes to keep Koyeb awake (every replica pings itself)
     if config.KOYEB_APP_URL:
-        scheduler.add_job(self_ping, 'interval', minutes=10)
+        scheduler.add_job(self_ping, 'interval', minutes=10, max_instances=1, coalesce=True)
         logger.info(f"🛰️ Anti-sleep scheduled for {config.KOYEB_APP_URL}")
 
+    # SCHEDULE: Periodic RSS report so memory growth shows up in the activity log
+    if config.RSS_REPORT_MINUTES > 0:
+        scheduler.add_job(lambda: logger.info(memory.report()), 'interval', minutes=config.RSS_REPORT_MINUTES,
+                          id="rss_report", max_instances=1, coalesce=True)
+
     scheduler.start()
+    elector.start()
     logger.info("⏰ Scheduler started (Weekly Report: Fridays at 5 PM, Daily Sprint Check: 10 AM)")
 
     # 3. Start Slack Listener